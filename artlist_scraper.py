@@ -77,6 +77,7 @@ multiprocessing.freeze_support()
 from pathlib import Path
 import xml.etree.ElementTree as ET
 import sys, os, subprocess, traceback, re, random, shutil, base64, hashlib, hmac, ipaddress, socket, time
+import gzip
 import html as _html
 import secrets as _secrets
 
@@ -296,10 +297,20 @@ if __name__ == '__main__':
 # IMPORTS
 # ─────────────────────────────────────────────────────────────────────────────
 
-import json, sqlite3, asyncio, threading
+import json, sqlite3, asyncio, threading, contextlib, contextvars, functools
 from datetime import datetime, timedelta
 from urllib.parse import urlparse, urlunparse, parse_qs, urlencode, unquote, urljoin, quote
 
+from clip_walk import (
+    _NUMID_RE,
+    _clip_from_json,
+    _graphql_clip_root,
+    _json_loads,
+    _orjson,
+    _walk_graphql_body_for_clips,
+    _walk_graphql_pages_for_clips,
+    _walk_json_for_clips,
+)
 from connectors import (
     DEFAULT_PER_PAGE,
     MAX_PAGE_LIMIT,
@@ -432,6 +443,128 @@ def _safe_urlopen(req_or_url, timeout=15):
     return resp
 
 
+class _KeepAliveHTTP:
+    """Keep-alive HTTP(S) client for bulk fetches against a handful of hosts.
+
+    _safe_urlopen opens a new TCP+TLS connection per request; this keeps one
+    http.client connection per (thread, host) and reuses it. A URL is checked
+    with _validate_safe_url whenever its socket is about to (re)connect, and
+    redirect targets are checked the same way. When a system proxy is
+    configured every request goes through _safe_urlopen instead, so proxy
+    settings keep working.
+    """
+
+    _REDIRECTS = (301, 302, 303, 307, 308)
+    _MAX_REDIRECTS = 5
+
+    def __init__(self):
+        import urllib.request
+        self._use_urllib = bool(urllib.request.getproxies())
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # thread -> that thread's {(scheme, host, port): connection}, so close()
+        # reaches every socket and dead pool threads' sockets can be evicted
+        self._conns = {}
+
+    def request(self, method, url, headers=None, data=None, timeout=15, max_size=10_000_000):
+        """Return ``(status, headers, body)``; body is read up to ``max_size`` bytes.
+
+        Raises UnsafeUrlError for blocked URLs and OSError/HTTPException on
+        network failures, like _safe_urlopen.
+        """
+        if self._use_urllib:
+            return self._urllib_request(method, url, headers, data, timeout, max_size)
+        for _ in range(self._MAX_REDIRECTS + 1):
+            status, resp_headers, body = self._send(method, url, headers, data, timeout, max_size)
+            location = resp_headers.get('Location')
+            if status not in self._REDIRECTS or not location:
+                return status, resp_headers, body
+            if method not in ('GET', 'HEAD'):
+                if status in (307, 308):
+                    return status, resp_headers, body
+                method, data = 'GET', None  # urllib turns 301/302/303 POSTs into GETs
+            url = urljoin(url, location)
+        return status, resp_headers, body
+
+    def _send(self, method, url, headers, data, timeout, max_size):
+        import http.client
+        parsed = urlparse(url)
+        scheme = (parsed.scheme or '').lower()
+        key = (scheme, parsed.hostname, parsed.port)
+        conns = getattr(self._local, 'conns', None)
+        if conns is None:
+            conns = self._local.conns = {}
+            self._register_thread(conns)
+        path = parsed.path or '/'
+        if parsed.query:
+            path += '?' + parsed.query
+        for attempt in range(2):
+            conn = conns.get(key)
+            if conn is None or conn.sock is None:
+                _validate_safe_url(url)
+                if conn is None:
+                    cls = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+                    conn = conns[key] = cls(parsed.hostname, parsed.port, timeout=timeout)
+                reused = False
+            else:
+                if parsed.username or parsed.password:
+                    _validate_safe_url(url)  # raises for embedded credentials
+                reused = True
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            try:
+                conn.request(method, path, body=data, headers=headers or {})
+                resp = conn.getresponse()
+                body = resp.read(max_size)
+                if not resp.isclosed():
+                    conn.close()  # body was truncated; the socket can't be reused
+                return resp.status, resp.headers, body
+            except (http.client.RemoteDisconnected, ConnectionResetError,
+                    BrokenPipeError, http.client.CannotSendRequest):
+                conn.close()
+                # The server dropped an idle keep-alive socket; retry once fresh
+                if not reused or attempt:
+                    raise
+            except Exception:
+                conn.close()
+                raise
+
+    def _urllib_request(self, method, url, headers, data, timeout, max_size):
+        import urllib.request, urllib.error
+        req = urllib.request.Request(url, data=data, headers=dict(headers or {}), method=method)
+        try:
+            resp = _safe_urlopen(req, timeout=timeout)
+        except urllib.error.HTTPError as e:
+            return e.code, e.headers, b''
+        with resp:
+            return resp.status, resp.headers, resp.read(max_size)
+
+    def _register_thread(self, conns):
+        # A new thread's first request: evict connections left by threads that
+        # have exited (e.g. a finished executor's workers) before adding its own
+        with self._lock:
+            dead = [t for t in self._conns if not t.is_alive()]
+            stale = [self._conns.pop(t) for t in dead]
+            self._conns[threading.current_thread()] = conns
+        self._close_conns(stale)
+
+    @staticmethod
+    def _close_conns(conn_maps):
+        for conns in conn_maps:
+            for conn in list(conns.values()):
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+
+    def close(self):
+        with self._lock:
+            conn_maps, self._conns = list(self._conns.values()), {}
+            self._local = threading.local()  # threads re-register on next use
+        self._close_conns(conn_maps)
+
+
 def _safe_api_json_request(api_request):
     import urllib.request
 
@@ -1304,6 +1437,12 @@ class DB:
         self.conn.row_factory = sqlite3.Row
         self._lock = threading.Lock()
         self._fts_recovering = False
+        # hash(url) of crawled_pages rows with status='done'; loaded lazily by
+        # is_processed() and kept in step by mark_processed/mark_failed.
+        self._done_url_hashes = None
+        # .depth >0 while the current thread has a batch() scope open; that
+        # thread's per-row writers defer their commit, other threads don't
+        self._batch = threading.local()
         self._init()
 
     @staticmethod
@@ -1311,7 +1450,9 @@ class DB:
         """Convert sqlite3.Row objects to plain dicts for thread-safe passing."""
         if not rows:
             return rows
-        return [dict(zip(r.keys(), tuple(r))) for r in rows]
+        # Rows of one result set share their columns; read the names once
+        keys = rows[0].keys()
+        return [dict(zip(keys, r)) for r in rows]
 
     def _init(self):
         self.conn.execute("PRAGMA journal_mode=WAL")
@@ -1360,6 +1501,8 @@ class DB:
             CREATE INDEX IF NOT EXISTS idx_clips_creator    ON clips(creator);
             CREATE INDEX IF NOT EXISTS idx_clips_collection ON clips(collection);
             CREATE INDEX IF NOT EXISTS idx_queue_pri        ON crawl_queue(priority DESC, added_at ASC);
+            -- Lets m3u8_count() scan only rows that have a video URL
+            CREATE INDEX IF NOT EXISTS idx_clips_has_m3u8   ON clips(id) WHERE m3u8_url != '';
         """)
         # Add new columns if upgrading from older DB (safe to call repeatedly)
         for col, defn in [('local_path',  'TEXT DEFAULT ""'),
@@ -1518,6 +1661,28 @@ class DB:
         with self._lock:
             self.conn.commit()
 
+    def _commit(self):
+        """Commit unless this thread has a batch() scope open. Caller holds _lock."""
+        if not getattr(self._batch, 'depth', 0):
+            self.conn.commit()
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Group this thread's per-row writes (save_clip, update_metadata,
+        enqueue...) into one transaction. Nested scopes commit when the
+        outermost one exits."""
+        self._batch.depth = getattr(self._batch, 'depth', 0) + 1
+        try:
+            yield self
+        finally:
+            self._batch.depth -= 1
+            if not self._batch.depth:
+                with self._lock:
+                    try:
+                        self.conn.commit()
+                    except Exception as e:
+                        print(f"[DB WARN] batch commit failed: {e}")
+
     # ── Queue ──────────────────────────────────────────────────────────────
 
     def backup_to(self, backup_path):
@@ -1596,6 +1761,7 @@ class DB:
                 self.conn.commit()
                 source.backup(self.conn)
                 self.conn.commit()
+                self._done_url_hashes = None
         finally:
             source.close()
         self._init()
@@ -1606,10 +1772,24 @@ class DB:
                 self.conn.execute(
                     "INSERT OR IGNORE INTO crawl_queue(url,depth,priority,profile) VALUES(?,?,?,?)",
                     (url, depth, priority, profile))
-                self.conn.commit()
+                self._commit()
         except Exception as e:
             print(f"[DB WARN] enqueue failed for {url[:60]}: {e}")
 
+    def enqueue_many(self, rows):
+        """Queue (url, depth, priority, profile) tuples in one statement."""
+        rows = list(rows)
+        if not rows:
+            return
+        try:
+            with self._lock:
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO crawl_queue(url,depth,priority,profile) VALUES(?,?,?,?)",
+                    rows)
+                self._commit()
+        except Exception as e:
+            print(f"[DB WARN] enqueue_many failed for {len(rows)} urls: {e}")
+
     def dequeue(self, profile=None):
         with self._lock:
             if profile:
@@ -1629,9 +1809,24 @@ class DB:
             return self.execute("SELECT COUNT(*) FROM crawl_queue WHERE profile=?", (profile,)).fetchone()[0]
         return self.execute("SELECT COUNT(*) FROM crawl_queue").fetchone()[0]
 
+    def _load_done_url_hashes(self):
+        # Caller holds _lock
+        if self._done_url_hashes is None:
+            self._done_url_hashes = {
+                hash(row[0]) for row in self.conn.execute(
+                    "SELECT url FROM crawled_pages WHERE status='done'")
+            }
+        return self._done_url_hashes
+
     def is_processed(self, url):
-        return bool(self.execute(
-            "SELECT 1 FROM crawled_pages WHERE url=? AND status='done'", (url,)).fetchone())
+        with self._lock:
+            return hash(url) in self._load_done_url_hashes()
+
+    def is_processed_many(self, urls):
+        """Return the subset of ``urls`` already crawled, under one lock."""
+        with self._lock:
+            done = self._load_done_url_hashes()
+            return {u for u in urls if hash(u) in done}
 
     def mark_processed(self, url, depth=0):
         with self._lock:
@@ -1639,6 +1834,8 @@ class DB:
                 "INSERT OR REPLACE INTO crawled_pages(url,status,depth,crawled_at) VALUES(?,?,?,?)",
                 (url, 'done', depth, datetime.now().isoformat()))
             self.conn.commit()
+            if self._done_url_hashes is not None:
+                self._done_url_hashes.add(hash(url))
 
     def mark_failed(self, url, depth=0):
         with self._lock:
@@ -1646,78 +1843,102 @@ class DB:
                 "INSERT OR REPLACE INTO crawled_pages(url,status,depth,crawled_at) VALUES(?,?,?,?)",
                 (url, 'failed', depth, datetime.now().isoformat()))
             self.conn.commit()
+            if self._done_url_hashes is not None:
+                self._done_url_hashes.discard(hash(url))
+
+    def forget_processed(self, url):
+        with self._lock:
+            self.conn.execute("DELETE FROM crawled_pages WHERE url=?", (url,))
+            self.conn.commit()
+            if self._done_url_hashes is not None:
+                self._done_url_hashes.discard(hash(url))
 
     # ── Clips ──────────────────────────────────────────────────────────────
 
+    _CLIP_INSERT_COLUMNS = (
+        'clip_id','source_url','title','creator','collection','resolution',
+        'duration','frame_rate','camera','formats','tags','m3u8_url','thumbnail_url','source_site',
+        'license_name','license_url','attribution_required','attribution_text','terms_url','preview_status',
+        'embedded_title','embedded_creator','embedded_rights','embedded_license_url',
+        'embedded_terms_url','embedded_attribution_text','embedded_metadata_source','embedded_metadata_json')
+    _CLIP_INSERT_SQL = (
+        f"INSERT OR IGNORE INTO clips ({','.join(_CLIP_INSERT_COLUMNS)}) "
+        f"VALUES ({','.join('?' * len(_CLIP_INSERT_COLUMNS))})")
+    _FTS_INSERT_SQL = """
+        INSERT INTO clips_fts(rowid,title,creator,collection,tags,resolution,camera,duration)
+        VALUES (?,?,?,?,?,?,?,?)"""
+
+    @classmethod
+    def _clip_insert_row(cls, data):
+        return tuple(str(data.get(k, '') or '') for k in cls._CLIP_INSERT_COLUMNS)
+
+    def _fts_insert_failed(self, fts_err, what):
+        err_s = str(fts_err).lower()
+        if 'malformed' in err_s or 'corrupt' in err_s:
+            self._fts_recover()
+        else:
+            print(f"[DB WARN] FTS insert failed for {what}: {fts_err}")
+
     def save_clip(self, data: dict) -> bool:
         """Insert clip with full metadata. Returns True if new row."""
         data = _apply_source_provenance_defaults(data or {})
         try:
             with self._lock:
-                cur = self.conn.execute("""
-                    INSERT OR IGNORE INTO clips
-                    (clip_id,source_url,title,creator,collection,resolution,
-                     duration,frame_rate,camera,formats,tags,m3u8_url,thumbnail_url,source_site,
-                     license_name,license_url,attribution_required,attribution_text,terms_url,preview_status,
-                     embedded_title,embedded_creator,embedded_rights,embedded_license_url,
-                     embedded_terms_url,embedded_attribution_text,embedded_metadata_source,embedded_metadata_json)
-                    VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-                """, (
-                    str(data.get('clip_id','') or ''),
-                    str(data.get('source_url','') or ''),
-                    str(data.get('title','') or ''),
-                    str(data.get('creator','') or ''),
-                    str(data.get('collection','') or ''),
-                    str(data.get('resolution','') or ''),
-                    str(data.get('duration','') or ''),
-                    str(data.get('frame_rate','') or ''),
-                    str(data.get('camera','') or ''),
-                    str(data.get('formats','') or ''),
-                    str(data.get('tags','') or ''),
-                    str(data.get('m3u8_url','') or ''),
-                    str(data.get('thumbnail_url','') or ''),
-                    str(data.get('source_site','') or ''),
-                    str(data.get('license_name','') or ''),
-                    str(data.get('license_url','') or ''),
-                    str(data.get('attribution_required','') or ''),
-                    str(data.get('attribution_text','') or ''),
-                    str(data.get('terms_url','') or ''),
-                    str(data.get('preview_status','') or ''),
-                    str(data.get('embedded_title','') or ''),
-                    str(data.get('embedded_creator','') or ''),
-                    str(data.get('embedded_rights','') or ''),
-                    str(data.get('embedded_license_url','') or ''),
-                    str(data.get('embedded_terms_url','') or ''),
-                    str(data.get('embedded_attribution_text','') or ''),
-                    str(data.get('embedded_metadata_source','') or ''),
-                    str(data.get('embedded_metadata_json','') or ''),
-                ))
+                cur = self.conn.execute(self._CLIP_INSERT_SQL, self._clip_insert_row(data))
                 is_new = cur.rowcount > 0
-                self.conn.commit()
+                self._commit()
                 # FTS indexing — separate try so main insert succeeds even if FTS corrupted
                 if is_new:
                     rowid = cur.lastrowid
                     try:
-                        self.conn.execute("""
-                            INSERT INTO clips_fts(rowid,title,creator,collection,tags,resolution,camera,duration)
-                            VALUES (?,?,?,?,?,?,?,?)
-                        """, (rowid,
-                              data.get('title',''), data.get('creator',''),
-                              data.get('collection',''), data.get('tags',''),
-                              data.get('resolution',''), data.get('camera',''),
-                              data.get('duration','')))
-                        self.conn.commit()
+                        self.conn.execute(self._FTS_INSERT_SQL, (
+                            rowid,
+                            data.get('title',''), data.get('creator',''),
+                            data.get('collection',''), data.get('tags',''),
+                            data.get('resolution',''), data.get('camera',''),
+                            data.get('duration','')))
+                        self._commit()
                     except Exception as fts_err:
-                        err_s = str(fts_err).lower()
-                        if 'malformed' in err_s or 'corrupt' in err_s:
-                            self._fts_recover()
-                        else:
-                            print(f"[DB WARN] FTS insert failed for {data.get('clip_id','?')}: {fts_err}")
+                        self._fts_insert_failed(fts_err, data.get('clip_id','?'))
                 return is_new
         except Exception as e:
             print(f"[DB WARN] save_clip failed for {data.get('clip_id','?')}: {e}")
             return False
 
+    def save_clips(self, clips) -> set:
+        """save_clip for many records: one executemany plus one FTS statement.
+        Returns the clip_ids that were inserted as new rows."""
+        rows = {}
+        for data in clips:
+            row = self._clip_insert_row(_apply_source_provenance_defaults(data or {}))
+            if row[0]:
+                rows.setdefault(row[0], row)
+        if not rows:
+            return set()
+        ids = list(rows)
+        marks = ','.join('?' * len(ids))
+        try:
+            with self._lock:
+                existing = {r[0] for r in self.conn.execute(
+                    f"SELECT clip_id FROM clips WHERE clip_id IN ({marks})", ids)}
+                new_ids = [cid for cid in ids if cid not in existing]
+                self.conn.executemany(self._CLIP_INSERT_SQL, [rows[cid] for cid in new_ids])
+                self._commit()
+                if new_ids:
+                    try:
+                        self.conn.execute(f"""
+                            INSERT INTO clips_fts(rowid,title,creator,collection,tags,resolution,camera,duration)
+                            SELECT rowid,title,creator,collection,tags,resolution,camera,duration
+                            FROM clips WHERE clip_id IN ({','.join('?' * len(new_ids))})
+                        """, new_ids)
+                        self._commit()
+                    except Exception as fts_err:
+                        self._fts_insert_failed(fts_err, f"{len(new_ids)} clips")
+                return set(new_ids)
+        except Exception as e:
+            print(f"[DB WARN] save_clips failed for {len(rows)} clips: {e}")
+            return set()
+
     def update_m3u8(self, clip_id, m3u8_url):
         """Upgrade video URL if new one is higher quality than existing."""
         try:
@@ -1733,7 +1954,7 @@ class DB:
                     self.conn.execute(
                         "UPDATE clips SET m3u8_url=? WHERE clip_id=?",
                         (m3u8_url, clip_id))
-                    self.conn.commit()
+                    self._commit()
                     return 'set_new'
                 if existing == m3u8_url:
                     return 'same'
@@ -1745,18 +1966,18 @@ class DB:
                         "UPDATE clips SET m3u8_url=? WHERE clip_id=?",
                         (m3u8_url, clip_id))
                     # Also upgrade resolution/formats from the new URL
-                    res_m = re.search(r'(\d{3,4})_(\d{3,4})_(\d+)fps', m3u8_url)
+                    res_m = _RES_FPS_RE.search(m3u8_url)
                     if res_m:
                         w, h = res_m.group(1), res_m.group(2)
                         self.conn.execute(
                             "UPDATE clips SET resolution=?, frame_rate=? WHERE clip_id=?",
                             (f"{w}x{h}", res_m.group(3), clip_id))
-                    qual_m = re.search(r'-(uhd|hd|sd)_', m3u8_url, re.IGNORECASE)
+                    qual_m = _QUALITY_TAG_RE.search(m3u8_url)
                     if qual_m:
                         self.conn.execute(
                             "UPDATE clips SET formats=? WHERE clip_id=?",
                             (qual_m.group(1).upper(), clip_id))
-                    self.conn.commit()
+                    self._commit()
                     return 'upgraded'
                 return 'kept_existing'
         except Exception as e:
@@ -1769,7 +1990,7 @@ class DB:
         if not url:
             return 0
         # Parse resolution from filename pattern: WxH_FPSfps or W_H_FPSfps
-        m = re.search(r'(\d{3,4})_(\d{3,4})_(\d+)fps', url)
+        m = _RES_FPS_RE.search(url)
         if m:
             return max(int(m.group(1)), int(m.group(2)))
         # Fallback: quality tag
@@ -1827,7 +2048,7 @@ class DB:
         try:
             with self._lock:
                 self.conn.execute(f"UPDATE clips SET {', '.join(sets)} WHERE clip_id=?", vals)
-                self.conn.commit()
+                self._commit()
         except Exception as e:
             print(f"[DB WARN] update_metadata UPDATE failed for {clip_id}: {e}")
             return
@@ -1897,10 +2118,33 @@ class DB:
                         thumb_error_at='', thumb_source=''
                     WHERE clip_id=?
                 """, (thumb_path, clip_id))
-                self.conn.commit()
+                self._commit()
         except Exception as e:
             print(f"[DB WARN] update_thumb_path failed for {clip_id}: {e}")
 
+    def recorded_thumb_paths(self, after_rowid=0, limit=500):
+        """Next keyset chunk of (rowid, clip_id, thumb_path) for clips with a
+        recorded thumbnail, in rowid order after ``after_rowid``."""
+        with self._lock:
+            return self.conn.execute("""
+                SELECT rowid, clip_id, thumb_path FROM clips
+                WHERE thumb_path != '' AND rowid > ?
+                ORDER BY rowid LIMIT ?
+            """, (after_rowid, limit)).fetchall()
+
+    def clear_thumb_paths(self, clip_ids):
+        """Forget recorded thumbnails (e.g. deleted from disk) so they are fetched again."""
+        rows = [(str(cid),) for cid in clip_ids if cid]
+        if not rows:
+            return
+        try:
+            with self._lock:
+                self.conn.executemany(
+                    "UPDATE clips SET thumb_path='', thumb_status='' WHERE clip_id=?", rows)
+                self._commit()
+        except Exception as e:
+            print(f"[DB WARN] clear_thumb_paths failed for {len(rows)} clips: {e}")
+
     def mark_thumb_failure(self, clip_id, reason, source=''):
         if not clip_id:
             return
@@ -2562,6 +2806,7 @@ class DB:
                 """)
             except Exception as e:
                 print(f"[DB WARN] clear_all partial failure: {e}")
+            self._done_url_hashes = None
             # FTS: DROP+recreate is safest (handles corruption)
             try:
                 self.conn.execute("DROP TABLE IF EXISTS clips_fts")
@@ -2646,7 +2891,7 @@ class DB:
                 """, (row['id'], row['title'] or '', row['creator'] or '',
                       row['collection'] or '', all_tags,
                       row['resolution'] or '', row['camera'] or '', row['duration'] or ''))
-                self.conn.commit()
+                self._commit()
         except Exception as e:
             err = str(e).lower()
             if 'malformed' in err or 'corrupt' in err or 'fts' in err:
@@ -3102,6 +3347,151 @@ VIDEO_PATTERNS = {
 ALL_VIDEO_RE = re.compile(
     r'https?://[^\s"\'<>]+\.(?:m3u8|mp4|webm|mpd|m3u|mov)(?:\?[^\s"\'<>]*)?', re.IGNORECASE)
 
+
+# Optional: google-re2 scans page HTML in linear time (pip install google-re2)
+try:
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+def _json_dumps(obj):
+    """Compact UTF-8 JSON bytes for request payloads, via orjson when installed.
+    Values orjson cannot encode (non-str keys, huge ints) use the stdlib."""
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj)
+        except _orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+@functools.lru_cache(maxsize=32)
+def _lowercase_video_re(exts):
+    """Case-sensitive video URL pattern for text that is already lower-cased."""
+    return re.compile(rf'https?://[^\s"\'<>]+\.(?:{exts})(?:\?[^\s"\'<>]*)?')
+
+
+@functools.lru_cache(maxsize=32)
+def _re2_video_re(exts):
+    """RE2 build of SiteProfile.get_combined_video_re(), or None if RE2 rejects it."""
+    try:
+        return _re2.compile(rf'(?i)https?://[^\s"\'<>]+\.(?:{exts})(?:\?[^\s"\'<>]*)?')
+    except Exception:
+        return None
+
+
+# Crawl hot-path patterns — compiled once instead of per page / per JSON node
+# Video ID plus (when present) the resolution that follows it, in one search
+_VIDFILE_RES_RE  = re.compile(r'/video-files/(\d+)/(?:.*?(\d{3,4})_(\d{3,4})_(\d+)fps)?')
+_RES_FPS_RE      = re.compile(r'(\d{3,4})_(\d{3,4})_(\d+)fps')
+_CLIP_ID_RE      = re.compile(r'/(\d{4,})(?:/|$)')
+_TRAILING_ID_RE  = re.compile(r'/(\d{4,})/?$')
+_CLIP_SLUG_RE    = re.compile(r'/clip/([^/]+)/')
+_RES_PAIR_RE     = re.compile(r'(\d+)x(\d+)')
+_QUALITY_TAG_RE  = re.compile(r'-(uhd|hd|sd)_', re.IGNORECASE)
+# Sitemap patterns run over the raw response bytes; no decoded copy of a
+# multi-MB sitemap is ever built
+_SITEMAP_CLIP_LOC_RE  = re.compile(rb'<loc>(https?://artlist\.io/stock-footage/clip/[^<]+)</loc>')
+_SITEMAP_INDEX_LOC_RE = re.compile(rb'<loc>(https?://[^<]*sitemap[^<]*\.xml[^<]*)</loc>')
+_NEXT_DATA_RE    = re.compile(
+    r'<script\s+id="__NEXT_DATA__"\s+type="application/json"[^>]*>(.*?)</script>', re.DOTALL)
+_HLS_RES_RE      = re.compile(r'RESOLUTION=(\d{3,5})x(\d{3,5})')
+_HLS_FPS_RE      = re.compile(r'FRAME-RATE=([\d.]+)')
+_SLUG_RE         = re.compile(r'/(?:video|clip|stock-footage)/([^/]+?)(?:-\d+)?/?$')
+_PEXELS_SLUG_RE  = re.compile(r'/video/([^/]+)-\d+/?$')
+_PEXELS_AUTHOR_RE = re.compile(r'(?:Video|Photo)\s+by\s+(.+?)\s+on\s+Pexels', re.IGNORECASE)
+_DESC_AUTHOR_RE  = re.compile(r'by\s+(\w[\w\s.]+?)(?:\s+for\s+free|\s+on\s+|\s*$)', re.IGNORECASE)
+_TAG_SPLIT_RE    = re.compile(r'\n|  +')
+_HTTP_PREFIX_RE  = re.compile(r'^https?://')
+_GENERIC_H1_RE   = re.compile(
+    r'(The best free|Free stock|Download free|Search results|Browse)', re.IGNORECASE)
+_TITLE_SUFFIX_RE = re.compile(
+    r'\s*[|–-]\s*(Stock Footage|Artlist|Pexels|Pixabay|Storyblocks|Free).*$', re.IGNORECASE)
+_RES_NORM_RE     = re.compile(r'\s*[xX×]\s*')
+_FMT_RE          = re.compile(r'4K|2K|HD|SD|ProRes|MP4|MOV|RAW|WebM', re.IGNORECASE)
+
+
+def _sitemap_clips(body):
+    """Clip records for every Artlist clip <loc> in a sitemap body (bytes)."""
+    clips = []
+    for m in _SITEMAP_CLIP_LOC_RE.finditer(body):
+        curl = m.group(1).decode('utf-8', errors='replace')
+        cid_m = _TRAILING_ID_RE.search(curl)
+        if cid_m:
+            slug_m = _CLIP_SLUG_RE.search(curl)
+            clips.append({
+                'clip_id': cid_m.group(1),
+                'source_url': curl,
+                'title': slug_m.group(1).replace('-', ' ').title() if slug_m else '',
+                'source_site': 'Artlist',
+            })
+    return clips
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_video_url(url):
+    """(video id or '', (w, h, fps) or None, quality score) for a video URL.
+    One page's URL shows up in the HTML scan, the DOM scan, the interceptor
+    list and then _record_video_url, so the regex work is cached."""
+    m = _VIDFILE_RES_RE.search(url)
+    if m and m.group(2):
+        res = m.group(2, 3, 4)
+    else:
+        res_m = _RES_FPS_RE.search(url)
+        res = res_m.groups() if res_m else None
+    # Rank URLs of the same video: uhd > hd > sd; higher resolution wins
+    if res:
+        score = max(int(res[0]), int(res[1]))
+    elif 'uhd' in url:
+        score = 3000
+    elif '-hd_' in url:
+        score = 1500
+    elif '-sd_' in url:
+        score = 500
+    else:
+        score = 100
+    return (m.group(1) if m else ''), res, score
+
+# Fields every crawled clip record starts with; copy _EMPTY_META per item
+_META_KEYS = ('clip_id','source_url','title','creator','collection','resolution',
+              'duration','frame_rate','camera','formats','tags','thumbnail_url',
+              'm3u8_url','source_site')
+_EMPTY_META = dict.fromkeys(_META_KEYS, '')
+# Card fields copied into a clip record when present
+_CARD_META_FIELDS = ('title','creator','duration','thumbnail_url','source_url',
+                     'resolution','tags','collection','m3u8_url','frame_rate','camera','formats')
+
+# Request types whose responses may carry API/JSON data
+_API_RESOURCE_TYPES = frozenset(('xhr', 'fetch'))
+# http(s) URL -> netloc, path (with any ;params), query
+_URL_SPLIT_RE = re.compile(r'https?://([^/?#]*)([^?#]*)(?:\?([^#]*))?')
+
+
+def _split_url(url):
+    """(netloc, path, query) without building a urlparse() result for the
+    common http(s) case."""
+    m = _URL_SPLIT_RE.match(url)
+    if m:
+        return m.group(1), m.group(2), m.group(3) or ''
+    parsed = urlparse(url)  # data:, blob:, ...
+    return parsed.netloc, parsed.path, parsed.query
+
+# Keys whose presence marks a JSON node as a possible clip object
+_CATALOG_CLIP_ID_KEYS = frozenset(('id', 'clipId', 'clip_id'))
+# Raw-body prefilter: a catalog payload without one of those keys holding a
+# 4+ digit value cannot yield a clip, so it is not worth decoding.
+_CATALOG_CLIP_ID_HINT_RE = re.compile(rb'"(?:id|clipId|clip_id)"\s*:\s*"?\d{4}')
+# Same prefilter for _walk_json_for_clips, which also takes asset ids
+_WALK_CLIP_ID_HINT_RE = re.compile(rb'"(?:id|clipId|clip_id|assetId|asset_id)"\s*:\s*"?\d{4}')
+
+# Telemetry endpoints that answer with JSON but never carry catalog data
+_NON_CLIP_ENDPOINT_RE = re.compile(r'/(?:analytics|beacon|csp|sentry|track)', re.I)
+# Catalog API bodies outside this byte range are skipped
+_CATALOG_BODY_MIN, _CATALOG_BODY_MAX = 50, 5_000_000
+# Direct-scrape bootstrap and GraphQL bodies this large are decoded and walked
+# in a worker process
+_WALK_OFFLOAD_MIN = 256 * 1024
+
 # Common exclude patterns shared by most profiles
 _COMMON_EXCLUDES = [
     '/login', '/register', '/signup', '/pricing', '/account', '/blog',
@@ -3161,19 +3551,36 @@ class SiteProfile:
         self.catalog_card_js    = kw.get('catalog_card_js', '')
         for field in PROVENANCE_FIELDS:
             setattr(self, field, kw.get(field, ''))
+        self._metadata_re_cache = (None, ())
+        # Crawl queues repeat the same hosts/links constantly; memoize the
+        # linear pattern scans per profile instance.
+        self._allowed_domain_cached = functools.lru_cache(maxsize=4096)(self._match_allowed_domain)
+        self._excluded_cached = functools.lru_cache(maxsize=16384)(self._match_excluded)
+        self._catalog_cached = functools.lru_cache(maxsize=16384)(self._match_catalog)
+        self._item_cached = functools.lru_cache(maxsize=16384)(self._match_item)
+        self._normalized_cached = functools.lru_cache(maxsize=16384)(self._normalize)
 
     def is_allowed_domain(self, domain):
         if not self.domains:
             return True
+        return self._allowed_domain_cached(domain)
+
+    def _match_allowed_domain(self, domain):
         return any(d in domain for d in self.domains)
 
     def is_catalog(self, url):
         if not self.catalog_patterns:
             return False
+        return self._catalog_cached(url)
+
+    def _match_catalog(self, url):
         return any(p in url for p in self.catalog_patterns)
 
     def is_item(self, url):
         """Check if URL is an individual item (clip/video/photo) page."""
+        return self._item_cached(url)
+
+    def _match_item(self, url):
         path = urlparse(url).path.rstrip('/')
         # If we have a regex, use it
         if self.item_url_regex:
@@ -3189,9 +3596,15 @@ class SiteProfile:
         return False
 
     def is_excluded(self, url):
+        return self._excluded_cached(url)
+
+    def _match_excluded(self, url):
         return any(p in url for p in self.exclude_patterns)
 
     def normalize_url(self, url):
+        return self._normalized_cached(url)
+
+    def _normalize(self, url):
         try:
             u = urlparse(url)
             if not self.is_allowed_domain(u.netloc):
@@ -3212,6 +3625,45 @@ class SiteProfile:
         return re.compile(
             rf'https?://[^\s"\'<>]+\.(?:{exts})(?:\?[^\s"\'<>]*)?', re.IGNORECASE)
 
+    def find_video_urls(self, text):
+        """Same result as get_combined_video_re().findall(text), but faster on
+        large pages.
+
+        IGNORECASE stops re from jumping between literal 'http' prefixes, so
+        a case-sensitive twin runs over text.lower() instead and the matches
+        are sliced from the original. When lowering changes the length (rare
+        non-ASCII case mappings), the spans would not line up, so the plain
+        pattern is used. With google-re2 installed, its linear-time engine
+        handles case-insensitivity itself and no copy is made.
+        """
+        exts = '|'.join(self.video_types).lower()
+        if _re2 is not None:
+            engine = _re2_video_re(exts)
+            if engine is not None:
+                return engine.findall(text)
+        folded = text.lower()
+        if len(folded) != len(text):
+            return self.get_combined_video_re().findall(text)
+        return [text[m.start():m.end()] for m in _lowercase_video_re(exts).finditer(folded)]
+
+    def get_metadata_regexes(self):
+        """Return [(field, compiled_regex)] for metadata_selectors, compiled once.
+
+        Invalid user-supplied patterns are skipped rather than raised.
+        """
+        key = tuple(self.metadata_selectors.items())
+        cached_key, compiled = self._metadata_re_cache
+        if cached_key != key:
+            compiled = []
+            for field, pat in key:
+                try:
+                    compiled.append((field, re.compile(pat, re.IGNORECASE)))
+                except (re.error, TypeError):
+                    pass
+            compiled = tuple(compiled)
+            self._metadata_re_cache = (key, compiled)
+        return compiled
+
     def accepts_video_url(self, url):
         """Return True when a harvested URL matches this profile's video policy."""
         if not self.get_combined_video_re().search(str(url or '')):
@@ -3424,7 +3876,7 @@ def _row_to_dict(row):
     if isinstance(row, dict):
         return dict(row)
     if hasattr(row, 'keys'):
-        return dict(zip(row.keys(), tuple(row)))
+        return dict(zip(row.keys(), row))
     return dict(row or {})
 
 
@@ -3713,6 +4165,174 @@ def replay_crawl_trace_bundle(bundle_dir):
     }
 
 
+_PW_STACK_PATCHED = False
+
+
+def _install_playwright_stack_patch():
+    """Skip Playwright's per-call stack capture (set PW_INSPECT_STACK=1 to keep it).
+
+    Every Playwright API call walks the Python stack, materializing each
+    frame's locals, and snapshots a traceback with source lines, only to
+    attribute call sites in errors and traces. The patched capture keeps the
+    ``apiName`` error prefix (``Page.goto: ...``) but drops frames and lines.
+    Returns True when the patch is active.
+    """
+    global _PW_STACK_PATCHED
+    if _PW_STACK_PATCHED:
+        return True
+    if os.environ.get('PW_INSPECT_STACK', '0') == '1':
+        return False
+    try:
+        from playwright._impl import _connection as pw_conn
+        from playwright._impl import _impl_to_api_mapping
+    except Exception:
+        return False
+    internal_root = getattr(pw_conn, '_PLAYWRIGHT_MODULE_PATH', None)
+    if not internal_root or not callable(getattr(pw_conn, '_capture_stack_trace', None)):
+        return False  # Unknown Playwright internals; leave them alone
+    mapping_file = _impl_to_api_mapping.__file__
+
+    def capture_stack_trace():
+        frame = sys._getframe(2)
+        api_name = last_internal = ''
+        while frame:
+            code = frame.f_code
+            filename = code.co_filename
+            if filename != mapping_file:
+                if filename.startswith(internal_root):
+                    last_internal = getattr(code, 'co_qualname', code.co_name)
+                elif last_internal:
+                    api_name, last_internal = last_internal, ''
+            frame = frame.f_back
+        return {'frames': [], 'apiName': api_name or last_internal, 'title': None}
+
+    light_traceback = type(traceback)('traceback')
+    light_traceback.__dict__.update(traceback.__dict__)
+    light_traceback.extract_stack = lambda f=None, limit=None: traceback.StackSummary()
+
+    pw_conn._capture_stack_trace = capture_stack_trace
+    pw_conn.traceback = light_traceback
+    _PW_STACK_PATCHED = True
+    return True
+
+
+async def _block_hls_segment_route(route):
+    """Context route handler shared by every crawl on a pooled browser context."""
+    url = route.request.url.lower()
+    # ONLY block heavy HLS .ts video segments (multi-MB each).
+    # Let EVERYTHING else through — blocking images/fonts/CSS is a
+    # major anti-bot detection signal that Cloudflare catches instantly.
+    # NOTE: Parenthesized to fix operator precedence (and > or), and
+    # tightened regex to only match .ts file extensions, not query params.
+    if (url.endswith('.ts') and '/segment' in url) or re.search(r'/[^/]+\.ts\?', url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class _BrowserHost:
+    """Long-lived event-loop thread that keeps Playwright and the persistent
+    Chromium context warm between crawl sessions.
+
+    Playwright objects are bound to the loop that created them, so crawls run
+    their coroutine on this loop (``run``) instead of a per-worker loop.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loop = None
+        self._thread = None
+        self._pw = None
+        self._context = None
+        self._context_key = None
+
+    def _ensure_loop(self):
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._serve, args=(self._loop,), name='browser-host', daemon=True)
+                self._thread.start()
+            return self._loop
+
+    @staticmethod
+    def _serve(loop):
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+
+    def run(self, coro):
+        """Run ``coro`` on the host loop, blocking the calling thread for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop()).result()
+
+    async def acquire_context(self, key, launch):
+        """Return ``(pw, context, reused)``; ``launch(pw)`` builds a context when ``key`` changed."""
+        if self._context is not None and self._context_key == key:
+            return self._pw, self._context, True
+        await self._close_context()
+        if self._pw is None:
+            from playwright.async_api import async_playwright
+            _install_playwright_stack_patch()
+            self._pw = await async_playwright().start()
+        context = await launch(self._pw)
+        context.on('close', lambda _ctx: self._forget_context(context))
+        self._context, self._context_key = context, key
+        return self._pw, context, False
+
+    async def release_context(self):
+        """Close the warm context; the next crawl launches a fresh one."""
+        await self._close_context()
+
+    def _forget_context(self, context):
+        # The user closed the visible window (or Chromium died): relaunch next time.
+        if self._context is context:
+            self._context, self._context_key = None, None
+
+    async def _close_context(self):
+        context, self._context, self._context_key = self._context, None, None
+        if context is not None:
+            try:
+                await context.close()
+            except Exception:
+                pass
+
+    async def _close(self):
+        await self._close_context()
+        pw, self._pw = self._pw, None
+        if pw is not None:
+            try:
+                await pw.stop()
+            except Exception:
+                pass
+        loop = asyncio.get_running_loop()
+        await loop.shutdown_asyncgens()
+        await loop.shutdown_default_executor()
+
+    def shutdown(self, timeout=10):
+        """Close Chromium/Playwright and stop the host thread (app exit)."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or loop.is_closed():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._close(), loop).result(timeout)
+        except Exception:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout)
+        if not loop.is_running():
+            loop.close()
+
+
+_BROWSER_HOST = _BrowserHost()
+
+
+# Page-delay jitter multipliers: 0.60-1.50 in 0.01 steps, so per-batch
+# random.choices() sampling keeps the spread of random.uniform(0.6, 1.5).
+_PAGE_JITTER_STEPS = tuple(round(0.6 + i / 100, 2) for i in range(91))
+
+
 class BrowserInstallWorker(QThread):
     """Runs `playwright install chromium` in a background thread with live log output."""
     log_signal    = pyqtSignal(str)
@@ -3789,17 +4409,53 @@ class CrawlerWorker(QThread):
             self._profiles = [profile]
         else:
             self._profiles = [SiteProfile.get('Artlist') or SiteProfile.get('Generic')]
-        self.profile = self._profiles[0]
+        self._default_profile = self._profiles[0]
+        # Each per-profile batch runs as its own asyncio task, so the active
+        # profile is task-local rather than a shared attribute.
+        self._active_profile = contextvars.ContextVar('crawl_profile', default=None)
+        self._nav_status = contextvars.ContextVar('crawl_nav_status', default=0)
         self._stop   = threading.Event()
         self._pause  = threading.Event()
-        self._video_re = self.profile.get_combined_video_re()
         self._batch_size = cfg.get('batch_size', 50)
+        self._page_count = 0
         self._browser_session_key = (
             f"{datetime.now().isoformat()}|{random.random()}|"
             f"{','.join(p.name for p in self._profiles)}"
         )
         self._challenge_notifications_sent = set()
         self._crawl_budget = CrawlBudgetController(cfg)
+        # Thumbnail fetches (network, disk, DB) run on a dedicated pool,
+        # created on first use and shut down when the crawl drains it.
+        self._thumb_pool = None
+        self._pending_thumbs = set()
+        # Keep-alive connections to the thumbnail CDN, one per pool thread
+        self._thumb_http = _KeepAliveHTTP()
+        # Thumbnail cache path prefix, resolved on first use
+        self._thumb_prefix = None
+        self._stats_emitted_at = float('-inf')
+        # In-flight response handler tasks (strong refs until done)
+        self._response_tasks = set()
+        # Idle clip tabs kept for reuse: [page, uses] pairs
+        self._clip_pages = []
+        # Clip ids whose HLS manifest the response interceptor recorded on an
+        # HLS-only profile; _scan_page_source skips those pages
+        self._hls_intercepted = set()
+
+    @property
+    def profile(self):
+        active = self._active_profile.get()
+        return active[0] if active else self._default_profile
+
+    @profile.setter
+    def profile(self, value):
+        self._active_profile.set((value, value.get_combined_video_re()))
+
+    @property
+    def _video_re(self):
+        active = self._active_profile.get()
+        if active:
+            return active[1]
+        return self._default_profile.get_combined_video_re()
 
     def _api_start_url_for_profile(self, profile):
         if len(self._profiles) == 1:
@@ -3862,7 +4518,7 @@ class CrawlerWorker(QThread):
                 self.log(
                     f"[{connector.profile_name}] API page {page}: {len(result.clips)} clip(s), {saved} new{quota}{total}",
                     "OK")
-                self.stats_signal.emit(self.db.stats())
+                self._emit_stats()
                 page = result.next_page
 
             if successful_pages:
@@ -3892,6 +4548,34 @@ class CrawlerWorker(QThread):
         except Exception as exc:
             self.log(f"Crawl budget header observation skipped: {_redact_text(exc)}", "DEBUG")
 
+    def _emit_stats(self, force=False):
+        """Push DB stats to the UI, at most once per _STATS_INTERVAL unless forced."""
+        now = time.monotonic()
+        if not force and now - self._stats_emitted_at < self._STATS_INTERVAL:
+            return
+        self._stats_emitted_at = now
+        self.stats_signal.emit(self.db.stats())
+
+    def _filtered_response_handler(self, source_url, handler, wanted):
+        """Wrap async ``handler`` as a plain 'response' listener.
+
+        Only responses passing ``wanted(resp)`` get an asyncio task; the rest
+        (images, fonts, CSS, beacons) are just observed for crawl-budget
+        headers and dropped without leaving Playwright's dispatch call.
+        """
+        def on_response(resp):
+            try:
+                if not wanted(resp):
+                    self._observe_crawl_budget_response(
+                        resp.url, source_url, getattr(resp, 'status', 0), resp.headers)
+                    return
+            except Exception:
+                return
+            task = asyncio.ensure_future(handler(resp))
+            self._response_tasks.add(task)
+            task.add_done_callback(self._response_tasks.discard)
+        return on_response
+
     def _trace_enabled(self):
         return bool(self.cfg.get('crawl_trace_on_failure', True))
 
@@ -4078,29 +4762,16 @@ class CrawlerWorker(QThread):
             json.dump(metadata, fh, indent=2, ensure_ascii=False)
 
     def run(self):
-        # Must create a NEW event loop per thread.
-        # asyncio.run() fails in QThread on Python 3.12+ because Qt owns the
-        # main thread loop.  new_event_loop() avoids the conflict entirely.
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        # The crawl coroutine runs on the shared browser-host loop so the
+        # Playwright session outlives this worker; this QThread just waits.
         try:
-            loop.run_until_complete(self._crawl())
+            _BROWSER_HOST.run(self._crawl())
         except Exception as e:
             import traceback as _tb
             msg = f"Crawler crashed: {type(e).__name__}: {e}\n\n{_tb.format_exc()}"
             self.log_signal.emit(f"[FATAL] {msg}", "ERROR")
             self.status_signal.emit("stopped")
             self.finished.emit()
-        finally:
-            try:
-                pending = asyncio.all_tasks(loop)
-                for task in pending:
-                    task.cancel()
-                if pending:
-                    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
-            except (RuntimeError, asyncio.CancelledError):
-                pass  # Expected during event loop teardown
-            loop.close()
 
     # ── Stealth patches ─────────────────────────────────────────────────────
 
@@ -4135,7 +4806,8 @@ class CrawlerWorker(QThread):
 
     # ── Challenge detection ──────────────────────────────────────────────────
 
-    _CHALLENGE_PATTERNS = [
+    # Already lowercase; matched against lowercased title/body text.
+    _CHALLENGE_PATTERNS = (
         'checking your browser',
         'just a moment',
         'verify you are human',
@@ -4146,22 +4818,38 @@ class CrawlerWorker(QThread):
         'please wait',
         'bot detection',
         'are you a robot',
-    ]
+    )
+
+    # Main-document statuses worth a DOM challenge probe; 0 = no response seen.
+    _CHALLENGE_STATUSES = frozenset({0, 403, 429, 503})
+
+    # Thumbnail download threads per crawl
+    _THUMB_CONCURRENCY = 16
+
+    # Minimum seconds between unforced stats refreshes; each one runs
+    # several COUNT(*) queries
+    _STATS_INTERVAL = 0.5
+
+    # Navigations before a pooled clip tab is closed to release renderer memory
+    _CLIP_PAGE_MAX_USES = 25
+
+    # Seconds a finished crawl waits for in-flight response handlers
+    # before cancelling them
+    _RESPONSE_DRAIN_TIMEOUT = 5
 
     async def _detect_challenge(self, page):
         """Check if the current page is a bot challenge / CAPTCHA."""
         try:
+            patterns = self._CHALLENGE_PATTERNS
             title = (await page.title() or '').lower()
             # Check title
-            for pat in self._CHALLENGE_PATTERNS:
-                if pat in title:
-                    return True
+            if any(pat in title for pat in patterns):
+                return True
             # Check body text (first 2000 chars to be fast)
             body = await page.evaluate(
                 "(document.body && document.body.innerText || '').substring(0, 2000).toLowerCase()")
-            for pat in self._CHALLENGE_PATTERNS:
-                if pat in body:
-                    return True
+            if any(pat in body for pat in patterns):
+                return True
             # Check for Cloudflare-specific elements
             cf = await page.query_selector('#challenge-form, #cf-challenge-running, .cf-browser-verification')
             if cf:
@@ -4236,20 +4924,16 @@ class CrawlerWorker(QThread):
             if not remaining:
                 self.log("All selected profiles were handled by official APIs; browser crawl skipped.", "OK")
                 self.status_signal.emit("stopped")
-                self.stats_signal.emit(self.db.stats())
+                self._emit_stats(force=True)
                 self.finished.emit()
                 return
             self._profiles = remaining
-            self.profile = self._profiles[0]
-            self._video_re = self.profile.get_combined_video_re()
+            self._default_profile = self._profiles[0]
             self.log(
                 "Continuing browser fallback for remaining profiles: " + ', '.join(p.name for p in self._profiles),
                 "INFO")
 
-        from playwright.async_api import async_playwright
-
         headless = self.cfg.get('headless', True)
-        self.log(f"Launching Chromium ({'headless' if headless else 'visible'})...", "INFO")
 
         # Session persistence: reuse or rotate browser profiles for cookies/localStorage
         browser_profile = _browser_profile_context(self.cfg, self._browser_session_key)
@@ -4268,256 +4952,301 @@ class CrawlerWorker(QThread):
         elif _cfg_bool(self.cfg, 'proxy_pool_enabled', False):
             self.log("Proxy pool enabled but no valid proxies were loaded.", "WARN")
 
-        # Rotate through recent UA strings
+        # Rotate through recent UA strings, one per browser profile dir so a
+        # profile's cookies always travel with the same UA (and the warm
+        # Chromium for that profile can be reused as-is).
         ua_versions = ['131.0.0.0', '130.0.0.0', '129.0.0.0', '128.0.0.0']
-        ua_ver = random.choice(ua_versions)
+        ua_ver = random.Random(os.path.abspath(profile_dir)).choice(ua_versions)
         ua = f'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{ua_ver} Safari/537.36'
 
-        async with async_playwright() as pw:
-            launch_kwargs = {
-                'headless': headless,
-                'args': [
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-infobars',
-                    '--disable-dev-shm-usage',
-                    f'--window-size=1440,900',
-                ],
-                'viewport': {'width': 1440, 'height': 900},
-                'user_agent': ua,
-                'locale': 'en-US',
-                'timezone_id': 'America/New_York',
-                'extra_http_headers': {
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-                    'sec-ch-ua': f'"Chromium";v="{ua_ver.split(".")[0]}", "Google Chrome";v="{ua_ver.split(".")[0]}", "Not?A_Brand";v="99"',
-                    'sec-ch-ua-mobile': '?0',
-                    'sec-ch-ua-platform': '"Windows"',
-                },
-                'ignore_default_args': ['--enable-automation'],
-            }
-            if proxy:
-                launch_kwargs['proxy'] = proxy
-            context = await pw.chromium.launch_persistent_context(profile_dir, **launch_kwargs)
+        launch_kwargs = {
+            'headless': headless,
+            'args': [
+                '--no-sandbox',
+                '--disable-setuid-sandbox',
+                '--disable-blink-features=AutomationControlled',
+                '--disable-infobars',
+                '--disable-dev-shm-usage',
+                f'--window-size=1440,900',
+            ],
+            'viewport': {'width': 1440, 'height': 900},
+            'user_agent': ua,
+            'locale': 'en-US',
+            'timezone_id': 'America/New_York',
+            'extra_http_headers': {
+                'Accept-Language': 'en-US,en;q=0.9',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+                'sec-ch-ua': f'"Chromium";v="{ua_ver.split(".")[0]}", "Google Chrome";v="{ua_ver.split(".")[0]}", "Not?A_Brand";v="99"',
+                'sec-ch-ua-mobile': '?0',
+                'sec-ch-ua-platform': '"Windows"',
+            },
+            'ignore_default_args': ['--enable-automation'],
+        }
+        if proxy:
+            launch_kwargs['proxy'] = proxy
 
-            # Inject stealth patches into every new page/frame
+        async def launch(pw):
+            self.log(f"Launching Chromium ({'headless' if headless else 'visible'})...", "INFO")
+            context = await pw.chromium.launch_persistent_context(profile_dir, **launch_kwargs)
+            # Inject stealth patches and the video URL interceptor into every
+            # new page/frame (once per context, not per tab)
             await context.add_init_script(self.STEALTH_SCRIPT)
-
+            await context.add_init_script(self.VIDEO_INTERCEPT_SCRIPT)
             # Only block heavy .ts video segments — let everything else through
-            await context.route('**/*', self._route_handler)
-
-            page = context.pages[0] if context.pages else await context.new_page()
+            await context.route('**/*', _block_hls_segment_route)
+            return context
 
-            crawl_mode = self.cfg.get('crawl_mode', 'full')
-            self.log(f"Crawl mode: {crawl_mode}", "INFO")
-
-            # ── Seed based on mode ────────────────────────────────────────
-            if crawl_mode == 'm3u8_only':
-                # Seed from DB: clips that have metadata but no M3U8 URL
-                missing = self.db.execute("""
-                    SELECT clip_id, source_url FROM clips
-                    WHERE (m3u8_url IS NULL OR m3u8_url = '')
-                    AND source_url != '' AND clip_id != ''
-                    ORDER BY id DESC
-                """).fetchall()
-                seeded = 0
-                for row in missing:
-                    src_url = row['source_url']
-                    if src_url and src_url.startswith('http'):
-                        # Determine which profile this clip belongs to
-                        prof_name = 'Artlist'  # default
-                        for _p in self._profiles:
-                            if any(d in src_url for d in _p.domains):
-                                prof_name = _p.name; break
-                        self.db.enqueue(src_url, 0, 10, profile=prof_name)
-                        seeded += 1
-                self.log(f"M3U8 Harvest: seeded {seeded} clips missing M3U8 URLs", "OK")
-            else:
-                # Normal seeding: start URLs from profiles
-                for _prof in self._profiles:
-                    if len(self._profiles) == 1:
-                        _start = self._normalize_url(
-                            self.cfg.get('start_url', '') or _prof.start_url)
-                    else:
-                        _start = self._normalize_url(_prof.start_url)
-                    if _start:
-                        self.db.execute("DELETE FROM crawled_pages WHERE url=?", (_start,))
-                        self.db.conn.commit()
-                        self.db.enqueue(_start, 0, 100, profile=_prof.name)
-                        self.log(f"Seeded [{_prof.name}]: {_start}", "INFO")
-
-            prof_names = ', '.join(p.name for p in self._profiles)
-            self.log(f"Profiles: {prof_names}  |  Batch: {self._batch_size} pages each", "INFO")
-            self.status_signal.emit("running")
-            self.stats_signal.emit(self.db.stats())
+        # Chromium stays up between crawl sessions only while every launch
+        # option (headless, UA, headers, proxy, profile dir...) is unchanged.
+        launch_key = (os.path.abspath(profile_dir), json.dumps(launch_kwargs, sort_keys=True))
+        pw, context, reused = await _BROWSER_HOST.acquire_context(launch_key, launch)
+        if reused:
+            self.log("Reusing running Chromium session", "INFO")
+        try:
+            await self._crawl_with_context(context, pw)
+        finally:
+            await self._release_crawl_resources(headless)
+        self.status_signal.emit("stopped")
+        self._emit_stats(force=True)
+        self.finished.emit()
 
-            challenge_backoff = 1.0
-            page_count = 0
-            profile_idx = 0
-            batch_size = self._batch_size
+    async def _release_crawl_resources(self, headless):
+        """Close this crawl's tabs and tasks on the shared browser loop.
 
-            while not self._stop.is_set():
-                # ── Round-robin: try each profile in turn ─────────────────
-                empty_profiles = 0
-                for _ in range(len(self._profiles)):
-                    if self._stop.is_set(): break
-
-                    # Switch to next profile
-                    self.profile = self._profiles[profile_idx % len(self._profiles)]
-                    self._video_re = self.profile.get_combined_video_re()
-                    profile_idx += 1
-                    pname = self.profile.name
-
-                    pq = self.db.queue_size(profile=pname)
-                    if pq == 0:
-                        empty_profiles += 1
-                        continue
+        A visible window is closed too, so it doesn't linger after the crawl.
+        """
+        if self._response_tasks:
+            _done, late = await asyncio.wait(
+                list(self._response_tasks), timeout=self._RESPONSE_DRAIN_TIMEOUT)
+            for task in late:
+                task.cancel()
+            if late:
+                await asyncio.gather(*late, return_exceptions=True)
+        await self._close_clip_pages()
+        await self._drain_thumb_downloads()
+        if not headless:
+            await _BROWSER_HOST.release_context()
+
+    async def _crawl_with_context(self, context, pw):
+        crawl_mode = self.cfg.get('crawl_mode', 'full')
+        self.log(f"Crawl mode: {crawl_mode}", "INFO")
+
+        # ── Seed based on mode ────────────────────────────────────────
+        if crawl_mode == 'm3u8_only':
+            # Seed from DB: clips that have metadata but no M3U8 URL
+            missing = self.db.execute("""
+                SELECT clip_id, source_url FROM clips
+                WHERE (m3u8_url IS NULL OR m3u8_url = '')
+                AND source_url != '' AND clip_id != ''
+                ORDER BY id DESC
+            """).fetchall()
+            seeded = 0
+            for row in missing:
+                src_url = row['source_url']
+                if src_url and src_url.startswith('http'):
+                    # Determine which profile this clip belongs to
+                    prof_name = 'Artlist'  # default
+                    for _p in self._profiles:
+                        if any(d in src_url for d in _p.domains):
+                            prof_name = _p.name; break
+                    self.db.enqueue(src_url, 0, 10, profile=prof_name)
+                    seeded += 1
+            self.log(f"M3U8 Harvest: seeded {seeded} clips missing M3U8 URLs", "OK")
+        else:
+            # Normal seeding: start URLs from profiles
+            for _prof in self._profiles:
+                if len(self._profiles) == 1:
+                    _start = self._normalize_url(
+                        self.cfg.get('start_url', '') or _prof.start_url)
+                else:
+                    _start = self._normalize_url(_prof.start_url)
+                if _start:
+                    self.db.forget_processed(_start)
+                    self.db.enqueue(_start, 0, 100, profile=_prof.name)
+                    self.log(f"Seeded [{_prof.name}]: {_start}", "INFO")
+
+        prof_names = ', '.join(p.name for p in self._profiles)
+        self.log(f"Profiles: {prof_names}  |  Batch: {self._batch_size} pages each", "INFO")
+        self.status_signal.emit("running")
+        self._emit_stats(force=True)
 
-                    self.log(f"--- [{pname}] Starting batch ({pq} queued) ---", "INFO")
-                    batch_count = 0
+        max_concurrent = max(1, int(self.cfg.get('max_concurrent_pages', 4) or 1))
+        slots = asyncio.Semaphore(max_concurrent)
+        self._page_count = 0
 
-                    while batch_count < batch_size and not self._stop.is_set():
-                        while self._pause.is_set() and not self._stop.is_set():
-                            await asyncio.sleep(0.5)
-                        if self._stop.is_set(): break
+        while not self._stop.is_set():
+            # ── One task per profile, all sharing the browser context ──
+            batches = [
+                asyncio.ensure_future(self._run_profile_batch(context, prof, pw, crawl_mode, slots))
+                for prof in self._profiles
+            ]
+            try:
+                ran = await asyncio.gather(*batches)
+            finally:
+                # If one profile failed, stop its siblings (closing their tabs)
+                for task in batches:
+                    task.cancel()
+                await asyncio.gather(*batches, return_exceptions=True)
 
-                        item = self.db.dequeue(profile=pname)
-                        if not item: break
+            # If ALL profiles' queues are empty, we're done
+            if not any(ran):
+                total_q = self.db.queue_size()
+                if total_q == 0:
+                    self.log("All queues empty -- crawl complete!", "OK")
+                    break
 
-                        url, depth = item['url'], item['depth']
+    async def _run_profile_batch(self, context, profile, pw, crawl_mode, slots):
+        """Crawl up to one batch of queued pages for ``profile`` in its own tab.
 
-                        _parsed = urlparse(url)
-                        if not self.profile.is_allowed_domain(_parsed.netloc):
-                            self.db.mark_processed(url, depth)
-                            self.log(f"SKIP (domain): {url[:80]}", "DEBUG")
-                            continue
-                        if self.profile.is_excluded(url):
-                            self.db.mark_processed(url, depth)
-                            self.log(f"SKIP (excluded): {url[:80]}", "DEBUG")
-                            continue
+        Returns False when the profile's queue was empty.
+        """
+        self.profile = profile
+        pname = profile.name
+        pq = self.db.queue_size(profile=pname)
+        if pq == 0 or self._stop.is_set():
+            return False
 
-                        max_p = self.cfg.get('max_pages', 0)
-                        if max_p > 0 and page_count >= max_p:
-                            self.log(f"Max pages ({max_p}) reached", "WARN"); break
-
-                        if self.cfg.get('resume', True) and self.db.is_processed(url):
-                            self.log(f"SKIP (already processed): {url[:80]}", "DEBUG"); continue
-
-                        is_clip = self._is_clip(url)
-                        is_cat = self._is_catalog(url)
-
-                        # ── Crawl Mode dispatch ──────────────────────────
-                        if crawl_mode == 'catalog_sweep':
-                            if is_clip:
-                                # Don't visit clip pages in catalog sweep mode
-                                # Just mark processed — metadata already extracted from cards
-                                self.db.mark_processed(url, depth)
-                                continue
-                            elif is_cat:
-                                self.log(f"[{pname}] CATALOG [d{depth}] p{page_count} {url[:80]}", "INFO")
-                                await self._crawl_catalog(page, url, depth)
-                            else:
-                                # Generic page — treat as catalog (might have cards)
-                                self.log(f"[{pname}] GENERIC->CATALOG [d{depth}] p{page_count} {url[:80]}", "INFO")
-                                await self._crawl_catalog(page, url, depth)
-                        elif crawl_mode == 'm3u8_only':
-                            if is_clip or not is_cat:
-                                self.log(f"[{pname}] M3U8 HARVEST [d{depth}] p{page_count} {url[:80]}", "INFO")
-                                await self._crawl_clip(context, url, depth)
-                            else:
-                                self.db.mark_processed(url, depth)
-                                continue
-                        else:
-                            # Full mode — original behavior
-                            page_type = 'CLIP' if is_clip else ('CATALOG' if is_cat else 'GENERIC')
-                            self.log(f"[{pname}] DEQUEUE [{page_type}] d{depth} p{page_count} {url[:80]}", "INFO")
-                            if is_clip:
-                                await self._crawl_clip(context, url, depth)
-                            elif is_cat:
-                                await self._crawl_catalog(page, url, depth)
-                            else:
-                                await self._crawl_clip(context, url, depth)
-
-                        if await self._detect_challenge(page):
-                            solved = await self._handle_challenge(page, None, pw)
-                            if not solved:
-                                self.db.enqueue(url, depth, 10, profile=pname)
-                                challenge_backoff = min(challenge_backoff * 2, 8.0)
-                                self.log(f"Backoff multiplier: {challenge_backoff:.1f}x", "WARN")
-                                continue
-                            else:
-                                challenge_backoff = max(challenge_backoff * 0.7, 1.0)
-
-                        page_count += 1
-                        batch_count += 1
-                        self.stats_signal.emit(self.db.stats())
+        async with slots:
+            self.log(f"--- [{pname}] Starting batch ({pq} queued) ---", "INFO")
+            page = await context.new_page()
+            try:
+                batch_count = await self._crawl_profile_pages(context, page, pw, crawl_mode)
+            finally:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+            if batch_count > 0:
+                self.log(
+                    f"--- [{pname}] Batch done: {batch_count} pages, rotating ---",
+                    "INFO")
+        return True
 
-                        delay = self.cfg.get('page_delay', 2500)
-                        jitter = random.uniform(0.6, 1.5)
-                        wait = delay * jitter * challenge_backoff
-                        await asyncio.sleep(max(0.5, wait / 1000))
+    async def _crawl_profile_pages(self, context, page, pw, crawl_mode):
+        pname = self.profile.name
+        challenge_backoff = 1.0
+        batch_count = 0
+        batch_size = self._batch_size
+        # One sampling call per batch; skipped/re-queued URLs can consume extra.
+        jitters = iter(random.choices(_PAGE_JITTER_STEPS, k=batch_size * 2))
+
+        while batch_count < batch_size and not self._stop.is_set():
+            while self._pause.is_set() and not self._stop.is_set():
+                await asyncio.sleep(0.5)
+            if self._stop.is_set(): break
 
-                    if batch_count > 0:
-                        self.log(
-                            f"--- [{pname}] Batch done: {batch_count} pages, rotating ---",
-                            "INFO")
-
-                # If ALL profiles' queues are empty, we're done
-                if empty_profiles >= len(self._profiles):
-                    total_q = self.db.queue_size()
-                    if total_q == 0:
-                        self.log("All queues empty -- crawl complete!", "OK")
-                        break
+            item = self.db.dequeue(profile=pname)
+            if not item: break
 
-            await context.close()
+            url, depth = item['url'], item['depth']
 
-        self.status_signal.emit("stopped")
-        self.stats_signal.emit(self.db.stats())
-        self.finished.emit()
+            _parsed = urlparse(url)
+            if not self.profile.is_allowed_domain(_parsed.netloc):
+                self.db.mark_processed(url, depth)
+                self.log(f"SKIP (domain): {url[:80]}", "DEBUG")
+                continue
+            if self.profile.is_excluded(url):
+                self.db.mark_processed(url, depth)
+                self.log(f"SKIP (excluded): {url[:80]}", "DEBUG")
+                continue
 
-    async def _route_handler(self, route):
-        url = route.request.url.lower()
-        # ONLY block heavy HLS .ts video segments (multi-MB each).
-        # Let EVERYTHING else through — blocking images/fonts/CSS is a
-        # major anti-bot detection signal that Cloudflare catches instantly.
-        # NOTE: Parenthesized to fix operator precedence (and > or), and
-        # tightened regex to only match .ts file extensions, not query params.
-        if (url.endswith('.ts') and '/segment' in url) or re.search(r'/[^/]+\.ts\?', url):
-            await route.abort()
-        else:
-            await route.continue_()
+            max_p = self.cfg.get('max_pages', 0)
+            if max_p > 0 and self._page_count >= max_p:
+                self.log(f"Max pages ({max_p}) reached", "WARN"); break
 
-    # ── Response interception ────────────────────────────────────────────────
+            if self.cfg.get('resume', True) and self.db.is_processed(url):
+                self.log(f"SKIP (already processed): {url[:80]}", "DEBUG"); continue
 
-    async def _on_response(self, response, source_url, clip_meta):
-        url = response.url
-        self._observe_crawl_budget_response(url, source_url, getattr(response, 'status', 0), response.headers)
+            is_clip = self._is_clip(url)
+            is_cat = self._is_catalog(url)
+            page_count = self._page_count
+            self._nav_status.set(0)
 
-        # Capture direct video URL requests (M3U8, MP4, WebM, etc.)
-        if self._video_re.search(url):
-            # On clip pages, only record URLs matching the current clip's video ID
+            # ── Crawl Mode dispatch ──────────────────────────
+            if crawl_mode == 'catalog_sweep':
+                if is_clip:
+                    # Don't visit clip pages in catalog sweep mode
+                    # Just mark processed — metadata already extracted from cards
+                    self.db.mark_processed(url, depth)
+                    continue
+                elif is_cat:
+                    self.log(f"[{pname}] CATALOG [d{depth}] p{page_count} {url[:80]}", "INFO")
+                    await self._crawl_catalog(page, url, depth)
+                else:
+                    # Generic page — treat as catalog (might have cards)
+                    self.log(f"[{pname}] GENERIC->CATALOG [d{depth}] p{page_count} {url[:80]}", "INFO")
+                    await self._crawl_catalog(page, url, depth)
+            elif crawl_mode == 'm3u8_only':
+                if is_clip or not is_cat:
+                    self.log(f"[{pname}] M3U8 HARVEST [d{depth}] p{page_count} {url[:80]}", "INFO")
+                    await self._crawl_clip(context, url, depth)
+                else:
+                    self.db.mark_processed(url, depth)
+                    continue
+            else:
+                # Full mode — original behavior
+                page_type = 'CLIP' if is_clip else ('CATALOG' if is_cat else 'GENERIC')
+                self.log(f"[{pname}] DEQUEUE [{page_type}] d{depth} p{page_count} {url[:80]}", "INFO")
+                if is_clip:
+                    await self._crawl_clip(context, url, depth)
+                elif is_cat:
+                    await self._crawl_catalog(page, url, depth)
+                else:
+                    await self._crawl_clip(context, url, depth)
+
+            # Healthy 2xx/3xx navigations skip the title/body/selector probe.
+            if (self._nav_status.get() in self._CHALLENGE_STATUSES
+                    and await self._detect_challenge(page)):
+                solved = await self._handle_challenge(page, None, pw)
+                if not solved:
+                    self.db.enqueue(url, depth, 10, profile=pname)
+                    challenge_backoff = min(challenge_backoff * 2, 8.0)
+                    self.log(f"Backoff multiplier: {challenge_backoff:.1f}x", "WARN")
+                    continue
+                else:
+                    challenge_backoff = max(challenge_backoff * 0.7, 1.0)
+
+            self._page_count += 1
+            batch_count += 1
+            self._emit_stats(force=True)
+
+            delay = self.cfg.get('page_delay', 2500)
+            jitter = next(jitters, None) or random.uniform(0.6, 1.5)
+            wait = delay * jitter * challenge_backoff
+            await asyncio.sleep(max(0.5, wait / 1000))
+
+        return batch_count
+
+    # ── Response interception ────────────────────────────────────────────────
+
+    async def _on_response(self, response, source_url, clip_meta):
+        url = response.url
+        self._observe_crawl_budget_response(url, source_url, getattr(response, 'status', 0), response.headers)
+
+        # Capture direct video URL requests (M3U8, MP4, WebM, etc.)
+        if self._video_re.search(url):
+            # On clip pages, only record URLs matching the current clip's video ID
             # to avoid capturing SD preview thumbnails for 150+ related videos
             current_id = clip_meta.get('clip_id', '')
             if current_id:
-                vid_m = re.search(r'/video-files/(\d+)/', url)
-                if vid_m and vid_m.group(1) != current_id:
+                vid_id = _parse_video_url(url)[0]
+                if vid_id and vid_id != current_id:
                     return  # Skip — this is a related video's preview, not our clip
-                if not vid_m and clip_meta.get('m3u8_url'):
+                if not vid_id and clip_meta.get('m3u8_url'):
                     return  # Can't verify + already have a video URL — skip related preview
 
             # ── M3U8 master playlist: extract resolution from RESOLUTION= ──
             if '.m3u8' in url.lower():
                 try:
                     body = await response.text()
-                    resolutions = re.findall(r'RESOLUTION=(\d{3,5})x(\d{3,5})', body)
+                    resolutions = _HLS_RES_RE.findall(body)
                     if resolutions:
                         # Pick highest resolution variant
                         best_w, best_h = max(resolutions, key=lambda r: int(r[0]) * int(r[1]))
                         if not clip_meta.get('resolution'):
                             clip_meta['resolution'] = f"{best_w}x{best_h}"
                         # Also extract frame rate if available
-                        fps_m = re.search(r'FRAME-RATE=([\d.]+)', body)
+                        fps_m = _HLS_FPS_RE.search(body)
                         if fps_m and not clip_meta.get('frame_rate'):
                             clip_meta['frame_rate'] = fps_m.group(1).split('.')[0]
                 except Exception:
@@ -4527,11 +5256,13 @@ class CrawlerWorker(QThread):
             # Mark that we have a video URL so subsequent unverifiable responses are skipped
             if not clip_meta.get('m3u8_url'):
                 clip_meta['m3u8_url'] = url.strip()
+            if current_id and self.profile.video_types == ['m3u8'] and '.m3u8' in url.lower():
+                self._hls_intercepted.add(current_id)
             return
 
         # For body scanning: only small JSON responses (API calls that may embed URLs)
         rt = response.request.resource_type
-        if rt not in ('xhr', 'fetch'):
+        if rt not in _API_RESOURCE_TYPES:
             return
         try:
             ct = response.headers.get('content-type', '')
@@ -4541,8 +5272,9 @@ class CrawlerWorker(QThread):
             if cl > 512_000:
                 return
             body = await response.text()
-            for m in self._video_re.findall(body):
-                await self._record_video_url(m.strip(), source_url, clip_meta)
+            with self.db.batch():
+                for m in self.profile.find_video_urls(body):
+                    await self._record_video_url(m.strip(), source_url, clip_meta)
         except Exception as e:
             # Don't log for common non-errors (binary responses, connection resets)
             err = str(e)
@@ -4568,23 +5300,22 @@ class CrawlerWorker(QThread):
         meta['source_url'] = source_url or meta.get('source_url', '')
 
         # ── Auto-extract metadata from video URL filename ─────────────
-        vid_id_m = re.search(r'/video-files/(\d+)/', url)
-        if vid_id_m:
-            meta['clip_id'] = vid_id_m.group(1)
-        res_m = re.search(r'(\d{3,4})_(\d{3,4})_(\d+)fps', url)
+        vid_id, res, _ = _parse_video_url(url)
+        if vid_id:
+            meta['clip_id'] = vid_id
         quality_label = '?'
-        if res_m:
-            w, h = int(res_m.group(1)), int(res_m.group(2))
-            fps = res_m.group(3)
+        if res:
+            w, h = int(res[0]), int(res[1])
+            fps = res[2]
             meta['resolution'] = f"{w}x{h}"
             meta['frame_rate'] = fps
             quality_label = f"{max(w,h)}p"
         elif meta.get('resolution'):
             # Resolution from M3U8 master playlist or metadata extraction
-            res_parts = re.match(r'(\d+)x(\d+)', meta['resolution'])
+            res_parts = _RES_PAIR_RE.match(meta['resolution'])
             if res_parts:
                 quality_label = f"{max(int(res_parts.group(1)), int(res_parts.group(2)))}p"
-        qual_m = re.search(r'-(uhd|hd|sd)_', url, re.IGNORECASE)
+        qual_m = _QUALITY_TAG_RE.search(url)
         if qual_m:
             meta['formats'] = qual_m.group(1).upper()
             quality_label = qual_m.group(1).upper()
@@ -4629,6 +5360,65 @@ class CrawlerWorker(QThread):
 
     # ── Metadata extraction from DOM ─────────────────────────────────────────
 
+    # Visible-ish body text without innerText: innerText forces a style/layout
+    # flush, so walk text nodes instead (skipping script/style) and put each on
+    # its own line, which keeps the label/value line breaks profile
+    # metadata_selectors rely on. Capped at 50k chars.
+    BODY_TEXT_SCRIPT = """
+        (() => {
+            const body = document.body;
+            if (!body) return '';
+            const skip = /^(SCRIPT|STYLE|NOSCRIPT|TEMPLATE)$/;
+            const walker = document.createTreeWalker(body, NodeFilter.SHOW_TEXT, {
+                acceptNode: n => skip.test(n.parentNode.nodeName)
+                    ? NodeFilter.FILTER_REJECT : NodeFilter.FILTER_ACCEPT
+            });
+            const parts = [];
+            let size = 0;
+            for (let n = walker.nextNode(); n && size < 50000; n = walker.nextNode()) {
+                const t = n.nodeValue.trim();
+                if (t) { parts.push(t); size += t.length + 1; }
+            }
+            return parts.join('\\n').slice(0, 50000);
+        })()
+    """
+
+    # Everything _extract_metadata reads from the DOM, in one CDP round-trip.
+    METADATA_SNAPSHOT_SCRIPT = """
+        (opts) => {
+            const out = {og: {}, jsonld: null, h1: '', title: document.title || '', body_text: ''};
+            if (opts.og) {
+                try {
+                    for (const prop of ['og:image','og:title','og:description','og:video','og:video:url','og:url']) {
+                        const el = document.querySelector(`meta[property="${prop}"]`)
+                            || document.querySelector(`meta[name="${prop}"]`);
+                        if (el) out.og[prop] = (el.getAttribute('content') || '').trim();
+                    }
+                } catch(e) {}
+            }
+            if (opts.jsonld) {
+                for (const s of document.querySelectorAll('script[type="application/ld+json"]')) {
+                    try {
+                        const d = JSON.parse(s.textContent);
+                        if (d['@type'] === 'VideoObject' || d['@type'] === 'ImageObject') { out.jsonld = d; break; }
+                        if (Array.isArray(d['@graph'])) {
+                            const v = d['@graph'].find(i => i['@type'] === 'VideoObject');
+                            if (v) { out.jsonld = v; break; }
+                        }
+                    } catch(e) {}
+                }
+            }
+            try {
+                const h1 = document.querySelector('h1');
+                if (h1) out.h1 = (h1.textContent || '').replace(/\\s+/g, ' ').trim();
+            } catch(e) {}
+            if (opts.body) {
+                try { out.body_text = """ + BODY_TEXT_SCRIPT.strip() + """; } catch(e) {}
+            }
+            return out;
+        }
+    """
+
     async def _extract_metadata(self, page, url) -> dict:
         """
         Profile-driven metadata extraction with generic fallbacks.
@@ -4639,9 +5429,7 @@ class CrawlerWorker(QThread):
         3. Apply profile-specific regex selectors to body text
         4. Fallback to h1 / page title
         """
-        meta = {k: '' for k in ('clip_id','source_url','title','creator','collection',
-                                 'resolution','duration','frame_rate','camera',
-                                 'formats','tags','thumbnail_url','m3u8_url','source_site')}
+        meta = _EMPTY_META.copy()
         meta['source_url'] = url
         meta['source_site'] = self.profile.name
 
@@ -4652,19 +5440,22 @@ class CrawlerWorker(QThread):
                 if profile_id:
                     meta['clip_id'] = profile_id.group(1)
             if not meta['clip_id']:
-                m = re.search(r'/(\d{4,})(?:/|$)', url)
+                m = _CLIP_ID_RE.search(url)
                 if m: meta['clip_id'] = m.group(1)
 
+            try:
+                snapshot = await page.evaluate(self.METADATA_SNAPSHOT_SCRIPT, {
+                    'og': bool(self.profile.og_fallback),
+                    'jsonld': bool(self.profile.jsonld_fallback),
+                    'body': bool(self.profile.metadata_selectors),
+                }) or {}
+            except Exception as e:
+                self.log(f"Metadata snapshot failed on {url}: {e}", "DEBUG")
+                snapshot = {}
+
             # ── OpenGraph meta tags (works on most sites) ─────────────────
             if self.profile.og_fallback:
-                og_vals = {}
-                for prop in ('og:image','og:title','og:description','og:video','og:video:url','og:url'):
-                    try:
-                        el = await page.query_selector(f'meta[property="{prop}"]')
-                        if not el: el = await page.query_selector(f'meta[name="{prop}"]')
-                        if el:
-                            og_vals[prop] = (await el.get_attribute('content') or '').strip()
-                    except Exception: pass
+                og_vals = snapshot.get('og') or {}
 
                 # Thumbnail
                 if og_vals.get('og:image') and not meta['thumbnail_url']:
@@ -4679,12 +5470,12 @@ class CrawlerWorker(QThread):
                 og_title = og_vals.get('og:title', '')
                 if og_title and not meta['title']:
                     # Pexels: "Video by Author on Pexels" → extract author, use URL slug for title
-                    author_m = re.match(r'(?:Video|Photo)\s+by\s+(.+?)\s+on\s+Pexels', og_title, re.IGNORECASE)
+                    author_m = _PEXELS_AUTHOR_RE.match(og_title)
                     if author_m:
                         if not meta['creator']:
                             meta['creator'] = author_m.group(1).strip()
                         # Build title from URL slug instead
-                        slug_m = re.search(r'/video/([^/]+)-\d+/?$', url)
+                        slug_m = _PEXELS_SLUG_RE.search(url)
                         if slug_m:
                             meta['title'] = slug_m.group(1).replace('-', ' ').title()
                     else:
@@ -4694,7 +5485,7 @@ class CrawlerWorker(QThread):
                 og_desc = og_vals.get('og:description', '')
                 if og_desc:
                     # "Download this video by Author for free on Pexels"
-                    desc_author = re.search(r'by\s+(\w[\w\s.]+?)(?:\s+for\s+free|\s+on\s+|\s*$)', og_desc, re.IGNORECASE)
+                    desc_author = _DESC_AUTHOR_RE.search(og_desc)
                     if desc_author and not meta['creator']:
                         meta['creator'] = desc_author.group(1).strip()
                     # For non-Pexels sites, description might contain useful keywords
@@ -4703,29 +5494,13 @@ class CrawlerWorker(QThread):
 
                 # Clip ID from og:url if not already extracted
                 if og_vals.get('og:url') and not meta['clip_id']:
-                    id_m = re.search(r'/(\d{4,})/?$', og_vals['og:url'])
+                    id_m = _TRAILING_ID_RE.search(og_vals['og:url'])
                     if id_m: meta['clip_id'] = id_m.group(1)
 
             # ── JSON-LD structured data ───────────────────────────────────
             if self.profile.jsonld_fallback:
                 try:
-                    jsonld = await page.evaluate("""
-                        (() => {
-                            const scripts = document.querySelectorAll('script[type="application/ld+json"]');
-                            for (const s of scripts) {
-                                try {
-                                    const d = JSON.parse(s.textContent);
-                                    if (d['@type'] === 'VideoObject' || d['@type'] === 'ImageObject')
-                                        return d;
-                                    if (Array.isArray(d['@graph'])) {
-                                        const v = d['@graph'].find(i => i['@type'] === 'VideoObject');
-                                        if (v) return v;
-                                    }
-                                } catch(e) {}
-                            }
-                            return null;
-                        })()
-                    """)
+                    jsonld = snapshot.get('jsonld')
                     if jsonld:
                         if not meta['title'] and jsonld.get('name'):
                             meta['title'] = str(jsonld['name'])[:200]
@@ -4746,54 +5521,46 @@ class CrawlerWorker(QThread):
 
             # ── Profile-specific regex selectors on body text ─────────────
             if self.profile.metadata_selectors:
-                body_text = await page.evaluate("document.body ? document.body.innerText : ''")
-                for field, pat in self.profile.metadata_selectors.items():
+                body_text = snapshot.get('body_text') or ''
+                for field, pat in self.profile.get_metadata_regexes():
                     if meta.get(field): continue  # don't overwrite existing
                     try:
                         if field == 'tags':
                             # Special tags extraction (multi-line)
-                            tags_m = re.search(pat, body_text, re.IGNORECASE)
+                            tags_m = pat.search(body_text)
                             if tags_m:
                                 raw = tags_m.group(1)
-                                tags = [t.strip() for t in re.split(r'\n|  +', raw)
-                                        if t.strip() and 1 < len(t.strip()) < 35
-                                        and not re.match(r'^https?://', t.strip())]
+                                stripped = [t.strip() for t in _TAG_SPLIT_RE.split(raw)]
+                                tags = [t for t in stripped
+                                        if 1 < len(t) < 35 and not _HTTP_PREFIX_RE.match(t)]
                                 meta['tags'] = ', '.join(tags[:25])
                         else:
-                            m2 = re.search(pat, body_text, re.IGNORECASE)
+                            m2 = pat.search(body_text)
                             if m2:
                                 meta[field] = m2.group(1).strip()
                     except Exception: pass
 
             # ── Title fallback: h1 → URL slug → page title ──────────────
             if not meta['title']:
-                try:
-                    h1 = await page.query_selector('h1')
-                    if h1:
-                        h1_text = (await h1.inner_text()).strip()
-                        # Skip generic site-wide h1s (Pexels, Pixabay catalog headings)
-                        generic_h1 = re.match(
-                            r'(The best free|Free stock|Download free|Search results|Browse)',
-                            h1_text, re.IGNORECASE)
-                        if not generic_h1 and len(h1_text) > 3:
-                            meta['title'] = h1_text
-                except Exception: pass
+                h1_text = snapshot.get('h1') or ''
+                # Skip generic site-wide h1s (Pexels, Pixabay catalog headings)
+                generic_h1 = _GENERIC_H1_RE.match(h1_text)
+                if not generic_h1 and len(h1_text) > 3:
+                    meta['title'] = h1_text
             # URL slug fallback (e.g. /video/freelander-road-trip-at-spitzkoppe-18010808/)
             if not meta['title']:
-                slug_m = re.search(r'/(?:video|clip|stock-footage)/([^/]+?)(?:-\d+)?/?$', url)
+                slug_m = _SLUG_RE.search(url)
                 if slug_m:
                     meta['title'] = slug_m.group(1).replace('-', ' ').title()
             if not meta['title']:
-                pt = await page.title()
-                meta['title'] = re.sub(
-                    r'\s*[|–-]\s*(Stock Footage|Artlist|Pexels|Pixabay|Storyblocks|Free).*$',
-                    '', pt, flags=re.IGNORECASE).strip()
+                pt = snapshot.get('title') or ''
+                meta['title'] = _TITLE_SUFFIX_RE.sub('', pt).strip()
 
             # ── Post-processing ───────────────────────────────────────────
             if meta['resolution']:
-                meta['resolution'] = re.sub(r'\s*[xX\u00d7]\s*', 'x', meta['resolution'])
+                meta['resolution'] = _RES_NORM_RE.sub('x', meta['resolution'])
             if meta['formats']:
-                fmts = re.findall(r'4K|2K|HD|SD|ProRes|MP4|MOV|RAW|WebM', meta['formats'], re.IGNORECASE)
+                fmts = _FMT_RE.findall(meta['formats'])
                 meta['formats'] = ', '.join(fmts) if fmts else meta['formats'][:60].strip()
 
             for k in meta:
@@ -4811,14 +5578,20 @@ class CrawlerWorker(QThread):
         self.log(f"CATALOG [d{depth}] {url}", "INFO")
         trace_state = await self._start_trace_bundle(page.context, page, url, depth, 'catalog')
         cat_handler_attached = False
+        profile = self.profile
 
         try:
             # ── Hook API response interception for bulk clip data ──────
-            async def _cat_resp_handler(resp):
+            async def _cat_api_response(resp):
+                # Playwright dispatches handlers outside this batch's task.
+                self.profile = profile
                 try:
                     await self._on_catalog_response(resp, url)
                 except Exception:
                     pass
+            _cat_resp_handler = self._filtered_response_handler(
+                url, _cat_api_response,
+                lambda resp: resp.request.resource_type in _API_RESOURCE_TYPES)
             page.on('response', _cat_resp_handler)
             cat_handler_attached = True
 
@@ -4855,7 +5628,10 @@ class CrawlerWorker(QThread):
             await self._scroll_to_bottom(page)
 
             # ── Bulk metadata extraction from card grid ───────────────────
-            card_count = await self._extract_catalog_cards(page, url)
+            # Cards saved so far from this page, so later scroll rounds only
+            # write the ones that are new or changed
+            seen_cards = {}
+            card_count = await self._extract_catalog_cards(page, url, seen_cards)
 
             # ── Infinite scroll loop for catalog sweep ────────────────────
             # Keep scrolling + extracting until no new cards appear
@@ -4865,21 +5641,16 @@ class CrawlerWorker(QThread):
                 for scroll_round in range(max_scroll_rounds):
                     if self._stop.is_set():
                         break
-                    # Get current page height
-                    prev_height = await page.evaluate("document.body.scrollHeight")
-                    # Scroll to bottom with randomized behavior
-                    await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                    await asyncio.sleep(random.uniform(1.5, 3.0))
-                    new_height = await page.evaluate("document.body.scrollHeight")
+                    # Scroll to bottom with a randomized wait; the script
+                    # re-checks once after 2s if nothing new loaded
+                    prev_height, new_height = await page.evaluate(
+                        self.SCROLL_ROUND_SCRIPT,
+                        {'wait': int(random.uniform(1500, 3000)), 'retry': 2000})
                     if new_height <= prev_height:
-                        # No new content loaded — try one more time
-                        await asyncio.sleep(2.0)
-                        new_height = await page.evaluate("document.body.scrollHeight")
-                        if new_height <= prev_height:
-                            self.log(f"  [scroll] No more content after {scroll_round+1} rounds", "INFO")
-                            break
+                        self.log(f"  [scroll] No more content after {scroll_round+1} rounds", "INFO")
+                        break
                     # Extract any newly loaded cards
-                    new_cards = await self._extract_catalog_cards(page, url)
+                    new_cards = await self._extract_catalog_cards(page, url, seen_cards)
                     card_count += new_cards
                     self.log(
                         f"  [scroll] Round {scroll_round+1}: +{new_cards} cards (total: {card_count})",
@@ -4894,19 +5665,21 @@ class CrawlerWorker(QThread):
 
             # ── Extract and queue all item/catalog links ──────────────────
             links = await self._extract_links(page)
-            queued = 0
-            seen = set()
-            resume = self.cfg.get('resume', True)
-            for link in links:
-                norm = self._normalize_url(link)
-                if not norm or norm in seen or self._is_excluded(norm): continue
-                seen.add(norm)
-                if self._is_clip(norm):
-                    if not (resume and self.db.is_processed(norm)):
-                        self.db.enqueue(norm, depth+1, 10, profile=self.profile.name); queued += 1
-                elif depth < self.cfg.get('max_depth', 2) and self._is_catalog(norm):
-                    if not (resume and self.db.is_processed(norm)):
-                        self.db.enqueue(norm, depth+1, 5, profile=self.profile.name)
+            # Normalize + dedup (first occurrence wins), then classify
+            norms = [n for n in dict.fromkeys(filter(None, map(self._normalize_url, links)))
+                     if not self._is_excluded(n)]
+            clip_norms = [n for n in norms if self._is_clip(n)]
+            cat_norms = []
+            if depth < self.cfg.get('max_depth', 2):
+                cat_norms = [n for n in norms if not self._is_clip(n) and self._is_catalog(n)]
+            if self.cfg.get('resume', True):
+                done = self.db.is_processed_many(clip_norms + cat_norms)
+                clip_norms = [n for n in clip_norms if n not in done]
+                cat_norms = [n for n in cat_norms if n not in done]
+            queued = len(clip_norms)
+            prof_name = self.profile.name
+            self.db.enqueue_many([(n, depth+1, 10, prof_name) for n in clip_norms] +
+                                 [(n, depth+1, 5, prof_name) for n in cat_norms])
 
             # Unhook catalog response handler
             try:
@@ -4933,6 +5706,108 @@ class CrawlerWorker(QThread):
                 except Exception:
                     pass
 
+    # One catalog-sweep scroll round: scroll, wait for lazy content, and
+    # re-measure (once more after a pause if nothing grew) in one round-trip.
+    # Returns [height_before, height_after].
+    SCROLL_ROUND_SCRIPT = """
+        async ({wait, retry}) => {
+            const sleep = ms => new Promise(r => setTimeout(r, ms));
+            const prev = document.body.scrollHeight;
+            window.scrollTo(0, prev);
+            await sleep(wait);
+            let height = document.body.scrollHeight;
+            if (height <= prev) {
+                await sleep(retry);
+                height = document.body.scrollHeight;
+            }
+            return [prev, height];
+        }
+    """
+
+    # Generic card extraction: __NEXT_DATA__ walk, falling back to DOM links
+    # with numeric IDs, in one round-trip. Returns {source, cards}.
+    GENERIC_CARDS_SCRIPT = """
+        (() => {
+            const clips = [];
+            const seen = new Set();
+            // Try __NEXT_DATA__
+            const nd = document.getElementById('__NEXT_DATA__');
+            if (nd) {
+                try {
+                    // Explicit stack, children pushed in reverse so clips
+                    // come out in document order
+                    const stack = [JSON.parse(nd.textContent)];
+                    while (stack.length) {
+                        const obj = stack.pop();
+                        if (!obj || typeof obj !== 'object') continue;
+                        if (Array.isArray(obj)) {
+                            for (let i = obj.length - 1; i >= 0; i--) stack.push(obj[i]);
+                            continue;
+                        }
+                        const id = String(obj.id || obj.clipId || obj.clip_id || '');
+                        if (id && /^\\d{4,}$/.test(id) && !seen.has(id)) {
+                            seen.add(id);
+                            clips.push({
+                                clip_id: id,
+                                title: obj.title || obj.name || '',
+                                creator: obj.artistName || obj.creatorName || '',
+                                duration: obj.duration || '',
+                                thumbnail_url: obj.thumbnailUrl || obj.thumbnail || obj.imageUrl || '',
+                                source_url: obj.url || '',
+                            });
+                        }
+                        const vals = Object.values(obj);
+                        for (let i = vals.length - 1; i >= 0; i--) stack.push(vals[i]);
+                    }
+                } catch(e) {}
+            }
+            if (clips.length) return {source: 'next', cards: clips};
+            // Find all links with numeric IDs in the path
+            document.querySelectorAll('a[href]').forEach(a => {
+                const href = a.href || '';
+                const m = href.match(/\\/(\\d{4,})\\/?$/);
+                if (!m || seen.has(m[1])) return;
+                // Must have visual content (image or video)
+                const img = a.querySelector('img[src], img[data-src], video[poster]');
+                if (!img) return;
+                seen.add(m[1]);
+                let thumb = img.src || img.dataset.src || img.poster || '';
+                clips.push({
+                    clip_id: m[1],
+                    title: (a.getAttribute('aria-label') || a.getAttribute('title') || img.alt || '').trim(),
+                    creator: '',
+                    duration: '',
+                    thumbnail_url: thumb,
+                    source_url: href.startsWith('http') ? href : new URL(href, location.href).href,
+                });
+            });
+            return {source: 'dom', cards: clips};
+        })()
+    """
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _catalog_cards_script(profile_js):
+        """Wrap a profile's catalog_card_js expression and GENERIC_CARDS_SCRIPT
+        into one function returning {source, cards, profile_count, profile_error}."""
+        expr = profile_js.strip().rstrip(';')
+        return (
+            "async () => {\n"
+            "    const out = {profile_count: null, profile_error: ''};\n"
+            "    try {\n"
+            "        let res = (\n" + expr + "\n);\n"
+            "        if (typeof res === 'function') res = res();\n"
+            "        res = await res;\n"
+            "        res = Array.isArray(res) ? res : [];\n"
+            "        out.profile_count = res.length;\n"
+            "        if (res.length) return Object.assign(out, {source: 'profile', cards: res});\n"
+            "    } catch (e) {\n"
+            "        out.profile_error = String((e && e.message) || e);\n"
+            "    }\n"
+            "    return Object.assign(out, " + CrawlerWorker.GENERIC_CARDS_SCRIPT.strip() + ");\n"
+            "}"
+        )
+
     async def _extract_catalog_videos(self, page, source_url):
         """Extract video URLs directly from catalog pages (e.g. Pexels <video> tags)."""
         try:
@@ -4963,24 +5838,21 @@ class CrawlerWorker(QThread):
             for item in (results or []):
                 src = item.get('src', '')
                 if src and self._video_re.search(src):
-                    vid_m = re.search(r'/video-files/(\d+)/', src)
-                    meta = {k: '' for k in ('clip_id','source_url','title','creator','collection',
-                                             'resolution','duration','frame_rate','camera',
-                                             'formats','tags','thumbnail_url','m3u8_url','source_site')}
+                    vid_id, res, _ = _parse_video_url(src)
+                    meta = _EMPTY_META.copy()
                     meta['source_url'] = item.get('href', '') or source_url
                     meta['source_site'] = self.profile.name
                     meta['m3u8_url'] = src
-                    if vid_m:
-                        meta['clip_id'] = vid_m.group(1)
+                    if vid_id:
+                        meta['clip_id'] = vid_id
                     elif item.get('href'):
                         # Fallback: extract clip ID from linked clip page URL
-                        href_id_m = re.search(r'/(\d{4,})(?:/|$)', item['href'])
+                        href_id_m = _CLIP_ID_RE.search(item['href'])
                         if href_id_m:
                             meta['clip_id'] = href_id_m.group(1)
-                    res_m = re.search(r'(\d{3,4})_(\d{3,4})_(\d+)fps', src)
-                    if res_m:
-                        meta['resolution'] = f"{res_m.group(1)}x{res_m.group(2)}"
-                        meta['frame_rate'] = res_m.group(3)
+                    if res:
+                        meta['resolution'] = f"{res[0]}x{res[1]}"
+                        meta['frame_rate'] = res[2]
                     is_new = self.db.save_clip(meta)
                     if is_new:
                         count += 1
@@ -4993,158 +5865,151 @@ class CrawlerWorker(QThread):
 
     # ── Bulk catalog card metadata extraction ─────────────────────────────
 
-    async def _extract_catalog_cards(self, page, source_url):
+    async def _extract_catalog_cards(self, page, source_url, seen_cards=None):
         """
         Bulk-extract clip metadata from catalog page cards.
         Uses profile's catalog_card_js (if set) or generic card parsing.
+        ``seen_cards`` (clip_id -> meta values) carries across scroll rounds of
+        one catalog page so cards saved by an earlier round are skipped.
         Returns count of new/updated clips.
         """
         new_count = 0
         updated_count = 0
+        unchanged_count = 0
 
-        # ── Strategy 1: Profile-specific JS card extractor ────────────
-        cards = []
-        if self.profile.catalog_card_js:
-            try:
-                cards = await page.evaluate(self.profile.catalog_card_js) or []
-                self.log(f"  [catalog-cards] Profile JS extracted {len(cards)} cards", "INFO")
-            except Exception as e:
+        # ── Profile JS, then __NEXT_DATA__, then DOM card links ───────
+        # All strategies run in one evaluate; the page reports which one
+        # produced the cards.
+        profile_js = self.profile.catalog_card_js
+        script = self._catalog_cards_script(profile_js) if profile_js else self.GENERIC_CARDS_SCRIPT
+        try:
+            found = await page.evaluate(script) or {}
+        except Exception as e:
+            found = {}
+            if profile_js:
+                # Most likely a syntax error in the profile JS; still try generic
                 self.log(f"  [catalog-cards] Profile JS error: {str(e)[:80]}", "WARN")
-
-        # ── Strategy 2: Generic — intercept __NEXT_DATA__ ─────────────
-        if not cards:
-            try:
-                cards = await page.evaluate("""
-                    (() => {
-                        const clips = [];
-                        const seen = new Set();
-                        // Try __NEXT_DATA__
-                        const nd = document.getElementById('__NEXT_DATA__');
-                        if (nd) {
-                            const walk = (obj) => {
-                                if (!obj || typeof obj !== 'object') return;
-                                if (Array.isArray(obj)) { obj.forEach(walk); return; }
-                                const id = String(obj.id || obj.clipId || obj.clip_id || '');
-                                if (id && /^\\d{4,}$/.test(id) && !seen.has(id)) {
-                                    seen.add(id);
-                                    clips.push({
-                                        clip_id: id,
-                                        title: obj.title || obj.name || '',
-                                        creator: obj.artistName || obj.creatorName || '',
-                                        duration: obj.duration || '',
-                                        thumbnail_url: obj.thumbnailUrl || obj.thumbnail || obj.imageUrl || '',
-                                        source_url: obj.url || '',
-                                    });
-                                }
-                                Object.values(obj).forEach(walk);
-                            };
-                            try { walk(JSON.parse(nd.textContent)); } catch(e) {}
-                        }
-                        return clips;
-                    })()
-                """) or []
-                if cards:
-                    self.log(f"  [catalog-cards] __NEXT_DATA__ extracted {len(cards)} cards", "INFO")
-            except Exception:
-                pass
-
-        # ── Strategy 3: Generic DOM card parsing ──────────────────────
-        if not cards:
-            try:
-                cards = await page.evaluate("""
-                    (() => {
-                        const clips = [];
-                        const seen = new Set();
-                        // Find all links with numeric IDs in the path
-                        document.querySelectorAll('a[href]').forEach(a => {
-                            const href = a.href || '';
-                            const m = href.match(/\\/(\\d{4,})\\/?$/);
-                            if (!m || seen.has(m[1])) return;
-                            // Must have visual content (image or video)
-                            const img = a.querySelector('img[src], img[data-src], video[poster]');
-                            if (!img) return;
-                            seen.add(m[1]);
-                            let thumb = img.src || img.dataset.src || img.poster || '';
-                            clips.push({
-                                clip_id: m[1],
-                                title: (a.getAttribute('aria-label') || a.getAttribute('title') || img.alt || '').trim(),
-                                creator: '',
-                                duration: '',
-                                thumbnail_url: thumb,
-                                source_url: href.startsWith('http') ? href : location.origin + href,
-                            });
-                        });
-                        return clips;
-                    })()
-                """) or []
-                if cards:
-                    self.log(f"  [catalog-cards] Generic DOM extracted {len(cards)} cards", "INFO")
-            except Exception:
-                pass
+                try:
+                    found = await page.evaluate(self.GENERIC_CARDS_SCRIPT) or {}
+                except Exception:
+                    pass
+        if found.get('profile_error'):
+            self.log(f"  [catalog-cards] Profile JS error: {found['profile_error'][:80]}", "WARN")
+        elif found.get('profile_count') is not None:
+            self.log(f"  [catalog-cards] Profile JS extracted {found['profile_count']} cards", "INFO")
+        cards = found.get('cards') or []
+        if cards and found.get('source') != 'profile':
+            label = '__NEXT_DATA__' if found.get('source') == 'next' else 'Generic DOM'
+            self.log(f"  [catalog-cards] {label} extracted {len(cards)} cards", "INFO")
 
         if not cards:
             self.log(f"  [catalog-cards] No cards extracted from catalog page", "DEBUG")
             return 0
 
         # ── Save extracted cards to DB ────────────────────────────────
-        thumb_dir = get_thumbnail_cache_dir()
+        thumb_prefix = self._thumb_path_prefix()
+        # Thumbnails are fetched after the batch commits, not mid-transaction
+        thumb_jobs = []
 
-        for card in cards:
-            if self._stop.is_set():
-                break
-            clip_id = str(card.get('clip_id', '') or '').strip()
-            if not clip_id:
-                continue
+        with self.db.batch():
+            for card in cards:
+                if self._stop.is_set():
+                    break
+                clip_id = str(card.get('clip_id', '') or '').strip()
+                if not clip_id:
+                    continue
 
-            meta = {k: '' for k in ('clip_id','source_url','title','creator','collection',
-                                     'resolution','duration','frame_rate','camera',
-                                     'formats','tags','thumbnail_url','m3u8_url','source_site')}
-            meta['clip_id'] = clip_id
-            meta['source_site'] = self.profile.name
-            # Fill in whatever the card extraction gave us
-            for field in ('title','creator','duration','thumbnail_url','source_url',
-                          'resolution','tags','collection','m3u8_url','frame_rate','camera','formats'):
-                v = str(card.get(field, '') or '').strip()
-                if v:
-                    meta[field] = v
-
-            # Ensure source_url is absolute
-            if meta['source_url'] and not meta['source_url'].startswith('http'):
-                base = urlparse(source_url)
-                meta['source_url'] = f"{base.scheme}://{base.netloc}{meta['source_url']}"
+                meta = _EMPTY_META.copy()
+                meta['clip_id'] = clip_id
+                meta['source_site'] = self.profile.name
+                # Fill in whatever the card extraction gave us
+                meta.update({f: v for f in _CARD_META_FIELDS
+                             if (v := str(card.get(f, '') or '').strip())})
+
+                # Ensure source_url is absolute
+                if meta['source_url'] and not meta['source_url'].startswith('http'):
+                    meta['source_url'] = urljoin(source_url, meta['source_url'])
+
+                if seen_cards is not None:
+                    sig = tuple(meta.values())
+                    if seen_cards.get(clip_id) == sig:
+                        unchanged_count += 1
+                        continue
+                    seen_cards[clip_id] = sig
 
-            is_new = self.db.save_clip(meta)
-            if is_new:
-                new_count += 1
-            else:
-                # Backfill empty fields on existing record
-                self.db.update_metadata(clip_id, meta)
-                updated_count += 1
+                is_new = self.db.save_clip(meta)
+                if is_new:
+                    new_count += 1
+                else:
+                    # Backfill empty fields on existing record
+                    self.db.update_metadata(clip_id, meta)
+                    updated_count += 1
 
-            # Download thumbnail if we have a URL and no local thumb yet
-            thumb_url = meta.get('thumbnail_url', '')
-            if thumb_url:
-                thumb_path = os.path.join(thumb_dir, f"{clip_id}.jpg")
-                if not os.path.isfile(thumb_path) or os.path.getsize(thumb_path) == 0:
-                    self._download_thumb_url(thumb_url, thumb_path, clip_id)
+                # Download thumbnail if we have a URL (skipped off-loop when
+                # a local thumb already exists)
+                thumb_url = meta.get('thumbnail_url', '')
+                if thumb_url:
+                    thumb_jobs.append((thumb_url, f"{thumb_prefix}{clip_id}.jpg", clip_id))
 
+        for job in thumb_jobs:
+            self._schedule_thumb_download(*job)
+
+        if unchanged_count == len(cards):
+            self.log(f"  [catalog-cards] No new cards ({len(cards)} already saved from this page)", "DEBUG")
+            return 0
         self.log(
             f"  [catalog-cards] Saved {new_count} new + {updated_count} updated clips "
             f"({len(cards)} total cards)",
             "OK" if new_count else "INFO")
-        self.stats_signal.emit(self.db.stats())
+        self._emit_stats()
         return new_count + updated_count
 
+    def _thumb_path_prefix(self):
+        """Thumbnail cache dir with a trailing separator, resolved once per
+        worker (get_thumbnail_cache_dir() checks config migration and
+        creates directories on every call)."""
+        if self._thumb_prefix is None:
+            self._thumb_prefix = os.path.join(get_thumbnail_cache_dir(), '')
+        return self._thumb_prefix
+
+    def _schedule_thumb_download(self, url, out_path, clip_id):
+        """Queue a thumbnail download without stalling the crawl loop."""
+        if self._thumb_pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._thumb_pool = ThreadPoolExecutor(
+                max_workers=self._THUMB_CONCURRENCY, thread_name_prefix='thumb-io')
+        fut = asyncio.get_running_loop().run_in_executor(
+            self._thumb_pool, self._fetch_missing_thumb, url, out_path, clip_id)
+        self._pending_thumbs.add(fut)
+        fut.add_done_callback(self._pending_thumbs.discard)
+
+    def _fetch_missing_thumb(self, url, out_path, clip_id):
+        # Runs on the thumb pool: the existence check is disk I/O too
+        if self._stop.is_set():
+            return
+        try:
+            if os.path.getsize(out_path) > 0:
+                return
+        except OSError:
+            pass
+        self._download_thumb_url(url, out_path, clip_id)
+
+    async def _drain_thumb_downloads(self):
+        """Wait for scheduled thumbnail downloads, then release the pool."""
+        if self._pending_thumbs:
+            await asyncio.gather(*list(self._pending_thumbs), return_exceptions=True)
+        pool, self._thumb_pool = self._thumb_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+        self._thumb_http.close()
+
     def _download_thumb_url(self, url, out_path, clip_id):
-        """Download a thumbnail URL to disk. Non-blocking (runs in crawl thread)."""
+        """Download a thumbnail URL to disk. Blocking; crawl code schedules it
+        on the thumb pool via _schedule_thumb_download."""
         try:
-            import urllib.request
-            req = urllib.request.Request(url)
-            req.add_header('User-Agent', 'Mozilla/5.0')
-            resp = _safe_urlopen(req, timeout=10)
-            data = resp.read(2_000_000)  # cap at 2MB
-            resp.close()
-            if len(data) > 500:
+            status, _, data = self._thumb_http.request(
+                'GET', url, {'User-Agent': 'Mozilla/5.0'}, timeout=10, max_size=2_000_000)
+            if status < 400 and len(data) > 500:
                 with open(out_path, 'wb') as f:
                     f.write(data)
                 self.db.update_thumb_path(clip_id, out_path)
@@ -5164,83 +6029,105 @@ class CrawlerWorker(QThread):
             if 'json' not in ct:
                 return
             rt = response.request.resource_type
-            if rt not in ('xhr', 'fetch'):
+            if rt not in _API_RESOURCE_TYPES:
+                return
+            if _NON_CLIP_ENDPOINT_RE.search(url):
+                return
+            # Trust a declared size so oversized/empty payloads are never
+            # downloaded; without one, fetch and check the real length.
+            try:
+                cl = int(response.headers.get('content-length', '0') or 0)
+            except ValueError:
+                cl = 0
+            if cl and not _CATALOG_BODY_MIN <= cl <= _CATALOG_BODY_MAX:
                 return
-            # Only process reasonably-sized JSON (skip huge payloads)
-            cl = int(response.headers.get('content-length', '0') or 0)
-            if cl > 5_000_000 or cl == 0:
-                pass  # Unknown size, try anyway (but cap read)
 
-            body = await response.text()
-            if len(body) < 50 or len(body) > 5_000_000:
+            body = await response.body()
+            if not _CATALOG_BODY_MIN <= len(body) <= _CATALOG_BODY_MAX:
+                return
+            # Most JSON on catalog pages (config, analytics, i18n) has no clip
+            # IDs at all; skip decoding it.
+            if not _CATALOG_CLIP_ID_HINT_RE.search(body):
                 return
 
-            data = json.loads(body)
+            data = _json_loads(body)
 
-            # Walk the JSON for clip-like objects
+            # Walk the JSON for clip-like objects (iteratively — API payloads
+            # can be deep, and most nodes are not clips)
             clips_found = 0
-            thumb_dir = get_thumbnail_cache_dir()
+            thumb_prefix = self._thumb_path_prefix()
+            save_clip = self.db.save_clip
+            update_metadata = self.db.update_metadata
+            source_site = self.profile.name
+            thumb_jobs = []
+            stack = [data]
+            pop, push = stack.pop, stack.extend
+
+            with self.db.batch():
+                while stack:
+                    obj = pop()
+                    t = type(obj)
+                    if t is list:
+                        push(reversed(obj))
+                        continue
+                    if t is not dict:
+                        continue
+                    # Check if this looks like a clip object
+                    if not _CATALOG_CLIP_ID_KEYS.isdisjoint(obj):
+                        cid = str(obj.get('id', '') or obj.get('clipId', '') or obj.get('clip_id', '') or '')
+                    else:
+                        cid = ''
+                    if cid and _NUMID_RE.match(cid):
+                        meta = _EMPTY_META.copy()
+                        meta['clip_id'] = cid
+                        meta['source_site'] = source_site
+                        meta['title'] = str(obj.get('title', '') or obj.get('name', '') or '')
+                        meta['creator'] = str(obj.get('artistName', '') or obj.get('artist', {}).get('name', '') if isinstance(obj.get('artist'), dict) else obj.get('artist', '') or obj.get('creatorName', '') or '')
+                        meta['duration'] = str(obj.get('duration', '') or obj.get('length', '') or '')
+                        meta['thumbnail_url'] = str(obj.get('thumbnailUrl', '') or obj.get('thumbnail', '') or obj.get('imageUrl', '') or obj.get('posterUrl', '') or '')
+                        meta['resolution'] = str(obj.get('resolution', '') or '')
+                        meta['frame_rate'] = str(obj.get('fps', '') or obj.get('frameRate', '') or '')
+                        meta['camera'] = str(obj.get('camera', '') or obj.get('cameraModel', '') or '')
+                        meta['collection'] = str(obj.get('collectionName', '') or '')
+
+                        # Tags
+                        # json.loads only yields exact list/dict, so type() is enough
+                        tags = obj.get('tags', '')
+                        if type(tags) is list:
+                            tags = ', '.join([str(t.get('name', '')) if type(t) is dict else str(t)
+                                              for t in tags[:25]])
+                        meta['tags'] = str(tags or '')
+
+                        # Video URL
+                        for vk in ('videoUrl', 'hlsUrl', 'm3u8Url', 'previewUrl', 'contentUrl'):
+                            v = str(obj.get(vk, '') or '')
+                            if v and ('m3u8' in v or 'mp4' in v):
+                                meta['m3u8_url'] = v
+                                break
 
-            def _walk(obj):
-                nonlocal clips_found
-                if isinstance(obj, list):
-                    for item in obj:
-                        _walk(item)
-                    return
-                if not isinstance(obj, dict):
-                    return
-                # Check if this looks like a clip object
-                cid = str(obj.get('id', '') or obj.get('clipId', '') or obj.get('clip_id', '') or '')
-                if cid and re.match(r'^\d{4,}$', cid):
-                    meta = {k: '' for k in ('clip_id','source_url','title','creator','collection',
-                                             'resolution','duration','frame_rate','camera',
-                                             'formats','tags','thumbnail_url','m3u8_url','source_site')}
-                    meta['clip_id'] = cid
-                    meta['source_site'] = self.profile.name
-                    meta['title'] = str(obj.get('title', '') or obj.get('name', '') or '')
-                    meta['creator'] = str(obj.get('artistName', '') or obj.get('artist', {}).get('name', '') if isinstance(obj.get('artist'), dict) else obj.get('artist', '') or obj.get('creatorName', '') or '')
-                    meta['duration'] = str(obj.get('duration', '') or obj.get('length', '') or '')
-                    meta['thumbnail_url'] = str(obj.get('thumbnailUrl', '') or obj.get('thumbnail', '') or obj.get('imageUrl', '') or obj.get('posterUrl', '') or '')
-                    meta['resolution'] = str(obj.get('resolution', '') or '')
-                    meta['frame_rate'] = str(obj.get('fps', '') or obj.get('frameRate', '') or '')
-                    meta['camera'] = str(obj.get('camera', '') or obj.get('cameraModel', '') or '')
-                    meta['collection'] = str(obj.get('collectionName', '') or '')
-
-                    # Tags
-                    tags = obj.get('tags', '')
-                    if isinstance(tags, list):
-                        tags = ', '.join(str(t.get('name', '') if isinstance(t, dict) else t) for t in tags[:25])
-                    meta['tags'] = str(tags or '')
-
-                    # Video URL
-                    for vk in ('videoUrl', 'hlsUrl', 'm3u8Url', 'previewUrl', 'contentUrl'):
-                        v = str(obj.get(vk, '') or '')
-                        if v and ('m3u8' in v or 'mp4' in v):
-                            meta['m3u8_url'] = v
-                            break
+                        # Source URL
+                        meta['source_url'] = str(obj.get('url', '') or obj.get('pageUrl', '') or '')
 
-                    # Source URL
-                    meta['source_url'] = str(obj.get('url', '') or obj.get('pageUrl', '') or '')
+                        is_new = save_clip(meta)
+                        if is_new:
+                            clips_found += 1
+                        else:
+                            update_metadata(cid, meta)
 
-                    is_new = self.db.save_clip(meta)
-                    if is_new:
-                        clips_found += 1
-                    else:
-                        self.db.update_metadata(cid, meta)
+                        # Download thumbnail (after the batch commits)
+                        if meta['thumbnail_url']:
+                            thumb_jobs.append((meta['thumbnail_url'],
+                                               f"{thumb_prefix}{cid}.jpg", cid))
 
-                    # Download thumbnail
-                    if meta['thumbnail_url']:
-                        tp = os.path.join(thumb_dir, f"{cid}.jpg")
-                        if not os.path.isfile(tp):
-                            self._download_thumb_url(meta['thumbnail_url'], tp, cid)
+                    # Reversed so children are visited in document order
+                    push(reversed(obj.values()))
 
-                for v in obj.values():
-                    _walk(v)
+            for job in thumb_jobs:
+                self._schedule_thumb_download(*job)
 
-            _walk(data)
             if clips_found:
                 self.log(f"  [catalog-api] Intercepted {clips_found} new clips from API: {url[:70]}", "M3U8")
-                self.stats_signal.emit(self.db.stats())
+                self._emit_stats()
 
         except json.JSONDecodeError:
             pass
@@ -5255,28 +6142,40 @@ class CrawlerWorker(QThread):
         After extracting metadata + video URLs, scrolls to bottom to discover
         Related/Similar clip links — creating exponential link growth.
         """
-        _pre_id = re.search(r'/(\d{4,})(?:/|$)', url)
+        _pre_id = _CLIP_ID_RE.search(url)
         clip_id_preview = _pre_id.group(1) if _pre_id else '?'
         self.log(f"CLIP    [d{depth}] id:{clip_id_preview} {url}", "INFO")
 
-        clip_meta = {k: '' for k in ('clip_id','source_url','title','creator','collection',
-                                       'resolution','duration','frame_rate','camera',
-                                       'formats','tags','thumbnail_url','m3u8_url','source_site')}
+        clip_meta = _EMPTY_META.copy()
         clip_meta['source_url'] = url
         clip_meta['source_site'] = self.profile.name
         if _pre_id:
             clip_meta['clip_id'] = _pre_id.group(1)
+            # A mark left by an earlier visit must not skip this page's scan
+            self._hls_intercepted.discard(clip_meta['clip_id'])
 
-        page = await context.new_page()
+        page, page_uses = await self._acquire_clip_page(context)
         trace_state = await self._start_trace_bundle(context, page, url, depth, 'clip')
+        profile = self.profile
+
+        video_re = self._video_re
+
+        async def clip_response(resp):
+            # Playwright dispatches handlers outside this batch's task.
+            self.profile = profile
+            try:
+                await self._on_response(resp, url, clip_meta)
+            except Exception as e:
+                err = str(e)
+                if not any(x in err for x in ('Target closed', 'disposed', 'Connection')):
+                    self.log(f"Resp handler error: {err[:80]}", "DEBUG")
+
+        on_resp = self._filtered_response_handler(
+            url, clip_response,
+            lambda resp: (resp.request.resource_type in _API_RESOURCE_TYPES
+                          or video_re.search(resp.url) is not None))
+
         try:
-            async def on_resp(resp):
-                try:
-                    await self._on_response(resp, url, clip_meta)
-                except Exception as e:
-                    err = str(e)
-                    if not any(x in err for x in ('Target closed', 'disposed', 'Connection')):
-                        self.log(f"Resp handler error: {err[:80]}", "DEBUG")
             page.on('response', on_resp)
 
             self.log(f"  [1/6] Loading page...", "DEBUG")
@@ -5328,8 +6227,9 @@ class CrawlerWorker(QThread):
 
             # Scan page HTML for video URLs
             self.log(f"  [4/6] Scanning page source for video URLs...", "DEBUG")
-            await self._scan_page_source(page, url, clip_meta)
-            await self._collect_js_m3u8s(page, url, clip_meta)
+            scan = await self._page_scan_snapshot(page)
+            await self._scan_page_source(scan, url, clip_meta)
+            await self._collect_js_m3u8s(scan, url, clip_meta)
 
             # Scroll down to expose Related/Similar sections
             self.log(f"  [5/6] Scrolling for related content...", "DEBUG")
@@ -5339,26 +6239,26 @@ class CrawlerWorker(QThread):
             # Extract all links from the clip page
             self.log(f"  [6/6] Extracting links...", "DEBUG")
             links = await self._extract_links(page)
-            queued = 0
+            # Normalize + dedup (first occurrence wins), then classify
+            uniq = [n for n in dict.fromkeys(filter(None, map(self._normalize_url, links)))
+                    if n != url]
+            norms = [n for n in uniq if not self._is_excluded(n)]
+            skipped_excluded = len(uniq) - len(norms)
+            clip_norms = [n for n in norms if self._is_clip(n)]
+            cat_norms = []
+            if depth < self.cfg.get('max_depth', 2):
+                cat_norms = [n for n in norms if not self._is_clip(n) and self._is_catalog(n)]
             skipped_processed = 0
-            skipped_excluded = 0
-            seen = set()
-            resume = self.cfg.get('resume', True)
-            for link in links:
-                norm = self._normalize_url(link)
-                if not norm or norm in seen: continue
-                if norm == url: continue
-                seen.add(norm)
-                if self._is_excluded(norm):
-                    skipped_excluded += 1; continue
-                if self._is_clip(norm):
-                    if resume and self.db.is_processed(norm):
-                        skipped_processed += 1; continue
-                    self.db.enqueue(norm, depth+1, 10, profile=self.profile.name)
-                    queued += 1
-                elif self._is_catalog(norm) and depth < self.cfg.get('max_depth', 2):
-                    if not (resume and self.db.is_processed(norm)):
-                        self.db.enqueue(norm, depth+1, 5, profile=self.profile.name)
+            if self.cfg.get('resume', True):
+                done = self.db.is_processed_many(clip_norms + cat_norms)
+                fresh_clips = [n for n in clip_norms if n not in done]
+                skipped_processed = len(clip_norms) - len(fresh_clips)
+                clip_norms = fresh_clips
+                cat_norms = [n for n in cat_norms if n not in done]
+            queued = len(clip_norms)
+            prof_name = self.profile.name
+            self.db.enqueue_many([(n, depth+1, 10, prof_name) for n in clip_norms] +
+                                 [(n, depth+1, 5, prof_name) for n in cat_norms])
 
             # Persist final state
             if clip_meta.get('clip_id'):
@@ -5376,7 +6276,7 @@ class CrawlerWorker(QThread):
                 _fresh = self.db.execute(
                     "SELECT * FROM clips WHERE clip_id=?", (clip_meta['clip_id'],)).fetchone()
                 if _fresh and _fresh['m3u8_url']:
-                    _emit_data = dict(zip(_fresh.keys(), tuple(_fresh)))
+                    _emit_data = _row_to_dict(_fresh)
                     self.clip_signal.emit(_emit_data)
 
             # ── Final summary log ─────────────────────────────────────────
@@ -5393,7 +6293,7 @@ class CrawlerWorker(QThread):
                 f"{'VIDEO OK' if has_video else 'NO VIDEO'} "
                 f"+{queued} queued ({skipped_processed} already done, {skipped_excluded} excluded)",
                 "OK" if has_video else "WARN")
-            self.stats_signal.emit(self.db.stats())
+            self._emit_stats()
             await self._finish_trace_bundle(trace_state, failed=False)
             trace_state = None
 
@@ -5406,14 +6306,82 @@ class CrawlerWorker(QThread):
             self.db.mark_failed(url, depth)
         finally:
             try:
-                await page.close()
-            except (Exception) as e:
-                if 'Target closed' not in str(e) and 'disposed' not in str(e):
-                    self.log(f"Page close error: {e}", "DEBUG")
+                page.remove_listener('response', on_resp)
+            except Exception:
+                pass
+            # Marks only apply to this navigation (the scan may not have run)
+            self._hls_intercepted.discard(clip_meta.get('clip_id', ''))
+            if _pre_id:
+                self._hls_intercepted.discard(_pre_id.group(1))
+            await self._release_clip_page(page, page_uses + 1)
+
+    async def _acquire_clip_page(self, context):
+        """Return an idle pooled tab (or a new one) and its navigation count."""
+        while self._clip_pages:
+            page, uses = self._clip_pages.pop()
+            if not page.is_closed():
+                return page, uses
+        return await context.new_page(), 0
+
+    async def _release_clip_page(self, page, uses):
+        """Return a clip tab to the pool, or close it once it is worn out."""
+        pool_limit = max(1, int(self.cfg.get('max_concurrent_pages', 4) or 1))
+        if (not page.is_closed() and uses < self._CLIP_PAGE_MAX_USES
+                and not self._stop.is_set() and len(self._clip_pages) < pool_limit):
+            self._clip_pages.append([page, uses])
+            return
+        await self._close_page(page)
+
+    async def _close_clip_pages(self):
+        pages, self._clip_pages = self._clip_pages, []
+        for page, _uses in pages:
+            await self._close_page(page)
+
+    async def _close_page(self, page):
+        try:
+            await page.close()
+        except (Exception) as e:
+            if 'Target closed' not in str(e) and 'disposed' not in str(e):
+                self.log(f"Page close error: {e}", "DEBUG")
+
+    # Everything _scan_page_source and _collect_js_m3u8s read, in one CDP
+    # round-trip. The HTML regexes run inside the page over the same markup
+    # page.content() would serialize, so only the matches cross CDP. The
+    # video pattern mirrors SiteProfile.get_combined_video_re().
+    PAGE_SCAN_SCRIPT = """
+        ({exts}) => {
+            const root = document.documentElement;
+            const html = root ? root.outerHTML : '';
+            const videoRe = new RegExp(
+                'https?://[^\\\\s"\\'<>]+\\\\.(?:' + exts + ')(?:\\\\?[^\\\\s"\\'<>]*)?', 'gi');
+            if (window.__flushInterceptedVideoUrls__) window.__flushInterceptedVideoUrls__();
+            const canvaRe = /file-url=(https?%3A%2F%2F[^&"'<>\\s]+\\.mp4[^&"'<>\\s]*)/g;
+            return {
+                html: html.match(videoRe) || [],
+                dom: [...document.querySelectorAll('video[src], source[src], video source[src]')]
+                    .map(el => el.src || el.getAttribute('src') || el.getAttribute('data-src') || '')
+                    .filter(s => s && s.startsWith('http')),
+                canva: Array.from(html.matchAll(canvaRe), m => m[1]),
+                // Trimmed strings, so the Python side needs no per-URL cleanup
+                intercepted: Array.from(window.__interceptedVideoUrls__ || [], u => String(u).trim()),
+            };
+        }
+    """
 
-    async def _scan_page_source(self, page, source_url, clip_meta):
+    async def _page_scan_snapshot(self, page):
+        """Run PAGE_SCAN_SCRIPT; an empty dict if the page can't be read."""
+        try:
+            return await page.evaluate(self.PAGE_SCAN_SCRIPT, {
+                'exts': '|'.join(self.profile.video_types),
+            }) or {}
+        except Exception as e:
+            self.log(f"  [scan] Error: {e}", "WARN")
+            return {}
+
+    async def _scan_page_source(self, scan, source_url, clip_meta):
         """
-        Scan page HTML for video URLs using multiple strategies:
+        Scan page HTML for video URLs (from a _page_scan_snapshot() result)
+        using multiple strategies:
         1. Regex match all video URLs in raw HTML
         2. Extract src/data-src from <video> and <source> DOM elements
         3. Extract HD/UHD MP4s from Canva partner links (Pexels-specific)
@@ -5423,25 +6391,25 @@ class CrawlerWorker(QThread):
         to avoid capturing SD previews for 150+ related videos on the same page.
         """
         try:
-            html = await page.content()
             current_clip_id = clip_meta.get('clip_id', '')
+            if current_clip_id in self._hls_intercepted:
+                # An HLS-only page scan can only turn up more manifests, which
+                # carry no clip id and are mostly related clips' previews
+                self._hls_intercepted.discard(current_clip_id)
+                self.log(f"  [scan] id:{current_clip_id} manifest already intercepted — skipping", "DEBUG")
+                return
             found_urls = set()
 
             # ── Strategy 1: Regex scan raw HTML ──────────────────────────
-            regex_hits = self._video_re.findall(html)
+            regex_hits = scan.get('html') or []
             for m in regex_hits:
                 found_urls.add(m.strip())
             if regex_hits:
                 self.log(f"  [scan] HTML regex: {len(regex_hits)} video URLs in source", "DEBUG")
 
             # ── Strategy 2: DOM video/source elements ────────────────────
-            vid_srcs = await page.evaluate("""
-                [...document.querySelectorAll('video[src], source[src], video source[src]')]
-                    .map(el => el.src || el.getAttribute('src') || el.getAttribute('data-src') || '')
-                    .filter(s => s && s.startsWith('http'))
-            """)
             dom_count = 0
-            for src in (vid_srcs or []):
+            for src in (scan.get('dom') or []):
                 if self._video_re.search(src):
                     found_urls.add(src.strip())
                     dom_count += 1
@@ -5449,10 +6417,8 @@ class CrawlerWorker(QThread):
                 self.log(f"  [scan] DOM elements: {dom_count} video src attributes", "DEBUG")
 
             # ── Strategy 3: Canva partner links (Pexels HD/UHD) ──────────
-            canva_urls = re.findall(
-                r'file-url=(https?%3A%2F%2F[^&"\'<>\s]+\.mp4[^&"\'<>\s]*)', html)
             canva_count = 0
-            for encoded in canva_urls:
+            for encoded in (scan.get('canva') or []):
                 decoded = unquote(encoded)
                 if self._video_re.search(decoded):
                     found_urls.add(decoded)
@@ -5460,43 +6426,50 @@ class CrawlerWorker(QThread):
             if canva_count:
                 self.log(f"  [scan] Canva partner links: {canva_count} HD/UHD MP4s", "DEBUG")
 
-            # ── Group by video ID and filter ─────────────────────────────
-            by_vid_id = {}
+            # ── Group by video ID, keeping each group's best quality ─────
+            # vid_id -> [url_count, best_score, best_url]; max() semantics:
+            # the first URL with the top score wins
+            groups = {}
             for u in found_urls:
-                vid_m = re.search(r'/video-files/(\d+)/', u)
-                vid_id = vid_m.group(1) if vid_m else '__unknown__'
-                by_vid_id.setdefault(vid_id, []).append(u)
+                vid_id, _, score = _parse_video_url(u)
+                if not vid_id:
+                    vid_id = '__unknown__'
+                group = groups.get(vid_id)
+                if group is None:
+                    groups[vid_id] = [1, score, u]
+                else:
+                    group[0] += 1
+                    if score > group[1]:
+                        group[1], group[2] = score, u
 
-            total_ids = len(by_vid_id)
+            total_ids = len(groups)
 
             # On clip pages: only record URLs matching our clip's video ID
             # This prevents capturing SD preview MP4s for 150+ related videos
-            if current_clip_id and current_clip_id in by_vid_id:
-                my_urls = by_vid_id[current_clip_id]
+            if current_clip_id and current_clip_id in groups:
+                n_mine, _, best = groups[current_clip_id]
                 skipped = total_ids - 1
                 self.log(
                     f"  [scan] Total: {len(found_urls)} URLs across {total_ids} video IDs. "
-                    f"Filtering to clip id:{current_clip_id} ({len(my_urls)} URLs, "
+                    f"Filtering to clip id:{current_clip_id} ({n_mine} URLs, "
                     f"skipped {skipped} other videos' previews)",
                     "INFO")
-                best = self._pick_best_quality(my_urls)
-                if len(my_urls) > 1:
+                if n_mine > 1:
                     self.log(
-                        f"  [scan] id:{current_clip_id} — {len(my_urls)} qualities, "
+                        f"  [scan] id:{current_clip_id} — {n_mine} qualities, "
                         f"best: {best.split('/')[-1][:60]}",
                         "DEBUG")
                 await self._record_video_url(best, source_url, clip_meta)
             elif current_clip_id:
                 # Clip ID not in any video URL — common for sites like Artlist
                 # where HLS URLs don't encode the clip ID.
-                unknown_urls = by_vid_id.get('__unknown__', [])
-                if total_ids == 1 and len(unknown_urls) <= 3:
+                n_unknown, _, best = groups.get('__unknown__', (0, 0, ''))
+                if total_ids == 1 and n_unknown <= 3:
                     # Only __unknown__ group with very few URLs → likely our clip
                     self.log(
-                        f"  [scan] {len(unknown_urls)} untagged URL(s) — "
+                        f"  [scan] {n_unknown} untagged URL(s) — "
                         f"assuming clip id:{current_clip_id}",
                         "DEBUG")
-                    best = self._pick_best_quality(unknown_urls)
                     await self._record_video_url(best, source_url, clip_meta)
                 else:
                     # Many URLs without clip ID → related video previews.
@@ -5513,71 +6486,80 @@ class CrawlerWorker(QThread):
                     f"  [scan] No clip ID filter — recording {total_ids} unique videos "
                     f"({len(found_urls)} total URLs)",
                     "INFO")
-                for vid_id, urls in by_vid_id.items():
-                    best = self._pick_best_quality(urls)
-                    await self._record_video_url(best, source_url, clip_meta)
+                # One transaction for the whole page, not one commit per video
+                with self.db.batch():
+                    for _, _, best in groups.values():
+                        await self._record_video_url(best, source_url, clip_meta)
 
         except Exception as e:
             self.log(f"  [scan] Error: {e}", "WARN")
 
-    @staticmethod
-    def _pick_best_quality(urls):
-        """Pick highest resolution video URL from a list of the same video."""
-        if len(urls) <= 1:
-            return urls[0] if urls else ''
-        def _score(u):
-            # uhd > hd > sd; higher resolution = higher score
-            m = re.search(r'(\d{3,4})_(\d{3,4})_(\d+)fps', u)
-            if m:
-                w, h = int(m.group(1)), int(m.group(2))
-                return max(w, h)
-            if 'uhd' in u: return 3000
-            if '-hd_' in u: return 1500
-            if '-sd_' in u: return 500
-            return 100
-        return max(urls, key=_score)
-
     VIDEO_INTERCEPT_SCRIPT = """
         (function() {
             var VIDEO_EXTS = /\\.(m3u8|mp4|webm|mpd|m3u|mov)(\\?|$)/i;
-            window.__interceptedVideoUrls__ = window.__interceptedVideoUrls__ || [];
+            // A Set, so repeated requests/nodes for one URL don't pile up
+            var seen = window.__interceptedVideoUrls__ = window.__interceptedVideoUrls__ || new Set();
             // Intercept XMLHttpRequest
             var _XHRopen = XMLHttpRequest.prototype.open;
             XMLHttpRequest.prototype.open = function(method, url) {
-                if (typeof url === 'string' && VIDEO_EXTS.test(url)) {
-                    window.__interceptedVideoUrls__.push(url);
-                }
+                if (typeof url === 'string' && VIDEO_EXTS.test(url)) seen.add(url);
                 return _XHRopen.apply(this, arguments);
             };
             // Intercept fetch()
             var _fetch = window.fetch;
             window.fetch = function(input) {
                 var url = typeof input === 'string' ? input : (input && input.url) || '';
-                if (VIDEO_EXTS.test(url)) {
-                    window.__interceptedVideoUrls__.push(url);
-                }
+                if (VIDEO_EXTS.test(url)) seen.add(url);
                 return _fetch.apply(this, arguments);
             };
-            // Observe <video>/<source> src changes
-            var mo = new MutationObserver(function(muts) {
-                muts.forEach(function(m) {
+            // Observe added <video>/<source> nodes and src/data-src changes on
+            // existing ones (players often set src after mount). Mutation
+            // bursts (lazy-loaded grids) are queued and scanned once per
+            // animation frame, or by a timer where frames don't run
+            // (background tabs).
+            var MEDIA = 'video[src], source[src], video[data-src], source[data-src]';
+            var MEDIA_TAG = /^(VIDEO|SOURCE)$/;
+            var queue = [];
+            function addMedia(el) {
+                var s = el.src || el.getAttribute('src') || el.getAttribute('data-src') || '';
+                if (s && s.startsWith('http')) seen.add(s);
+            }
+            function flush() {
+                var batch = queue;
+                queue = [];
+                batch.forEach(function(m) {
+                    if (m.type === 'attributes') {
+                        if (MEDIA_TAG.test(m.target.nodeName)) addMedia(m.target);
+                        return;
+                    }
                     m.addedNodes.forEach(function(n) {
                         if (!n.querySelectorAll) return;
-                        n.querySelectorAll('video[src], source[src], video source[src]').forEach(function(el) {
-                            var s = el.src || el.getAttribute('src') || '';
-                            if (s && s.startsWith('http')) window.__interceptedVideoUrls__.push(s);
-                        });
+                        if (MEDIA_TAG.test(n.nodeName)) addMedia(n);
+                        n.querySelectorAll(MEDIA).forEach(addMedia);
                     });
                 });
+            }
+            // Readers call this first so a pending frame's nodes aren't missed
+            window.__flushInterceptedVideoUrls__ = flush;
+            var mo = new MutationObserver(function(muts) {
+                if (!queue.length) {
+                    requestAnimationFrame(flush);
+                    setTimeout(flush, 250);  // whichever fires first drains the queue
+                }
+                for (var i = 0; i < muts.length; i++) queue.push(muts[i]);
+            });
+            // document.body doesn't exist yet when init scripts run
+            mo.observe(document.documentElement, {
+                childList: true, subtree: true,
+                attributes: true, attributeFilter: ['src', 'data-src'],
             });
-            mo.observe(document.documentElement, {childList:true, subtree:true});
         })();
     """
 
     async def _safe_goto(self, page, url):
         timeout = self.cfg.get('timeout', 30000)
-        # Inject XHR/fetch interceptor + stealth BEFORE any page JS runs.
-        await page.add_init_script(self.VIDEO_INTERCEPT_SCRIPT)
+        # The XHR/fetch interceptor + stealth init scripts are installed on
+        # the browser context at launch, so they run before any page JS.
 
         # domcontentloaded is the only safe wait_until for Next.js SPAs.
         try:
@@ -5587,6 +6569,7 @@ class CrawlerWorker(QThread):
                 return False
             response = await page.goto(url, wait_until='domcontentloaded', timeout=timeout)
             if response:
+                self._nav_status.set(getattr(response, 'status', 0) or 0)
                 self._observe_crawl_budget_response(
                     response.url, url, getattr(response, 'status', 0), response.headers)
             return True
@@ -5601,10 +6584,27 @@ class CrawlerWorker(QThread):
             self.log(f"goto failed: {err[:120]}", "ERROR")
             return False
 
+    # Scroll to a fraction of the page and report [page height, intercepted
+    # video URL count], so each step can tell whether anything new loaded
+    SCROLL_STEP_SCRIPT = """
+        (progress) => {
+            const height = document.documentElement.scrollHeight;
+            window.scrollTo(0, height * progress);
+            const seen = window.__interceptedVideoUrls__;
+            return [height, seen ? seen.size : 0];
+        }
+    """
+
+    # Scroll steps (after the first few) with no new height or video URLs
+    # before _scroll_to_bottom stops early
+    _SCROLL_STABLE_STEPS = 2
+
     async def _scroll_to_bottom(self, page):
         steps = self.cfg.get('scroll_steps', 15)
         base_delay = self.cfg.get('scroll_delay', 800) / 1000
         progress = 0.0
+        last_state = None
+        stable = 0
         for i in range(steps):
             if self._stop.is_set(): break
             # Variable scroll increments — sometimes big, sometimes small
@@ -5613,7 +6613,12 @@ class CrawlerWorker(QThread):
             # Occasional tiny scroll-back (human behavior)
             if random.random() < 0.1 and progress > 0.15:
                 progress -= random.uniform(0.02, 0.05)
-            await page.evaluate(f"window.scrollTo(0, document.documentElement.scrollHeight * {progress})")
+            state = await page.evaluate(self.SCROLL_STEP_SCRIPT, progress)
+            # The page stopped growing and no new video requests fired
+            stable = stable + 1 if state == last_state else 0
+            last_state = state
+            if stable >= self._SCROLL_STABLE_STEPS and i > 3:
+                break
             # Variable delays — humans don't scroll at fixed intervals
             delay = base_delay * random.uniform(0.5, 1.8)
             # Occasional longer pause (reading something)
@@ -5624,60 +6629,94 @@ class CrawlerWorker(QThread):
         await page.evaluate("window.scrollTo(0, document.documentElement.scrollHeight)")
         await asyncio.sleep(base_delay * random.uniform(1.0, 2.5))
 
+    # Hover events go to the innermost matching elements only: they bubble,
+    # so matching ancestors (card > preview > player) still receive them, and
+    # dispatch is spread over idle slices instead of one long main-thread task.
+    # Each slice hovers at least MIN_BATCH elements (a timed-out idle callback
+    # reports no time left), and whatever is left once budgetMs has passed is
+    # hovered at once, so every player is hovered well inside the m3u8 wait.
+    PLAYER_TRIGGER_SCRIPT = """
+        (budgetMs) => {
+            const SEL = 'video, [class*="clip"], [class*="video"], [class*="preview"], [class*="player"]';
+            const EVENTS = ['mouseenter', 'mouseover', 'pointermove', 'focus'];
+            const els = document.querySelectorAll(SEL);
+            const covered = new Set();
+            els.forEach(el => {
+                const outer = el.parentElement && el.parentElement.closest(SEL);
+                if (outer) covered.add(outer);
+            });
+            const targets = Array.prototype.filter.call(els, el => !covered.has(el));
+
+            // Step 1: Hover clip/video containers to trigger lazy init
+            const idle = window.requestIdleCallback || (cb => setTimeout(() => cb({timeRemaining: () => 8}), 0));
+            const MIN_BATCH = 20;
+            const started = performance.now();
+            let i = 0;
+            const hover = deadline => {
+                const rushed = performance.now() - started >= budgetMs;
+                let n = 0;
+                do {
+                    const el = targets[i++];
+                    EVENTS.forEach(evt =>
+                        el.dispatchEvent(new MouseEvent(evt, {bubbles: true, cancelable: true})));
+                    n++;
+                } while (i < targets.length
+                         && (rushed || n < MIN_BATCH || deadline.timeRemaining() > 1));
+                if (i < targets.length) idle(hover, {timeout: 100});
+            };
+            if (targets.length) idle(hover, {timeout: 100});
+
+            // Step 2: Force every <video> to load + play
+            // HLS.js attaches to <video> and requests the M3U8 when play() is called.
+            document.querySelectorAll('video').forEach(v => {
+                try {
+                    // Remove muted restriction so autoplay works
+                    v.muted = true;
+                    v.preload = 'auto';
+                    if (v.readyState === 0) v.load();
+                    v.play().catch(() => {});
+                } catch(e) {}
+            });
+
+            // Step 3: Scroll to any video element to trigger IntersectionObserver-based lazy loaders
+            const firstVideo = document.querySelector('video');
+            if (firstVideo) firstVideo.scrollIntoView({block: 'center', behavior: 'instant'});
+            return targets.length;
+        }
+    """
+
     async def _trigger_players(self, page):
         """Force HLS.js to initialize and request the M3U8 manifest."""
         try:
-            await page.evaluate("""
-                // Step 1: Hover all clip/video containers to trigger lazy init
-                document.querySelectorAll(
-                    'video, [class*="clip"], [class*="video"], [class*="preview"], [class*="player"]'
-                ).forEach(el => {
-                    ['mouseenter','mouseover','pointermove','focus'].forEach(evt =>
-                        el.dispatchEvent(new MouseEvent(evt, {bubbles:true, cancelable:true}))
-                    );
-                });
-
-                // Step 2: Force every <video> to load + play
-                // HLS.js attaches to <video> and requests the M3U8 when play() is called.
-                document.querySelectorAll('video').forEach(v => {
-                    try {
-                        // Remove muted restriction so autoplay works
-                        v.muted = true;
-                        v.preload = 'auto';
-                        if (v.readyState === 0) v.load();
-                        v.play().catch(() => {});
-                    } catch(e) {}
-                });
-
-                // Step 3: Scroll to any video element to trigger IntersectionObserver-based lazy loaders
-                const firstVideo = document.querySelector('video');
-                if (firstVideo) firstVideo.scrollIntoView({block:'center', behavior:'instant'});
-            """)
+            # Hovering must finish in the first quarter of the m3u8 dwell
+            budget_ms = max(0, int(self.cfg.get('m3u8_wait', 4000) or 0)) // 4
+            await page.evaluate(self.PLAYER_TRIGGER_SCRIPT, budget_ms)
         except Exception as e:
             self.log(f"Player trigger error: {str(e)[:80]}", "DEBUG")
 
-    async def _collect_js_m3u8s(self, page, source_url, clip_meta):
-        """Read any video URLs captured by our XHR/fetch/DOM interceptor script."""
+    async def _collect_js_m3u8s(self, scan, source_url, clip_meta):
+        """Record video URLs captured by our XHR/fetch/DOM interceptor script
+        (the page scan snapshot's 'intercepted' list)."""
         try:
-            urls = await page.evaluate("window.__interceptedVideoUrls__ || []")
+            urls = scan.get('intercepted') or []
             current_id = clip_meta.get('clip_id', '')
             recorded = 0
             skipped = 0
             unverifiable = 0
-            for u in urls:
-                if u and isinstance(u, str):
-                    u = u.strip()
-                    if not self._video_re.search(u):
+            is_video = self._video_re.search
+            with self.db.batch():
+                for u in urls:
+                    if not is_video(u):
                         continue
                     # Filter: only record URLs matching current clip's video ID
                     if current_id:
-                        vid_m = re.search(r'/video-files/(\d+)/', u)
-                        if vid_m and vid_m.group(1) != current_id:
-                            skipped += 1
-                            continue
-                        if not vid_m:
+                        vid_id = _parse_video_url(u)[0]
+                        if not vid_id:
                             unverifiable += 1
                             continue  # Can't verify ownership — skip
+                        if vid_id != current_id:
+                            skipped += 1
+                            continue
                     await self._record_video_url(u, source_url, clip_meta)
                     recorded += 1
             if recorded or skipped or unverifiable:
@@ -5735,6 +6774,27 @@ class DirectScrapeWorker(QThread):
         'Accept-Encoding': 'gzip, deflate',
     }
 
+    # Thumbnail downloads in flight per ingest batch
+    _THUMB_CONCURRENCY = 16
+    # Clip-ID probes in flight at once (paced to ~10 req/sec overall)
+    _PROBE_WINDOW = 10
+    # _http_get retries these transient statuses (GETs are idempotent), up to
+    # _HTTP_RETRIES times with exponential backoff or the server's Retry-After
+    _HTTP_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    _HTTP_RETRIES = 3
+    # Clip-ID probes get one short retry: a probe window waits on its slowest
+    # probe, and a probe that keeps failing just counts as a miss
+    _PROBE_RETRIES = 1
+    _PROBE_RETRY_MAX_DELAY = 2.0
+    # GraphQL result pages requested per batched POST
+    _GQL_BATCH_PAGES = 5
+    # Extra single-page attempts for a page whose request failed
+    _GQL_PAGE_RETRIES = 2
+    # GraphQL POSTs per second across all pagination workers
+    _GQL_REQUESTS_PER_SEC = 10
+    # Set per worker once the first clip's raw keys have been logged
+    _logged_sample_clip = False
+
     def __init__(self, cfg, db, mode='direct_http'):
         super().__init__()
         self.cfg   = cfg
@@ -5743,67 +6803,89 @@ class DirectScrapeWorker(QThread):
         self._stop = threading.Event()
         self._db_lock = threading.Lock()  # Thread-safe DB access for concurrent mode
         self._browser_session_key = f"{mode}|{datetime.now().isoformat()}|{random.random()}"
+        # Keep-alive connections shared by the HTTP helpers (one per thread+host)
+        self._http = _KeepAliveHTTP()
+        self._thumb_dirs = {}  # thumb_dir -> names of .jpg files on disk
+        self._thumb_dirs_lock = threading.Lock()  # first listing of each dir
 
     def stop(self): self._stop.set()
 
     def log(self, msg, level='INFO'):
         self.log_signal.emit(f"[{datetime.now().strftime('%H:%M:%S')}] [{level:5s}] {msg}", level)
 
+    def _log_lines(self, lines):
+        """Log (msg, level) pairs as one multi-line message per run of
+        same-level lines, so long reports don't emit a signal per line."""
+        run, run_level = [], None
+        for msg, level in lines:
+            if level != run_level and run:
+                self.log("\n".join(run), run_level)
+                run = []
+            run.append(msg)
+            run_level = level
+        if run:
+            self.log("\n".join(run), run_level)
+
     def run(self):
         self.status_signal.emit("running")
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
         try:
-            if self.mode == 'api_discover':
-                loop.run_until_complete(self._api_discover())
-            else:
-                loop.run_until_complete(self._direct_scrape())
+            asyncio.run(self._api_discover() if self.mode == 'api_discover' else self._direct_scrape())
         except Exception as e:
             import traceback as _tb
             self.log(f"DirectScrape crashed: {e}\n{_tb.format_exc()[:500]}", "ERROR")
         finally:
-            try:
-                loop.close()
-            except Exception:
-                pass
+            self._http.close()
         self.status_signal.emit("stopped")
         self.finished.emit()
 
     # ── HTTP helpers ──────────────────────────────────────────────────────────
 
-    def _http_get(self, url, headers=None, timeout=15, max_size=10_000_000):
-        """Simple HTTP GET that returns (status_code, body_bytes) or (0, b'') on error."""
-        import urllib.request, urllib.error, gzip, io
+    def _http_get(self, url, headers=None, timeout=15, max_size=10_000_000,
+                  retries=None, max_retry_delay=30.0):
+        """Simple HTTP GET that returns (status_code, body_bytes) or (0, b'') on error.
+
+        Transient statuses are retried ``retries`` times (default
+        _HTTP_RETRIES), waiting at most ``max_retry_delay`` seconds each time.
+        """
+        if retries is None:
+            retries = self._HTTP_RETRIES
         hdrs = dict(self.HEADERS)
         if headers:
             hdrs.update(headers)
-        req = urllib.request.Request(url, headers=hdrs)
         try:
-            resp = _safe_urlopen(req, timeout=timeout)
-            data = resp.read(max_size)
+            for attempt in range(retries + 1):
+                status, resp_headers, data = self._http.request(
+                    'GET', url, hdrs, timeout=timeout, max_size=max_size)
+                if (status not in self._HTTP_RETRY_STATUSES or attempt == retries
+                        or self._stop.is_set()):
+                    break
+                delay = (_parse_retry_after_seconds(resp_headers.get('Retry-After'))
+                         or 0.5 * 2 ** attempt * random.uniform(0.5, 1.5))
+                if self._stop.wait(min(delay, max_retry_delay)):
+                    break
+            if status >= 400:
+                return status, b''
             # Handle gzip
-            if resp.headers.get('Content-Encoding') == 'gzip':
+            if resp_headers.get('Content-Encoding') == 'gzip':
                 data = gzip.decompress(data)
-            return resp.status, data
+            return status, data
         except UnsafeUrlError as e:
             self.log(f"Blocked unsafe HTTP URL: {e}", "WARN")
             return 0, b''
-        except urllib.error.HTTPError as e:
-            return e.code, b''
         except Exception:
             return 0, b''
 
-    def _http_get_json(self, url, headers=None, timeout=15):
+    def _http_get_json(self, url, headers=None, timeout=15, **retry_kwargs):
         """HTTP GET returning parsed JSON or None."""
         hdrs = dict(self.HEADERS)
         hdrs['Accept'] = 'application/json, text/plain, */*'
         if headers:
             hdrs.update(headers)
-        code, data = self._http_get(url, hdrs, timeout)
+        code, data = self._http_get(url, hdrs, timeout, **retry_kwargs)
         if code == 200 and data:
             try:
-                return json.loads(data)
-            except (json.JSONDecodeError, UnicodeDecodeError):
+                return _json_loads(data)
+            except ValueError:  # JSONDecodeError / UnicodeDecodeError
                 return None
         return None
 
@@ -5818,23 +6900,64 @@ class DirectScrapeWorker(QThread):
                 self.db.update_metadata(clip_id, meta)
         return is_new
 
+    def _save_clip_metas(self, clips):
+        """_save_clip_meta for a page of clips: new rows go in with one
+        executemany, already-known ones get their metadata filled in."""
+        with self._db_lock, self.db.batch():
+            new_ids = self.db.save_clips(clips)
+            for c in clips:
+                clip_id = str(c.get('clip_id', '') or '').strip()
+                if clip_id and clip_id not in new_ids:
+                    self.db.update_metadata(clip_id, c)
+        return new_ids
+
+    def _thumb_files(self, thumb_dir):
+        """Names of the .jpg files in thumb_dir: one os.scandir per directory
+        (no per-file stat), then kept current as thumbnails are written."""
+        files = self._thumb_dirs.get(thumb_dir)
+        if files is None:
+            with self._thumb_dirs_lock:
+                files = self._thumb_dirs.get(thumb_dir)
+                if files is None:
+                    try:
+                        with os.scandir(thumb_dir) as it:
+                            files = {e.name for e in it if e.name.endswith('.jpg') and e.is_file()}
+                    except OSError:
+                        files = set()
+                    self._thumb_dirs[thumb_dir] = files
+        return files
+
+    def _has_thumb(self, thumb_dir, name):
+        """True if thumb_dir holds a non-empty ``name``. Only names the listing
+        found are stat'ed: a file left by an earlier run may be an interrupted,
+        empty write, which is dropped so it gets downloaded again."""
+        files = self._thumb_files(thumb_dir)
+        if name not in files:
+            return False
+        try:
+            if os.path.getsize(os.path.join(thumb_dir, name)) > 0:
+                return True
+        except OSError:
+            pass
+        files.discard(name)
+        return False
+
     def _download_thumb(self, url, clip_id, thumb_dir):
         """Download thumbnail to disk (thread-safe for DB update)."""
         if not url or not clip_id:
             return
-        out = os.path.join(thumb_dir, f"{clip_id}.jpg")
-        if os.path.isfile(out) and os.path.getsize(out) > 0:
+        name = f"{clip_id}.jpg"
+        if self._has_thumb(thumb_dir, name):
             return
+        files = self._thumb_files(thumb_dir)
+        out = os.path.join(thumb_dir, name)
         try:
-            import urllib.request
-            req = urllib.request.Request(url)
-            req.add_header('User-Agent', 'Mozilla/5.0')
-            resp = _safe_urlopen(req, timeout=10)
-            data = resp.read(2_000_000)
-            resp.close()
-            if len(data) > 500:
+            status, _, data = self._http.request(
+                'GET', url, {'User-Agent': 'Mozilla/5.0'}, timeout=10, max_size=2_000_000)
+            if status < 400 and len(data) > 500:
                 with open(out, 'wb') as f:
                     f.write(data)
+                files.add(name)
                 with self._db_lock:
                     self.db.update_thumb_path(clip_id, out)
         except UnsafeUrlError as e:
@@ -5842,11 +6965,46 @@ class DirectScrapeWorker(QThread):
         except Exception:
             pass
 
+    async def _download_thumbs(self, jobs, thumb_dir):
+        """Download (url, clip_id) thumbnails concurrently on a thread pool,
+        gathering one batch at a time so a stop request is honoured quickly."""
+        if not jobs:
+            return
+        from concurrent.futures import ThreadPoolExecutor
+        loop = asyncio.get_running_loop()
+        size = self._THUMB_CONCURRENCY
+        with ThreadPoolExecutor(max_workers=size, thread_name_prefix='thumb-io') as pool:
+            for start in range(0, len(jobs), size):
+                if self._stop.is_set():
+                    break
+                await asyncio.gather(*[
+                    loop.run_in_executor(pool, self._download_thumb, url, clip_id, thumb_dir)
+                    for url, clip_id in jobs[start:start + size]
+                ], return_exceptions=True)
+
     # ── API Discovery (browser-based, one-time) ──────────────────────────────
 
+    @staticmethod
+    async def _goto_until_api_response(page, url, timeout):
+        """Navigate and return once the page's first XHR/fetch response lands
+        (or after 8s). 'networkidle' can hang on SPAs that hold long-poll
+        connections open."""
+        first_api = asyncio.ensure_future(page.wait_for_response(
+            lambda r: r.request.resource_type in _API_RESOURCE_TYPES, timeout=8000))
+        try:
+            await asyncio.sleep(0)  # let the waiter subscribe before navigating
+            await page.goto(url, wait_until='domcontentloaded', timeout=timeout)
+            await asyncio.wait({first_api})
+        finally:
+            if not first_api.done():
+                first_api.cancel()
+            elif not first_api.cancelled():
+                first_api.exception()  # a timeout just means no API call yet
+
     async def _api_discover(self):
         """Launch browser, browse /stock-footage, capture all XHR/fetch traffic."""
         from playwright.async_api import async_playwright
+        _install_playwright_stack_patch()
 
         self.log("=== API DISCOVERY MODE ===", "OK")
         self.log("Launching browser to capture Artlist's internal API endpoints...", "INFO")
@@ -5880,49 +7038,55 @@ class DirectScrapeWorker(QThread):
                     method = response.request.method
 
                     # Normalize URL: strip query params for pattern matching
-                    parsed = urlparse(url)
-                    path = parsed.path
-                    domain = parsed.netloc
+                    domain, path, query = _split_url(url)
                     pattern_key = f"{method} {domain}{path}"
 
-                    if pattern_key not in discovered:
-                        discovered[pattern_key] = {
+                    info = discovered.get(pattern_key)
+                    if info is None:
+                        info = discovered[pattern_key] = {
                             'method': method,
                             'content_type': ct[:60],
                             'count': 0,
                             'sample_url': url[:200],
-                            'sample_query': parsed.query[:200] if parsed.query else '',
+                            'sample_query': query[:200],
                             'has_clip_data': False,
                             'response_keys': [],
                             'clip_count': 0,
                             'request_body': '',
                             'request_headers': {},
                         }
-                    discovered[pattern_key]['count'] += 1
+                    info['count'] += 1
 
                     # Try to parse JSON responses for clip data
                     if 'json' in ct:
                         try:
-                            body = await response.text()
+                            body = await response.body()
                             if len(body) > 20 and len(body) < 5_000_000:
-                                data = json.loads(body)
+                                # Bodies without a numeric clip id cannot yield
+                                # clips; only decode one small sample per
+                                # endpoint to report its top-level keys.
+                                has_ids = _WALK_CLIP_ID_HINT_RE.search(body) is not None
+                                if not has_ids and (info['response_keys'] or len(body) > 65_536):
+                                    return
+                                data = _json_loads(body)
                                 if isinstance(data, dict):
-                                    discovered[pattern_key]['response_keys'] = list(data.keys())[:20]
-                                clips_found = self._walk_for_clips(data)
+                                    info['response_keys'] = list(data.keys())[:20]
+                                clips_found = self._walk_for_clips(data) if has_ids else []
                                 if clips_found:
-                                    discovered[pattern_key]['has_clip_data'] = True
-                                    discovered[pattern_key]['clip_count'] += len(clips_found)
+                                    info['has_clip_data'] = True
+                                    info['clip_count'] += len(clips_found)
                                     # Capture request body for GraphQL endpoints
                                     req_body = response.request.post_data or ''
                                     req_hdrs = dict(response.request.headers)
-                                    discovered[pattern_key]['request_body'] = req_body[:2000]
-                                    discovered[pattern_key]['request_headers'] = {
+                                    info['request_body'] = req_body[:2000]
+                                    info['request_headers'] = {
                                         k: v for k, v in req_hdrs.items()
                                         if k.lower() not in ('host', 'content-length', 'connection',
                                                               'accept-encoding')
                                     }
                                     clip_data_endpoints.append({
                                         'url': url,
+                                        'endpoint': f"{domain}{path}",
                                         'method': method,
                                         'clip_count': len(clips_found),
                                         'sample_clip': clips_found[0] if clips_found else {},
@@ -5937,8 +7101,7 @@ class DirectScrapeWorker(QThread):
 
             # ── Phase 1: Load main catalog page ──────────────────────────
             self.log("Phase 1: Loading /stock-footage ...", "INFO")
-            await page.goto('https://artlist.io/stock-footage', wait_until='networkidle', timeout=30000)
-            await asyncio.sleep(3)
+            await self._goto_until_api_response(page, 'https://artlist.io/stock-footage', 30000)
 
             # ── Phase 2: Scroll to trigger lazy loading ──────────────────
             self.log("Phase 2: Scrolling to trigger API calls...", "INFO")
@@ -5967,10 +7130,10 @@ class DirectScrapeWorker(QThread):
             # ── Phase 4: Try navigating to a clip page ───────────────────
             self.log("Phase 4: Loading a sample clip page...", "INFO")
             try:
-                await page.goto(
-                    'https://artlist.io/stock-footage/clip/buildings-traffic-new-york-usa/6451306',
-                    wait_until='networkidle', timeout=20000)
-                await asyncio.sleep(3)
+                await self._goto_until_api_response(
+                    page, 'https://artlist.io/stock-footage/clip/buildings-traffic-new-york-usa/6451306',
+                    20000)
+                await asyncio.sleep(1)  # let the clip page's follow-up calls land
             except Exception as e:
                 self.log(f"Clip page: {e}", "DEBUG")
 
@@ -6032,47 +7195,53 @@ class DirectScrapeWorker(QThread):
 
         # Show API-like endpoints (not static assets)
         self.log("", "INFO")
-        self.log("--- XHR/Fetch Endpoints (sorted by frequency) ---", "INFO")
+        lines = [("--- XHR/Fetch Endpoints (sorted by frequency) ---", "INFO")]
         for pattern, info in sorted_eps:
             if any(x in pattern for x in ['.js', '.css', '.png', '.jpg', '.svg', '.woff', '.ico', 'favicon']):
                 continue
             clip_marker = " ** HAS CLIP DATA **" if info['has_clip_data'] else ""
-            self.log(
+            lines.append((
                 f"  [{info['count']:3d}x] {pattern[:80]}  "
                 f"ct:{info['content_type'][:30]}{clip_marker}",
-                "M3U8" if info['has_clip_data'] else "INFO")
+                "M3U8" if info['has_clip_data'] else "INFO"))
             if info['sample_query']:
-                self.log(f"         query: {info['sample_query'][:120]}", "DEBUG")
+                lines.append((f"         query: {info['sample_query'][:120]}", "DEBUG"))
             if info['response_keys']:
-                self.log(f"         keys: {info['response_keys']}", "DEBUG")
+                lines.append((f"         keys: {info['response_keys']}", "DEBUG"))
+        self._log_lines(lines)
 
         self.log("", "INFO")
         if clip_data_endpoints:
             self.log(f"--- CLIP DATA ENDPOINTS ({len(clip_data_endpoints)} found) ---", "OK")
+            best_ep, best_count = None, -1   # first endpoint with the most clips
+            lines = []
             for ep in clip_data_endpoints:
-                self.log(f"  {ep['method']} {ep['url'][:120]}", "M3U8")
-                self.log(f"    clips: {ep['clip_count']}", "INFO")
+                if ep['clip_count'] > best_count:
+                    best_ep, best_count = ep, ep['clip_count']
+                lines.append((f"  {ep['method']} {ep['url'][:120]}", "M3U8"))
+                lines.append((f"    clips: {ep['clip_count']}", "INFO"))
                 if ep.get('sample_clip'):
                     sc = ep['sample_clip']
-                    self.log(f"    sample: id={sc.get('clip_id','')} title={sc.get('title','')[:50]}", "INFO")
+                    lines.append((f"    sample: id={sc.get('clip_id','')} title={sc.get('title','')[:50]}", "INFO"))
                 if ep.get('request_body'):
                     try:
-                        gql = json.loads(ep['request_body'])
+                        gql = ep['_parsed_body'] = _json_loads(ep['request_body'])
                         op = gql.get('operationName', '')
                         vkeys = list(gql.get('variables', {}).keys())
-                        self.log(f"    GraphQL op: {op}, variables: {vkeys}", "M3U8")
+                        lines.append((f"    GraphQL op: {op}, variables: {vkeys}", "M3U8"))
                         q = gql.get('query', '')
-                        self.log(f"    query preview: {q[:120]}...", "DEBUG")
+                        lines.append((f"    query preview: {q[:120]}...", "DEBUG"))
                     except Exception:
-                        self.log(f"    request body: {ep['request_body'][:120]}...", "DEBUG")
+                        lines.append((f"    request body: {ep['request_body'][:120]}...", "DEBUG"))
+            self._log_lines(lines)
 
             # Save the best GraphQL template
-            best_ep = max(clip_data_endpoints, key=lambda x: x['clip_count'])
             if best_ep.get('request_body'):
                 try:
-                    gql = json.loads(best_ep['request_body'])
+                    # Parsed once already while logging the endpoints above
+                    gql = best_ep.get('_parsed_body') or _json_loads(best_ep['request_body'])
                     # Also find the matching discovered entry for headers
-                    best_key = f"POST {urlparse(best_ep['url']).netloc}{urlparse(best_ep['url']).path}"
+                    best_key = f"POST {best_ep['endpoint']}"
                     hdrs = discovered.get(best_key, {}).get('request_headers', {})
                     cfg = load_config()
                     cfg['artlist_graphql'] = {
@@ -6095,154 +7264,25 @@ class DirectScrapeWorker(QThread):
 
     def _walk_for_clips(self, obj, depth=0, _debug_first=False):
         """Walk a JSON structure looking for clip-like objects. Returns list of dicts."""
-        if depth > 12:
-            return []
-        clips = []
-        if isinstance(obj, list):
-            for item in obj:
-                clips.extend(self._walk_for_clips(item, depth + 1, _debug_first))
-        elif isinstance(obj, dict):
-            # Check if this looks like a clip object — accept numeric id 4+ digits
-            cid = str(obj.get('id', '') or obj.get('clipId', '') or obj.get('clip_id', '') or
-                       obj.get('assetId', '') or obj.get('asset_id', '') or '')
-            if cid and re.match(r'^\d{4,}$', cid):
-                # Log raw keys of first clip found (diagnostic for field mapping)
-                if not hasattr(self, '_logged_sample_clip'):
-                    self._logged_sample_clip = True
-                    self.log(f"  [DIAG] Clip object keys: {sorted(obj.keys())[:30]}", "DEBUG")
-                    for dk in list(obj.keys())[:20]:
-                        dv = obj[dk]
-                        if isinstance(dv, (str, int, float, bool)) and dv:
-                            self.log(f"  [DIAG]   {dk} = {str(dv)[:100]}", "DEBUG")
-                        elif isinstance(dv, dict):
-                            self.log(f"  [DIAG]   {dk} = dict({list(dv.keys())[:8]})", "DEBUG")
-                        elif isinstance(dv, list) and dv:
-                            self.log(f"  [DIAG]   {dk} = list[{len(dv)}]", "DEBUG")
-                # This has a clip-like ID — extract everything we can
-                # ── Title ──
-                title = str(
-                    obj.get('clipName', '') or obj.get('title', '') or obj.get('name', '') or
-                    obj.get('displayName', '') or
-                    (obj.get('clipNameForUrl', '').replace('-', ' ').title() if obj.get('clipNameForUrl') else '') or
-                    (obj.get('slug', '').replace('-', ' ').title() if obj.get('slug') else '') or
-                    obj.get('description', '') or '')
-                # ── Slug → URL ──
-                slug = str(obj.get('clipNameForUrl', '') or obj.get('slug', '') or obj.get('urlSlug', '') or '')
-                # ── Creator/artist ──
-                creator = str(
-                    obj.get('filmMakerDisplayName', '') or obj.get('filmmakerDisplayName', '') or
-                    obj.get('artistName', '') or obj.get('artist_name', '') or
-                    obj.get('creatorName', '') or obj.get('creator_name', '') or
-                    obj.get('displayArtistName', '') or obj.get('authorName', '') or '')
-                if not creator:
-                    for ck in ('artist', 'creator', 'filmmaker', 'filmMaker', 'author', 'owner'):
-                        av = obj.get(ck)
-                        if isinstance(av, dict):
-                            creator = str(av.get('name', '') or av.get('displayName', '') or
-                                          av.get('fullName', '') or av.get('slug', '') or '')
-                            break
-                        elif isinstance(av, str) and av:
-                            creator = av; break
-                # ── Thumbnail ──
-                thumb = ''
-                for tk in ('thumbnailUrl', 'thumbnail_url', 'thumbnail', 'imageUrl',
-                           'image_url', 'posterUrl', 'poster_url', 'coverUrl', 'cover_url',
-                           'previewImageUrl', 'preview_image_url', 'image', 'poster', 'cover'):
-                    tv = obj.get(tk)
-                    if isinstance(tv, str) and tv.startswith('http'):
-                        thumb = tv; break
-                    elif isinstance(tv, dict) and tv.get('url'):
-                        thumb = str(tv['url']); break
-                # ── Duration (Artlist returns ms, convert to seconds) ──
-                dur_raw = obj.get('duration', '') or obj.get('length', '') or obj.get('durationInSeconds', '') or ''
-                if dur_raw:
-                    try:
-                        dur_val = int(dur_raw)
-                        # Artlist returns ms (values >1000), convert to seconds
-                        duration = str(round(dur_val / 1000, 1)) if dur_val > 1000 else str(dur_val)
-                    except (ValueError, TypeError):
-                        duration = str(dur_raw)
-                else:
-                    duration = ''
-                # ── Resolution (Artlist uses width/height, not a 'resolution' field) ──
-                w = obj.get('width', '')
-                h = obj.get('height', '')
-                resolution = str(obj.get('resolution', '') or obj.get('maxResolution', '') or obj.get('quality', '') or '')
-                if not resolution and w and h:
-                    resolution = f"{w}x{h}"
-                # ── Source URL ──
-                source_url = str(obj.get('url', '') or obj.get('pageUrl', '') or
-                                  obj.get('shareUrl', '') or obj.get('link', '') or '')
-                if not source_url and slug:
-                    source_url = f'https://artlist.io/stock-footage/clip/{slug}/{cid}'
-                # ── M3U8 / Video URL (clipPath is the HLS manifest!) ──
-                m3u8 = ''
-                for vk in ('clipPath', 'clip_path', 'videoUrl', 'video_url', 'hlsUrl', 'hls_url',
-                           'previewUrl', 'preview_url', 'contentUrl', 'content_url',
-                           'streamUrl', 'stream_url', 'previewVideoUrl', 'mp4Url'):
-                    vv = obj.get(vk)
-                    if isinstance(vv, str) and vv.startswith('http'):
-                        m3u8 = vv; break
-                # ── Tags (build from boolean flags if no tags array) ──
-                tags_raw = obj.get('tags', obj.get('keywords', obj.get('labels', [])))
-                if isinstance(tags_raw, str):
-                    tags = tags_raw
-                elif isinstance(tags_raw, list) and tags_raw:
-                    tags = ', '.join(
-                        str(t.get('name', '') if isinstance(t, dict) else t)
-                        for t in tags_raw[:25])
-                else:
-                    # Build tags from Artlist boolean flags
-                    flag_tags = []
-                    if obj.get('isMadeWithAi'): flag_tags.append('AI-generated')
-                    if obj.get('isOriginal'): flag_tags.append('Original')
-                    if obj.get('isVfx'): flag_tags.append('VFX')
-                    if obj.get('isNew'): flag_tags.append('New')
-                    orient = obj.get('orientation', '')
-                    if orient: flag_tags.append(str(orient).capitalize())
-                    tags = ', '.join(flag_tags)
-                # ── Collection/story ──
-                collection = str(
-                    obj.get('storyName', '') or obj.get('collectionName', '') or
-                    obj.get('collection_name', '') or obj.get('story_name', '') or
-                    obj.get('folderName', '') or obj.get('folder_name', '') or '')
-                if not collection:
-                    for stk in ('collection', 'story', 'folder'):
-                        sv = obj.get(stk)
-                        if isinstance(sv, dict):
-                            collection = str(sv.get('name', '') or sv.get('title', '') or '')
-                            break
-                        elif isinstance(sv, str) and sv:
-                            collection = sv; break
-                # Only require the numeric ID — don't require title/thumb
-                # (GraphQL responses may have minimal fields on first page)
-                # ── Formats (Artlist uses availableFormats as a list) ──
-                fmt_raw = obj.get('availableFormats', obj.get('formats', obj.get('available_formats', '')))
-                if isinstance(fmt_raw, list):
-                    formats = ', '.join(str(f) for f in fmt_raw)
-                else:
-                    formats = str(fmt_raw) if fmt_raw else ''
-                clips.append({
-                    'clip_id': cid,
-                    'title': title,
-                    'creator': creator,
-                    'thumbnail_url': thumb,
-                    'duration': duration,
-                    'resolution': resolution,
-                    'tags': tags,
-                    'collection': collection,
-                    'frame_rate': str(obj.get('fps', '') or obj.get('frameRate', '') or
-                                      obj.get('frame_rate', '') or ''),
-                    'camera': str(obj.get('camera', '') or obj.get('cameraModel', '') or
-                                   obj.get('camera_model', '') or ''),
-                    'formats': formats,
-                    'source_url': source_url,
-                    'm3u8_url': m3u8,
-                })
-                return clips  # Don't recurse into children of a clip object
-            for v in obj.values():
-                clips.extend(self._walk_for_clips(v, depth + 1, _debug_first))
-        return clips
+        # Only the first clip needs the diagnostic wrapper
+        make_clip = _clip_from_json if self._logged_sample_clip else self._clip_from_obj
+        return _walk_json_for_clips(obj, depth, make_clip)
+
+    def _clip_from_obj(self, obj, cid):
+        """_clip_from_json, logging the raw keys of the first clip this worker sees."""
+        # Log raw keys of first clip found (diagnostic for field mapping)
+        if not self._logged_sample_clip:
+            self._logged_sample_clip = True
+            self.log(f"  [DIAG] Clip object keys: {sorted(obj.keys())[:30]}", "DEBUG")
+            for dk in list(obj.keys())[:20]:
+                dv = obj[dk]
+                if isinstance(dv, (str, int, float, bool)) and dv:
+                    self.log(f"  [DIAG]   {dk} = {str(dv)[:100]}", "DEBUG")
+                elif isinstance(dv, dict):
+                    self.log(f"  [DIAG]   {dk} = dict({list(dv.keys())[:8]})", "DEBUG")
+                elif isinstance(dv, list) and dv:
+                    self.log(f"  [DIAG]   {dk} = list[{len(dv)}]", "DEBUG")
+        return _clip_from_json(obj, cid)
 
     # ── Direct HTTP Scrape (no browser) ───────────────────────────────────────
 
@@ -6271,7 +7311,7 @@ class DirectScrapeWorker(QThread):
             try:
                 _, graphql_templates, bootstrap_clips = await self._browser_bootstrap()
                 if bootstrap_clips:
-                    new, upd = self._ingest_clips(bootstrap_clips, thumb_dir, "bootstrap")
+                    new, upd = await self._ingest_clips(bootstrap_clips, thumb_dir, "bootstrap")
                     total_new += new
                     total_updated += upd
             except Exception as e:
@@ -6296,7 +7336,7 @@ class DirectScrapeWorker(QThread):
             self.log("Phase 2: Checking sitemaps for additional URLs...", "INFO")
             sitemap_clips = self._check_sitemaps()
             if sitemap_clips:
-                new, upd = self._ingest_clips(sitemap_clips, thumb_dir, "sitemap")
+                new, upd = await self._ingest_clips(sitemap_clips, thumb_dir, "sitemap")
                 total_new += new
                 total_updated += upd
 
@@ -6318,104 +7358,151 @@ class DirectScrapeWorker(QThread):
         graphql_templates = []  # list of {query, variables, headers, clip_count}
 
         from playwright.async_api import async_playwright
-
-        async with async_playwright() as pw:
-            # Check if chromium is actually installed
-            exe = pw.chromium.executable_path
-            if not os.path.isfile(exe):
-                self.log("  Chromium not installed — skipping bootstrap.", "WARN")
-                self.log("  Install browser, then re-run; or use 'API Discovery' mode first.", "WARN")
-                return '', api_urls, clips
-            proxy, proxy_count = _select_proxy_from_pool(self.cfg, self._browser_session_key, 'bootstrap')
-            if proxy:
-                self.log(f"  {_proxy_log_prefix(self.cfg)}: selected {_proxy_for_log(proxy)} from {proxy_count} entries", "INFO")
-            elif _cfg_bool(self.cfg, 'proxy_pool_enabled', False):
-                self.log("  Proxy pool enabled but no valid proxies were loaded.", "WARN")
-            launch_kwargs = {'headless': True}
-            if proxy:
-                launch_kwargs['proxy'] = proxy
-            browser = await pw.chromium.launch(**launch_kwargs)
-            context = await browser.new_context(
-                user_agent=self.HEADERS['User-Agent'],
-                viewport={'width': 1440, 'height': 900},
-            )
-            page = await context.new_page()
-
-            async def _on_resp(response):
-                try:
-                    url = response.url
-                    rt = response.request.resource_type
-                    if rt not in ('xhr', 'fetch'):
-                        return
-                    ct = response.headers.get('content-type', '')
-                    if 'json' not in ct:
-                        return
-
-                    # Only care about the GraphQL endpoint
-                    if 'graphql' not in url.lower():
-                        return
-
-                    body = await response.text()
-                    if len(body) < 50 or len(body) > 5_000_000:
-                        return
-                    resp_data = json.loads(body)
-
-                    # Check if this response has clip data
-                    found_clips = self._walk_for_clips(resp_data)
-                    if not found_clips:
-                        return
-
-                    clips.extend(found_clips)
-
-                    # Capture the REQUEST body (GraphQL query + variables)
-                    req = response.request
-                    req_body = req.post_data
-                    req_headers = {k: v for k, v in req.headers.items()
-                                   if k.lower() not in ('host', 'content-length', 'connection',
-                                                         'accept-encoding', 'origin', 'referer')}
-
-                    if req_body:
+        from concurrent.futures import ProcessPoolExecutor
+        _install_playwright_stack_patch()
+
+        # Large GraphQL bodies are decoded and walked in worker processes so the
+        # event loop keeps capturing traffic; started on the first such body.
+        loop = asyncio.get_running_loop()
+        walk_pool = None
+        offloaded = set()   # _on_resp tasks waiting on walk_pool
+
+        def _walk_pool():
+            nonlocal walk_pool
+            if walk_pool is None:
+                walk_pool = ProcessPoolExecutor(
+                    max_workers=max(1, (os.cpu_count() or 2) // 2),
+                    mp_context=multiprocessing.get_context('spawn'))
+            return walk_pool
+
+        try:
+            async with async_playwright() as pw:
+                # Check if chromium is actually installed
+                exe = pw.chromium.executable_path
+                if not os.path.isfile(exe):
+                    self.log("  Chromium not installed — skipping bootstrap.", "WARN")
+                    self.log("  Install browser, then re-run; or use 'API Discovery' mode first.", "WARN")
+                    return '', api_urls, clips
+                proxy, proxy_count = _select_proxy_from_pool(self.cfg, self._browser_session_key, 'bootstrap')
+                if proxy:
+                    self.log(f"  {_proxy_log_prefix(self.cfg)}: selected {_proxy_for_log(proxy)} from {proxy_count} entries", "INFO")
+                elif _cfg_bool(self.cfg, 'proxy_pool_enabled', False):
+                    self.log("  Proxy pool enabled but no valid proxies were loaded.", "WARN")
+                launch_kwargs = {'headless': True}
+                if proxy:
+                    launch_kwargs['proxy'] = proxy
+                browser = await pw.chromium.launch(**launch_kwargs)
+                context = await browser.new_context(
+                    user_agent=self.HEADERS['User-Agent'],
+                    viewport={'width': 1440, 'height': 900},
+                )
+                page = await context.new_page()
+
+                async def _on_resp(response):
+                    try:
+                        url = response.url
+                        rt = response.request.resource_type
+                        if rt not in _API_RESOURCE_TYPES:
+                            return
+                        ct = response.headers.get('content-type', '')
+                        if 'json' not in ct:
+                            return
+
+                        # Only care about the GraphQL endpoint
+                        if 'graphql' not in url.lower():
+                            return
                         try:
-                            gql = json.loads(req_body)
-                            graphql_templates.append({
-                                'url': url,
-                                'query': gql.get('query', ''),
-                                'variables': gql.get('variables', {}),
-                                'operation': gql.get('operationName', ''),
-                                'headers': req_headers,
-                                'clip_count': len(found_clips),
-                            })
-                        except json.JSONDecodeError:
-                            pass
+                            cl = int(response.headers.get('content-length', '0') or 0)
+                        except ValueError:
+                            cl = 0
+                        if cl and not _CATALOG_BODY_MIN <= cl <= _CATALOG_BODY_MAX:
+                            return
+
+                        body = await response.body()
+                        if not _CATALOG_BODY_MIN <= len(body) <= _CATALOG_BODY_MAX:
+                            return
+                        if not _WALK_CLIP_ID_HINT_RE.search(body):
+                            return
+                        found_clips = None
+                        if len(body) >= _WALK_OFFLOAD_MIN:
+                            task = asyncio.current_task()
+                            offloaded.add(task)
+                            try:
+                                found_clips = await loop.run_in_executor(
+                                    _walk_pool(), _walk_graphql_body_for_clips, body)
+                            except (OSError, RuntimeError):
+                                pass  # pool unavailable/broken — walk here instead
+                            finally:
+                                offloaded.discard(task)
+                        if found_clips is None:
+                            resp_data, depth = _graphql_clip_root(_json_loads(body))
+                            # Walk the decoded tree without the raw bytes still alive
+                            del body
+                            found_clips = (self._walk_for_clips(resp_data, depth)
+                                           if resp_data is not None else [])
+
+                        # Check if this response has clip data
+                        if not found_clips:
+                            return
+
+                        clips.extend(found_clips)
+
+                        # Capture the REQUEST body (GraphQL query + variables)
+                        req = response.request
+                        req_body = req.post_data
+                        req_headers = {k: v for k, v in req.headers.items()
+                                       if k.lower() not in ('host', 'content-length', 'connection',
+                                                             'accept-encoding', 'origin', 'referer')}
+
+                        if req_body:
+                            try:
+                                gql = _json_loads(req_body)
+                                graphql_templates.append({
+                                    'url': url,
+                                    'query': gql.get('query', ''),
+                                    'variables': gql.get('variables', {}),
+                                    'operation': gql.get('operationName', ''),
+                                    'headers': req_headers,
+                                    'clip_count': len(found_clips),
+                                })
+                            except json.JSONDecodeError:
+                                pass
 
-                except Exception:
-                    pass
+                    except Exception:
+                        pass
 
-            page.on('response', _on_resp)
+                page.on('response', _on_resp)
 
-            # Navigate to catalog and scroll to trigger GraphQL calls
-            self.log("  Loading /stock-footage ...", "INFO")
-            try:
-                await page.goto('https://artlist.io/stock-footage',
-                                wait_until='networkidle', timeout=30000)
-            except Exception:
+                # Navigate to catalog and scroll to trigger GraphQL calls
+                self.log("  Loading /stock-footage ...", "INFO")
                 try:
-                    await page.goto('https://artlist.io/stock-footage', timeout=30000)
-                except Exception as e:
-                    self.log(f"  Page load error: {e}", "WARN")
-                    await browser.close()
-                    return '', api_urls, clips
+                    await page.goto('https://artlist.io/stock-footage',
+                                    wait_until='networkidle', timeout=30000)
+                except Exception:
+                    try:
+                        await page.goto('https://artlist.io/stock-footage', timeout=30000)
+                    except Exception as e:
+                        self.log(f"  Page load error: {e}", "WARN")
+                        await browser.close()
+                        return '', api_urls, clips
 
-            await asyncio.sleep(3)
+                await asyncio.sleep(3)
 
-            # Scroll to trigger lazy-loaded GraphQL calls
-            for i in range(6):
-                if self._stop.is_set():
-                    break
-                await page.evaluate("window.scrollBy(0, 1000)")
-                await asyncio.sleep(1.5)
+                # Scroll to trigger lazy-loaded GraphQL calls
+                for i in range(6):
+                    if self._stop.is_set():
+                        break
+                    await page.evaluate("window.scrollBy(0, 1000)")
+                    await asyncio.sleep(1.5)
 
-            await browser.close()
+                await browser.close()
+
+            # Wait out walks still running in the pool so their clips count
+            if offloaded:
+                await asyncio.wait(offloaded, timeout=30)
+        finally:
+            if walk_pool is not None:
+                walk_pool.shutdown(wait=False, cancel_futures=True)
 
         # Deduplicate clips
         seen_ids = set()
@@ -6430,11 +7517,13 @@ class DirectScrapeWorker(QThread):
                  f"{len(unique_clips)} unique clips", "OK")
 
         # Log GraphQL details
+        template_lines = []
         for i, tpl in enumerate(graphql_templates):
             op = tpl.get('operation', 'unknown')
             vc = tpl.get('clip_count', 0)
             vkeys = list(tpl.get('variables', {}).keys())
-            self.log(f"  Template {i}: operation={op}, clips={vc}, vars={vkeys}", "INFO")
+            template_lines.append((f"  Template {i}: operation={op}, clips={vc}, vars={vkeys}", "INFO"))
+        self._log_lines(template_lines)
 
         # Save best GraphQL template to config for pure HTTP replay
         if graphql_templates:
@@ -6588,8 +7677,8 @@ class DirectScrapeWorker(QThread):
         Uses ThreadPoolExecutor for parallel queries, defers thumbnail downloads.
         """
         import time
-        import urllib.request
-        from concurrent.futures import ThreadPoolExecutor, as_completed
+        from concurrent.futures import (FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor,
+                                        as_completed, wait)
 
         if not graphql_templates:
             return []
@@ -6623,55 +7712,131 @@ class DirectScrapeWorker(QThread):
 
         # ── Thread-safe shared state ──────────────────────────────────────
         import threading
-        state_lock = threading.Lock()  # single lock for ALL shared state
+        from collections import deque
+        state_lock = threading.Lock()  # guards seen_ids, backoff and bucket state
         seen_ids = set()
-        total_new = [0]
-        total_api = [0]
-        rate_backoff_until = [0.0]  # timestamp when rate limit expires
+        first_pages = set()  # frozenset of page-1 clip_ids per job already run
+        # Progress counters are lock-free: deque appends are atomic, so each
+        # worker appends and the reporter reads len()/sum()
+        new_counts = deque()  # new clips per finished job
+        api_calls = deque()   # one entry per decoded API response
+        rate_backoff_until = [0.0]  # time.monotonic() when the rate limit expires
+        backoff_attempt = [0]       # consecutive 403/429s, decays on success
 
         max_pages = 40  # API caps at ~33
         workers = self.cfg.get('concurrent_workers', 6)
+        # Token bucket shared by all workers: [tokens, last refill (monotonic)]
+        bucket = [float(workers), time.monotonic()]
 
-        def _gql_post(vars_dict):
-            """Single GraphQL POST. Returns parsed clips list or empty."""
+        def _take_token():
+            """Block until the shared bucket grants one request slot."""
+            rate = self._GQL_REQUESTS_PER_SEC
+            with state_lock:
+                now = time.monotonic()
+                tokens = min(float(workers), bucket[0] + (now - bucket[1]) * rate)
+                bucket[:] = [tokens - 1, now]  # may go negative: a reserved slot
+            if tokens < 1:
+                time.sleep((1 - tokens) / rate)
+
+        def _note_rate_limited():
+            # Full-jitter exponential backoff so workers don't retry in lockstep
+            with state_lock:
+                delay = random.uniform(0, min(300, 2 * 2 ** backoff_attempt[0]))
+                backoff_attempt[0] += 1
+                rate_backoff_until[0] = max(rate_backoff_until[0], time.monotonic() + delay)
+
+        # Pages go out as one batched POST (a JSON array of operations) until
+        # the server answers a batch with anything but a matching array
+        gql_batching = [True]
+
+        def _gql_operation(vars_dict):
+            return {'query': gql_query, 'variables': vars_dict, 'operationName': gql_op or None}
+
+        # Large response bodies are decoded and walked in worker processes so
+        # the pagination threads are not serialized on the GIL
+        walk_offload = _cfg_bool(self.cfg, 'graphql_walk_offload', True)
+        walk_pool = [None]
+
+        def _gql_pages(body):
+            """Clip lists, one per operation, from a response body."""
+            if walk_offload and len(body) >= _WALK_OFFLOAD_MIN:
+                with state_lock:
+                    if walk_pool[0] is None:
+                        walk_pool[0] = ProcessPoolExecutor(
+                            max_workers=max(1, (os.cpu_count() or 2) // 2),
+                            mp_context=multiprocessing.get_context('spawn'))
+                    pool = walk_pool[0]
+                try:
+                    return pool.submit(_walk_graphql_pages_for_clips, body).result()
+                except (OSError, RuntimeError):
+                    pass  # pool unavailable/broken: walk in this thread
+            data = _json_loads(body)
+            return [_gql_clips(op) for op in (data if type(data) is list else (data,))]
+
+        def _gql_request(payload):
+            """POST one GraphQL payload. Returns (status, clip list per operation
+            or None); status is None when the request itself failed."""
             if self._stop.is_set():
-                return []
+                return None, None
 
             # Global rate-limit backoff
-            now = time.time()
+            now = time.monotonic()
             with state_lock:
                 wait_until = rate_backoff_until[0]
             if now < wait_until:
-                time.sleep(wait_until - now + random.uniform(0.5, 2))
-
-            payload = json.dumps({
-                'query': gql_query,
-                'variables': vars_dict,
-                'operationName': gql_op or None,
-            }).encode('utf-8')
+                time.sleep(wait_until - now)
+            _take_token()
 
             try:
-                req = urllib.request.Request(gql_url, data=payload,
-                                             headers=req_headers, method='POST')
-                resp = _safe_urlopen(req, timeout=15)
-                body = resp.read(5_000_000)
-                resp.close()
-                if resp.headers.get('Content-Encoding') == 'gzip':
-                    import gzip
+                status, resp_headers, body = self._http.request(
+                    'POST', gql_url, req_headers, _json_dumps(payload), timeout=15, max_size=5_000_000)
+                if status in (403, 429):
+                    _note_rate_limited()
+                    return status, None
+                if status >= 400:
+                    return status, None
+                if resp_headers.get('Content-Encoding') == 'gzip':
                     body = gzip.decompress(body)
-                data = json.loads(body)
-                with state_lock:
-                    total_api[0] += 1
-                return self._walk_for_clips(data)
+                pages = _gql_pages(body)
+                del body
+                api_calls.append(None)
+                if backoff_attempt[0]:
+                    with state_lock:
+                        backoff_attempt[0] = max(0, backoff_attempt[0] - 1)
+                return status, pages
             except UnsafeUrlError as e:
                 self.log(f"Blocked unsafe GraphQL URL: {e}", "WARN")
-                return []
-            except Exception as e:
-                err = str(e)
-                if '403' in err or '429' in err:
-                    with state_lock:
-                        rate_backoff_until[0] = time.time() + 30
-                return []
+                return None, None
+            except Exception:
+                # HTTP errors arrive as a status above; this is a network failure
+                return None, None
+
+        def _gql_clips(data):
+            node, depth = _graphql_clip_root(data)
+            return self._walk_for_clips(node, depth) if node is not None else []
+
+        def _gql_post_pages(vars_list):
+            """Clips for each page in vars_list, batched into one POST when the
+            server supports it and one POST per page otherwise. A page whose
+            request failed or was rate-limited is None, not an empty page."""
+            if len(vars_list) > 1 and gql_batching[0]:
+                status, pages = _gql_request([_gql_operation(v) for v in vars_list])
+                if pages is not None and len(pages) == len(vars_list):
+                    return pages
+                if status is None or status in (403, 429):
+                    return [None] * len(vars_list)
+                with state_lock:
+                    announce, gql_batching[0] = gql_batching[0], False
+                if announce:
+                    self.log(f"  Batched GraphQL not supported (HTTP {status}); one page per request", "INFO")
+            results = []
+            for v in vars_list:
+                status, pages = _gql_request(_gql_operation(v))
+                if status is None or status in (403, 429):
+                    results.append(None)
+                else:
+                    results.append(pages[0] if pages else [])
+            return results
 
         def _run_query(label, var_overrides):
             """Paginate one query. Save to DB immediately, no thumbnails."""
@@ -6679,52 +7844,78 @@ class DirectScrapeWorker(QThread):
             api_empty = 0      # API returned 0 clips (catalog exhausted)
             all_dupes = 0      # API returned clips but all already seen
 
-            for pg in range(1, max_pages + 1):
-                if self._stop.is_set():
+            # Only 'page' differs between pages and nothing mutates the nested
+            # values, so one merged base plus a per-page key replaces a deep copy
+            base_vars = {**gql_vars, **var_overrides}
+            done = False
+            for first in range(1, max_pages + 1, self._GQL_BATCH_PAGES):
+                if done or self._stop.is_set():
                     break
 
-                v = json.loads(json.dumps(gql_vars))
-                v.update(var_overrides)
-                v['page'] = pg
-
-                found = _gql_post(v)
+                vars_list = [{**base_vars, 'page': pg}
+                             for pg in range(first, min(first + self._GQL_BATCH_PAGES, max_pages + 1))]
 
-                if not found:
-                    # API returned zero clips — truly empty page
-                    api_empty += 1
-                    if api_empty >= 2:
-                        break
-                    continue
+                for page_vars, found in zip(vars_list, _gql_post_pages(vars_list)):
+                    # A failed or rate-limited page says nothing about the
+                    # catalog: retry it on its own (_gql_request waits out any
+                    # backoff) and skip it if it keeps failing
+                    for _ in range(self._GQL_PAGE_RETRIES):
+                        if found is not None or self._stop.is_set():
+                            break
+                        time.sleep(random.uniform(0.5, 1.5))
+                        found = _gql_post_pages([page_vars])[0]
+                    if found is None:
+                        continue
+                    if not found:
+                        # API returned zero clips — truly empty page
+                        api_empty += 1
+                        if api_empty >= 2:
+                            done = True
+                            break
+                        continue
 
-                # API returned clips — reset api_empty counter
-                api_empty = 0
+                    # API returned clips — reset api_empty counter
+                    api_empty = 0
 
-                # Deduplicate against global seen set
-                with state_lock:
-                    fresh = [c for c in found
-                             if c.get('clip_id') and c['clip_id'] not in seen_ids]
-                    for c in fresh:
-                        seen_ids.add(c['clip_id'])
-
-                if fresh:
-                    new_count += len(fresh)
-                    all_dupes = 0
-                    # Save to DB immediately (thread-safe via _db_lock)
-                    for c in fresh:
-                        c.setdefault('source_site', 'Artlist')
-                        self._save_clip_meta(c)
-                else:
-                    # All clips on this page were already seen
-                    all_dupes += 1
-                    if all_dupes >= 10:
-                        # 10 consecutive pages of pure overlap — move on
+                    # Deduplicate within the page, then against the global seen
+                    # set; the lock only covers two C-level set operations
+                    page_clips = {c['clip_id']: c for c in found if c.get('clip_id')}
+                    first_page = frozenset(page_clips) if page_vars['page'] == 1 else None
+                    with state_lock:
+                        covered = first_page in first_pages
+                        if first_page and not covered:
+                            first_pages.add(first_page)
+                        new_ids = page_clips.keys() - seen_ids
+                        seen_ids.update(new_ids)
+                    if covered:
+                        # Same first page as an earlier job (a sort or
+                        # queryType the API ignores here): the rest would
+                        # only be pages of duplicates
+                        self.log(f"  {label}: covered by an earlier job, skipped", "DEBUG")
+                        done = True
                         break
+                    fresh = [c for cid, c in page_clips.items() if cid in new_ids]
+
+                    if fresh:
+                        new_count += len(fresh)
+                        all_dupes = 0
+                        # Save to DB immediately (thread-safe via _db_lock), one
+                        # executemany and one commit per page
+                        for c in fresh:
+                            c.setdefault('source_site', 'Artlist')
+                        self._save_clip_metas(fresh)
+                    else:
+                        # All clips on this page were already seen
+                        all_dupes += 1
+                        if all_dupes >= 10:
+                            # 10 consecutive pages of pure overlap — move on
+                            done = True
+                            break
 
                 time.sleep(random.uniform(0.12, 0.30))
 
             # Update global counter
-            with state_lock:
-                total_new[0] += new_count
+            new_counts.append(new_count)
 
             return label, new_count
 
@@ -6781,6 +7972,19 @@ class DirectScrapeWorker(QThread):
                     continue
                 jobs.append((f's:{term}/s{sv}', {'searchTerms': [term], 'sortType': sv}))
 
+        # Jobs whose effective variables coincide (e.g. a sort rotation that
+        # equals the template's own sort) would paginate the same pages again
+        seen_jobs = set()
+        unique_jobs = []
+        for lbl, ovr in jobs:
+            key = json.dumps({**gql_vars, **ovr}, sort_keys=True, default=str)
+            if key not in seen_jobs:
+                seen_jobs.add(key)
+                unique_jobs.append((lbl, ovr))
+        if len(unique_jobs) < len(jobs):
+            self.log(f"  Jobs dedup: {len(jobs)} -> {len(unique_jobs)}", "INFO")
+        jobs = unique_jobs
+
         self.log(f"  Jobs queued: {len(jobs)}", "OK")
         self.log(f"  Workers: {workers}", "INFO")
         self.log(f"  Thumbnails: deferred (metadata-only scrape)", "INFO")
@@ -6792,52 +7996,50 @@ class DirectScrapeWorker(QThread):
         completed = 0
         t_start = time.time()
 
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            future_map = {}
-            for lbl, ovr in jobs:
-                if self._stop.is_set():
-                    break
-                future_map[executor.submit(_run_query, lbl, ovr)] = lbl
-
-            for fut in as_completed(future_map):
-                if self._stop.is_set():
-                    executor.shutdown(wait=False)
-                    break
-                try:
-                    label, count = fut.result(timeout=180)
-                except Exception:
-                    label, count = future_map.get(fut, '?'), 0
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                future_map = {}
+                for lbl, ovr in jobs:
+                    if self._stop.is_set():
+                        break
+                    future_map[executor.submit(_run_query, lbl, ovr)] = lbl
 
-                completed += 1
+                for fut in as_completed(future_map):
+                    if self._stop.is_set():
+                        executor.shutdown(wait=False)
+                        break
+                    try:
+                        label, count = fut.result(timeout=180)
+                    except Exception:
+                        label, count = future_map.get(fut, '?'), 0
 
-                if count > 0:
-                    with state_lock:
-                        t = total_new[0]
-                        a = total_api[0]
-                    self.log(
-                        f"  [{completed}/{len(jobs)}] {label}: +{count:,} "
-                        f"(total: {t:,}, calls: {a})", "OK")
+                    completed += 1
 
-                # Progress summary
-                if completed % 25 == 0:
-                    with state_lock:
-                        t = total_new[0]
-                        a = total_api[0]
-                    elapsed = time.time() - t_start
-                    rate = t / elapsed * 60 if elapsed > 0 else 0
-                    self.log(
-                        f"  --- {completed}/{len(jobs)} jobs | "
-                        f"{t:,} clips | {a} calls | "
-                        f"{rate:,.0f} clips/min | "
-                        f"{elapsed:.0f}s elapsed ---", "M3U8")
-                    self.stats_signal.emit(self.db.stats())
+                    if count > 0:
+                        t, a = sum(new_counts), len(api_calls)
+                        self.log(
+                            f"  [{completed}/{len(jobs)}] {label}: +{count:,} "
+                            f"(total: {t:,}, calls: {a})", "OK")
+
+                    # Progress summary
+                    if completed % 25 == 0:
+                        t, a = sum(new_counts), len(api_calls)
+                        elapsed = time.time() - t_start
+                        rate = t / elapsed * 60 if elapsed > 0 else 0
+                        self.log(
+                            f"  --- {completed}/{len(jobs)} jobs | "
+                            f"{t:,} clips | {a} calls | "
+                            f"{rate:,.0f} clips/min | "
+                            f"{elapsed:.0f}s elapsed ---", "M3U8")
+                        self.stats_signal.emit(self.db.stats())
+        finally:
+            if walk_pool[0] is not None:
+                walk_pool[0].shutdown(cancel_futures=True)
 
         # ══════════════════════════════════════════════════════════════════
         # Thumbnail download pass (after all metadata scraped)
         # ══════════════════════════════════════════════════════════════════
-        with state_lock:
-            final_total = total_new[0]
-            final_api = total_api[0]
+        final_total, final_api = sum(new_counts), len(api_calls)
 
         elapsed = time.time() - t_start
         self.log("", "INFO")
@@ -6847,86 +8049,147 @@ class DirectScrapeWorker(QThread):
 
         # Download thumbnails in parallel (non-blocking, best-effort)
         self.log(f"  Downloading thumbnails for {final_total:,} clips...", "INFO")
-        thumb_count = [0]
+        thumbs_done = deque()  # one entry per downloaded thumbnail
 
         def _dl_thumb(clip_id, url):
+            # Returns (clip_id, path) once the file is on disk; the scheduling
+            # thread records the paths so no transaction spans the downloads.
             if self._stop.is_set():
-                return
+                return None
             out = os.path.join(thumb_dir, f"{clip_id}.jpg")
-            if os.path.isfile(out) and os.path.getsize(out) > 0:
-                return
             try:
-                req = urllib.request.Request(url)
-                req.add_header('User-Agent', 'Mozilla/5.0')
-                resp = _safe_urlopen(req, timeout=8)
-                data = resp.read(2_000_000)
-                resp.close()
-                if len(data) > 500:
+                status, _, data = self._http.request(
+                    'GET', url, {'User-Agent': 'Mozilla/5.0'}, timeout=8, max_size=2_000_000)
+                if status < 400 and len(data) > 500:
                     with open(out, 'wb') as f:
                         f.write(data)
-                    with self._db_lock:
-                        self.db.update_thumb_path(clip_id, out)
-                    with state_lock:
-                        thumb_count[0] += 1
+                    on_disk.add(f"{clip_id}.jpg")
+                    thumbs_done.append(None)
+                    return clip_id, out
             except UnsafeUrlError as e:
                 self.log(f"Thumbnail URL blocked [{clip_id}]: {e}", "WARN")
             except Exception:
                 pass
+            return None
 
-        # Get all clips needing thumbnails from DB
-        try:
-            cur = self.db.conn.execute(
-                "SELECT clip_id, thumbnail_url FROM clips "
-                "WHERE thumbnail_url != '' AND thumbnail_url IS NOT NULL "
-                "AND (thumb_path IS NULL OR thumb_path = '')")
-            thumb_jobs = cur.fetchall()
+        def _record_thumbs(ready):
+            # One short transaction per flush, opened after the waits return
+            if ready:
+                with self._db_lock, self.db.batch():
+                    for cid, path in ready:
+                        self.db.update_thumb_path(cid, path)
+                ready.clear()
+
+        def _collect(finished, ready):
+            for fut in finished:
+                try:
+                    saved = fut.result()
+                except Exception:
+                    saved = None
+                if saved:
+                    ready.append(saved)
+            return len(finished)
+
+        # The DB's thumb_path column decides what still needs downloading.
+        # One directory listing reconciles it with the disk: files left by an
+        # interrupted run are recorded, recorded files that were deleted are
+        # fetched again. Only those unrecorded leftovers are stat()ed.
+        on_disk = self._thumb_files(thumb_dir)
+        thumb_root = os.path.normcase(os.path.abspath(thumb_dir))
+        last_rowid = 0
+        try:
+            while True:
+                recorded = self.db.recorded_thumb_paths(last_rowid)
+                if not recorded:
+                    break
+                last_rowid = recorded[-1][0]
+                self.db.clear_thumb_paths([
+                    cid for _, cid, path in recorded
+                    if os.path.normcase(os.path.dirname(os.path.abspath(path))) == thumb_root
+                    and os.path.basename(path) not in on_disk])
         except Exception:
-            thumb_jobs = []
+            pass
 
-        if thumb_jobs:
-            self.log(f"  {len(thumb_jobs):,} thumbnails to download...", "INFO")
-            with ThreadPoolExecutor(max_workers=10) as tex:
-                futs = []
-                for cid, turl in thumb_jobs:
-                    if self._stop.is_set():
-                        break
-                    futs.append(tex.submit(_dl_thumb, cid, turl))
-                # Wait with progress
-                done = 0
-                for f in as_completed(futs):
-                    done += 1
-                    if done % 500 == 0:
-                        with state_lock:
-                            tc = thumb_count[0]
-                        self.log(f"    Thumbnails: {tc:,} downloaded ({done:,}/{len(thumb_jobs):,} processed)", "INFO")
-                    if self._stop.is_set():
-                        tex.shutdown(wait=False)
+        # Clips needing thumbnails are read 500 rows at a time (keyset on
+        # rowid, no cursor held open across the pool's writes) and fed to the
+        # pool as slots free up, so downloads start at once and memory stays
+        # bounded by the chunk plus the in-flight window.
+        pending_sql = ("FROM clips WHERE thumbnail_url != '' AND thumbnail_url IS NOT NULL "
+                       "AND (thumb_path IS NULL OR thumb_path = '')")
+        try:
+            total_jobs = self.db.conn.execute(f"SELECT COUNT(*) {pending_sql}").fetchone()[0]
+        except Exception:
+            total_jobs = 0
+
+        if total_jobs:
+            self.log(f"  {total_jobs:,} thumbnails to download...", "INFO")
+            max_inflight = 2 * self._THUMB_CONCURRENCY
+            inflight = set()
+            ready = []  # (clip_id, path) waiting for the next flush
+            done = 0
+            last_rowid = 0
+            # Latency-bound: each thread holds its own keep-alive CDN socket
+            with ThreadPoolExecutor(max_workers=self._THUMB_CONCURRENCY) as tex:
+                while not self._stop.is_set():
+                    try:
+                        rows = self.db.conn.execute(
+                            f"SELECT rowid, clip_id, thumbnail_url {pending_sql} "
+                            "AND rowid > ? ORDER BY rowid LIMIT 500", (last_rowid,)).fetchall()
+                    except Exception:
+                        rows = []
+                    if not rows:
                         break
-            with state_lock:
-                tc = thumb_count[0]
+                    last_rowid = rows[-1][0]
+                    for _, cid, turl in rows:
+                        if self._stop.is_set():
+                            break
+                        if self._has_thumb(thumb_dir, f"{cid}.jpg"):
+                            ready.append((cid, os.path.join(thumb_dir, f"{cid}.jpg")))
+                            done += 1
+                            continue
+                        while len(inflight) >= max_inflight:
+                            finished, inflight = wait(inflight, return_when=FIRST_COMPLETED)
+                            done += _collect(finished, ready)
+                        inflight.add(tex.submit(_dl_thumb, cid, turl))
+                    # Paths found or downloaded during this chunk share one commit
+                    _record_thumbs(ready)
+                    tc = len(thumbs_done)
+                    self.log(f"    Thumbnails: {tc:,} downloaded ({done:,}/{total_jobs:,} processed)", "INFO")
+                while inflight and not self._stop.is_set():
+                    finished, inflight = wait(inflight, timeout=2)
+                    done += _collect(finished, ready)
+                    _record_thumbs(ready)
+                if self._stop.is_set():
+                    tex.shutdown(wait=False, cancel_futures=True)
+                    _collect([f for f in inflight if f.done()], ready)
+                    _record_thumbs(ready)
+            tc = len(thumbs_done)
             self.log(f"  Thumbnails complete: {tc:,} downloaded", "OK")
         self.stats_signal.emit(self.db.stats())
 
         return []  # clips already saved to DB; no need to return list
 
-    def _ingest_clips(self, clips, thumb_dir, source_label):
+    async def _ingest_clips(self, clips, thumb_dir, source_label):
         """Save a batch of clip dicts to DB, download thumbs. Returns (new, updated)."""
         new_count = 0
         upd_count = 0
-        for clip in clips:
-            if self._stop.is_set():
-                break
-            clip.setdefault('source_site', 'Artlist')
-            is_new = self._save_clip_meta(clip)
-            if is_new:
-                new_count += 1
-            else:
-                upd_count += 1
-            # Download thumbnail
-            thumb_url = clip.get('thumbnail_url', '')
-            clip_id = clip.get('clip_id', '')
-            if thumb_url and clip_id:
-                self._download_thumb(thumb_url, clip_id, thumb_dir)
+        thumb_jobs = []
+        # One transaction for the whole batch instead of a commit per clip
+        with self.db.batch():
+            for clip in clips:
+                if self._stop.is_set():
+                    break
+                clip.setdefault('source_site', 'Artlist')
+                is_new = self._save_clip_meta(clip)
+                if is_new:
+                    new_count += 1
+                else:
+                    upd_count += 1
+                thumb_url = clip.get('thumbnail_url', '')
+                clip_id = clip.get('clip_id', '')
+                if thumb_url and clip_id:
+                    thumb_jobs.append((thumb_url, clip_id))
+        await self._download_thumbs(thumb_jobs, thumb_dir)
 
         self.log(f"  [{source_label}] Ingested {new_count} new + {upd_count} updated clips", "OK" if new_count else "INFO")
         self.stats_signal.emit(self.db.stats())
@@ -6960,30 +8223,17 @@ class DirectScrapeWorker(QThread):
             self.log(f"  Fetching {url}...", "DEBUG")
             code, body = self._http_get(url, timeout=20)
             if code == 200 and body:
-                text = body.decode('utf-8', errors='replace')
-                self.log(f"  Sitemap response: {len(text)} bytes", "INFO")
+                self.log(f"  Sitemap response: {len(body)} bytes", "INFO")
 
                 # Extract clip URLs from sitemap XML
-                clip_urls = re.findall(
-                    r'<loc>(https?://artlist\.io/stock-footage/clip/[^<]+)</loc>', text)
-                self.log(f"  Found {len(clip_urls)} clip URLs in sitemap", "OK" if clip_urls else "INFO")
-
-                for curl in clip_urls:
-                    if self._stop.is_set():
-                        break
-                    cid_m = re.search(r'/(\d{4,})/?$', curl)
-                    if cid_m:
-                        slug_m = re.search(r'/clip/([^/]+)/', curl)
-                        title = slug_m.group(1).replace('-', ' ').title() if slug_m else ''
-                        clips.append({
-                            'clip_id': cid_m.group(1),
-                            'source_url': curl,
-                            'title': title,
-                            'source_site': 'Artlist',
-                        })
+                found = _sitemap_clips(body)
+                self.log(f"  Found {len(found)} clip URLs in sitemap", "OK" if found else "INFO")
+                clips.extend(found)
 
                 # Check for sub-sitemaps (sitemap index)
-                sub_sitemaps = re.findall(r'<loc>(https?://[^<]*sitemap[^<]*\.xml[^<]*)</loc>', text)
+                sub_sitemaps = [m.decode('utf-8', errors='replace')
+                                for m in _SITEMAP_INDEX_LOC_RE.findall(body)]
+                del body
                 for sub_url in sub_sitemaps[:20]:  # cap at 20
                     if self._stop.is_set():
                         break
@@ -6991,21 +8241,10 @@ class DirectScrapeWorker(QThread):
                         self.log(f"  Fetching sub-sitemap: {sub_url[:80]}", "INFO")
                         sc, sb = self._http_get(sub_url, timeout=30)
                         if sc == 200 and sb:
-                            st = sb.decode('utf-8', errors='replace')
-                            sub_clips = re.findall(
-                                r'<loc>(https?://artlist\.io/stock-footage/clip/[^<]+)</loc>', st)
+                            sub_clips = _sitemap_clips(sb)
+                            del sb
                             self.log(f"  Sub-sitemap: {len(sub_clips)} clip URLs", "OK" if sub_clips else "INFO")
-                            for curl in sub_clips:
-                                cid_m = re.search(r'/(\d{4,})/?$', curl)
-                                if cid_m:
-                                    slug_m = re.search(r'/clip/([^/]+)/', curl)
-                                    title = slug_m.group(1).replace('-', ' ').title() if slug_m else ''
-                                    clips.append({
-                                        'clip_id': cid_m.group(1),
-                                        'source_url': curl,
-                                        'title': title,
-                                        'source_site': 'Artlist',
-                                    })
+                            clips.extend(sub_clips)
 
         if clips:
             self.log(f"  Sitemaps total: {len(clips)} clip URLs", "OK")
@@ -7030,9 +8269,7 @@ class DirectScrapeWorker(QThread):
         self.log(f"  Response: {len(html):,} bytes", "INFO")
 
         # Extract __NEXT_DATA__
-        nd_match = re.search(
-            r'<script\s+id="__NEXT_DATA__"\s+type="application/json"[^>]*>(.*?)</script>',
-            html, re.DOTALL)
+        nd_match = _NEXT_DATA_RE.search(html)
         if not nd_match:
             self.log("  __NEXT_DATA__ not found in HTML", "WARN")
             # Try fetching a specific clip page instead
@@ -7041,13 +8278,11 @@ class DirectScrapeWorker(QThread):
                 'https://artlist.io/stock-footage/clip/buildings-traffic-new-york-usa/6451306', timeout=20)
             if code2 == 200:
                 html = body2.decode('utf-8', errors='replace')
-                nd_match = re.search(
-                    r'<script\s+id="__NEXT_DATA__"\s+type="application/json"[^>]*>(.*?)</script>',
-                    html, re.DOTALL)
+                nd_match = _NEXT_DATA_RE.search(html)
 
         if nd_match:
             try:
-                nd_json = json.loads(nd_match.group(1))
+                nd_json = _json_loads(nd_match.group(1))
                 build_id = nd_json.get('buildId', '')
                 self.log(f"  buildId: {build_id}", "M3U8" if build_id else "WARN")
                 self.log(f"  page: {nd_json.get('page', 'N/A')}", "INFO")
@@ -7128,6 +8363,7 @@ class DirectScrapeWorker(QThread):
         """Probe clip IDs via _next/data JSON endpoints. Requires buildId."""
         clips = []
         import time
+        from concurrent.futures import ThreadPoolExecutor
 
         if not build_id:
             self.log("  No buildId — cannot probe. Run browser bootstrap or API Discovery first.", "WARN")
@@ -7181,51 +8417,67 @@ class DirectScrapeWorker(QThread):
         jump_count = 0
         current_id = start_id
         thumb_dir = get_thumbnail_cache_dir()
-
-        while probe_count < max_probes and not self._stop.is_set():
-            if consecutive_miss >= max_gap:
-                jump_count += 1
-                if jump_count > max_jumps or current_id - jump_size < min_id:
-                    self.log(f"  Reached probe limit after {jump_count} jumps", "INFO")
-                    break
-                current_id -= jump_size
-                consecutive_miss = 0
-                self.log(f"  Gap detected — jumping to ID {current_id}", "DEBUG")
-                continue
-
-            probe_count += 1
-            url = f'https://artlist.io/_next/data/{build_id}/stock-footage/clip/x/{current_id}.json'
-            data = self._http_get_json(url, timeout=8)
-
-            if data:
-                found = self._walk_for_clips(data)
-                if found:
-                    clips.extend(found)
+        saved = 0          # clips[:saved] are already in the DB
+        flushed_at = 0     # probe_count at the last incremental save
+
+        def probe(clip_id):
+            return self._http_get_json(
+                f'https://artlist.io/_next/data/{build_id}/stock-footage/clip/x/{clip_id}.json',
+                timeout=8, retries=self._PROBE_RETRIES,
+                max_retry_delay=self._PROBE_RETRY_MAX_DELAY)
+
+        # A window of consecutive IDs is fetched concurrently, then walked in
+        # order so the gap/jump bookkeeping matches a one-at-a-time probe.
+        with ThreadPoolExecutor(max_workers=self._PROBE_WINDOW) as pool:
+            while probe_count < max_probes and not self._stop.is_set():
+                if consecutive_miss >= max_gap:
+                    jump_count += 1
+                    if jump_count > max_jumps or current_id - jump_size < min_id:
+                        self.log(f"  Reached probe limit after {jump_count} jumps", "INFO")
+                        break
+                    current_id -= jump_size
                     consecutive_miss = 0
-                    jump_count = max(0, jump_count - 1)  # Successful hits reduce jump count
-                else:
-                    consecutive_miss += 1
-            else:
-                consecutive_miss += 1
+                    self.log(f"  Gap detected — jumping to ID {current_id}", "DEBUG")
+                    continue
 
-            current_id -= 1
+                window_started = time.monotonic()
+                window = min(self._PROBE_WINDOW, max_probes - probe_count)
+                for data in pool.map(probe, range(current_id, current_id - window, -1)):
+                    probe_count += 1
+                    current_id -= 1
+                    found = self._walk_for_clips(data) if data else []
+                    if found:
+                        clips.extend(found)
+                        consecutive_miss = 0
+                        jump_count = max(0, jump_count - 1)  # Successful hits reduce jump count
+                    else:
+                        consecutive_miss += 1
+                        if consecutive_miss >= max_gap:
+                            break  # IDs past the gap would not have been probed
 
-            # Rate limiting: ~10 req/sec
-            if probe_count % 10 == 0:
-                time.sleep(0.5)
+                # Rate limiting: ~10 req/sec
+                time.sleep(max(0.0, window / 10 - (time.monotonic() - window_started)))
 
-            # Progress + incremental save
-            if probe_count % 100 == 0:
-                self.log(
-                    f"  Progress: {probe_count}/{max_probes} probed, {len(clips)} found, "
-                    f"at ID {current_id}, gaps: {jump_count}", "INFO")
-                # Save batch to DB
-                for c in clips[-100:]:
-                    c.setdefault('source_site', 'Artlist')
-                    self._save_clip_meta(c)
-                    if c.get('thumbnail_url') and c.get('clip_id'):
-                        self._download_thumb(c['thumbnail_url'], c['clip_id'], thumb_dir)
-                self.stats_signal.emit(self.db.stats())
+                # Progress + incremental save
+                if probe_count - flushed_at >= 100:
+                    flushed_at = probe_count
+                    self.log(
+                        f"  Progress: {probe_count}/{max_probes} probed, {len(clips)} found, "
+                        f"at ID {current_id}, gaps: {jump_count}", "INFO")
+                    # Save batch to DB; thumbnails download in parallel
+                    thumb_jobs = []
+                    with self.db.batch():
+                        for c in clips[saved:]:
+                            c.setdefault('source_site', 'Artlist')
+                            self._save_clip_meta(c)
+                            if c.get('thumbnail_url') and c.get('clip_id'):
+                                thumb_jobs.append((c['thumbnail_url'], c['clip_id']))
+                    saved = len(clips)
+                    if thumb_jobs:
+                        with ThreadPoolExecutor(max_workers=self._THUMB_CONCURRENCY) as tex:
+                            for url, cid in thumb_jobs:
+                                tex.submit(self._download_thumb, url, cid, thumb_dir)
+                    self.stats_signal.emit(self.db.stats())
 
         self.log(f"  ID probing done: {probe_count} probed, {len(clips)} clips found", "OK" if clips else "WARN")
         return clips
@@ -8895,7 +10147,7 @@ class DownloadWorker(QThread):
         self.progress_signal.emit(clip_id, 0, "yt-dlp fallback...")
 
         fn_tpl = self._fn_template
-        clip_data = dict(clip) if isinstance(clip, dict) else dict(zip(clip.keys(), tuple(clip)))
+        clip_data = dict(clip) if isinstance(clip, dict) else dict(zip(clip.keys(), clip))
         filename = _apply_fn_template(fn_tpl, clip_data, clip_id)
         out_path = os.path.join(self.out_dir, filename)
         os.makedirs(os.path.dirname(out_path), exist_ok=True)
@@ -9140,7 +10392,7 @@ class DownloadWorker(QThread):
         total_secs = self._parse_duration(duration_str)
         fn_tpl    = self._fn_template
         source = fresh if fresh else clip
-        clip_data  = dict(zip(source.keys(), tuple(source))) if (hasattr(source,'keys') and not isinstance(source, dict)) else (source if isinstance(source, dict) else {})
+        clip_data  = dict(zip(source.keys(), source)) if (hasattr(source,'keys') and not isinstance(source, dict)) else (source if isinstance(source, dict) else {})
         filename   = _apply_fn_template(fn_tpl, clip_data, clip_id)
         out_path   = os.path.join(self.out_dir, filename)
         part_path  = _download_part_path(out_path)
@@ -9215,7 +10467,7 @@ class DownloadWorker(QThread):
 
         # Determine quality label for logging
         qual = '?'
-        qual_m = re.search(r'-(uhd|hd|sd)_', m3u8_url, re.IGNORECASE)
+        qual_m = _QUALITY_TAG_RE.search(m3u8_url)
         if qual_m:
             qual = qual_m.group(1).upper()
         res_m = re.search(r'(\d{3,4})_(\d{3,4})_', m3u8_url)
@@ -12039,7 +13291,7 @@ class MainWindow(QMainWindow):
         if not rows: self.status_bar.showMessage("No errors to retry.", 3000); return
         self._ensure_dl_worker_running(); queued = 0
         for row in rows:
-            data = dict(zip(row.keys(), tuple(row)))
+            data = dict(zip(row.keys(), row))
             self.db.set_dl_status(data['clip_id'], '')
             if self._dl_worker.enqueue(data):
                 self._add_dl_table_row(data); queued += 1
@@ -12603,6 +13855,8 @@ class MainWindow(QMainWindow):
             'WARN':C('warning'),'DEBUG':'#6a6a86',
         }.get(level,C('text'))
         ts = datetime.now().strftime("%H:%M:%S")
+        # Multi-line messages (batched reports, tracebacks) keep their lines
+        msg = msg.replace('\n', '<br>')
         self.log_view.append(
             f'<span style="color:{clr};font-family:Consolas,monospace;font-size:{Z(12)}px;">'
             f'[{ts}] {msg}</span>')
@@ -13211,7 +14465,7 @@ class MainWindow(QMainWindow):
                 wr = csv.DictWriter(fh, fieldnames=fields, extrasaction='ignore')
                 wr.writeheader()
                 for r in rows_snapshot:
-                    rd = r if isinstance(r, dict) else dict(zip(r.keys(), tuple(r)))
+                    rd = r if isinstance(r, dict) else dict(zip(r.keys(), r))
                     wr.writerow({k: rd.get(k, '') for k in fields})
             return f"Saved {len(rows_snapshot)} rows  ->  {f}"
         w = BackgroundWorker(_run)
@@ -13545,7 +14799,7 @@ class MainWindow(QMainWindow):
         """Add a row to the download queue table for a clip. Safe to call from main thread only."""
         # sqlite3.Row doesn't have .get() — normalize to dict
         if hasattr(clip, 'keys') and not isinstance(clip, dict):
-            clip = dict(zip(clip.keys(), tuple(clip)))
+            clip = dict(zip(clip.keys(), clip))
         cid = str(clip.get('clip_id', '') or '')
         if cid in self._dl_clip_rows:
             return   # already in table
@@ -14218,6 +15472,7 @@ class MainWindow(QMainWindow):
             self._video_player.stop()
         if self.worker and self.worker.isRunning():
             self.worker.stop(); self.worker.wait(3000)
+        _BROWSER_HOST.shutdown()
         if self._dl_worker and self._dl_worker.isRunning():
             self._dl_worker.stop(); self._dl_worker.wait(5000)
         if self._thumb_worker and self._thumb_worker.isRunning():
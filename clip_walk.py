@@ -0,0 +1,249 @@
+"""Clip extraction from decoded catalog/GraphQL JSON.
+
+Kept free of Qt and Playwright imports, so walk tasks sent to worker
+processes pickle by reference to a lightweight module. (Spawned workers
+still re-run the main script as __mp_main__ when the app runs from source.)
+"""
+
+import json
+import re
+
+# Optional: orjson decodes API response bodies several times faster (pip install orjson)
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def _json_loads(data):
+    """json.loads for response bodies (str or bytes), via orjson when installed.
+    orjson is stricter than the stdlib (NaN, integers over 64 bits), so a body
+    it rejects gets one stdlib retry before the error propagates."""
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+_NUMID_RE = re.compile(r'^\d{4,}$')
+
+# Where _clip_from_json looks for each field, in priority order
+_CLIP_TITLE_KEYS = ('clipName', 'title', 'name', 'displayName')
+_CLIP_SLUG_KEYS = ('clipNameForUrl', 'slug', 'urlSlug')
+_CLIP_CREATOR_KEYS = (
+    'filmMakerDisplayName', 'filmmakerDisplayName', 'artistName', 'artist_name',
+    'creatorName', 'creator_name', 'displayArtistName', 'authorName')
+_CLIP_PERSON_NAME_KEYS = ('name', 'displayName', 'fullName', 'slug')
+_CLIP_THUMB_KEYS = (
+    'thumbnailUrl', 'thumbnail_url', 'thumbnail', 'imageUrl',
+    'image_url', 'posterUrl', 'poster_url', 'coverUrl', 'cover_url',
+    'previewImageUrl', 'preview_image_url', 'image', 'poster', 'cover')
+_CLIP_RESOLUTION_KEYS = ('resolution', 'maxResolution', 'quality')
+_CLIP_PAGE_URL_KEYS = ('url', 'pageUrl', 'shareUrl', 'link')
+_CLIP_VIDEO_KEYS = (
+    'clipPath', 'clip_path', 'videoUrl', 'video_url', 'hlsUrl', 'hls_url',
+    'previewUrl', 'preview_url', 'contentUrl', 'content_url',
+    'streamUrl', 'stream_url', 'previewVideoUrl', 'mp4Url')
+_CLIP_COLLECTION_KEYS = (
+    'storyName', 'collectionName', 'collection_name', 'story_name',
+    'folderName', 'folder_name')
+_CLIP_FPS_KEYS = ('fps', 'frameRate', 'frame_rate')
+_CLIP_CAMERA_KEYS = ('camera', 'cameraModel', 'camera_model')
+# Artlist boolean flags turned into tags when a clip has no tag list
+_CLIP_FLAG_TAGS = (
+    ('isMadeWithAi', 'AI-generated'), ('isOriginal', 'Original'),
+    ('isVfx', 'VFX'), ('isNew', 'New'))
+# Key layout of every clip _clip_from_json returns; copied per clip and filled in
+_CLIP_TEMPLATE = dict.fromkeys((
+    'clip_id', 'title', 'creator', 'thumbnail_url', 'duration', 'resolution', 'tags',
+    'collection', 'frame_rate', 'camera', 'formats', 'source_url', 'm3u8_url'), '')
+
+
+def _first_str(obj, keys):
+    """First truthy obj[key] over keys, as a string ('' if none) — the
+    str(a or b or ...) idiom without evaluating the whole chain."""
+    for key in keys:
+        value = obj.get(key)
+        if value:
+            return value if type(value) is str else str(value)
+    return ''
+
+
+def _walk_json_for_clips(obj, depth=0, make_clip=None):
+    """Clip-like objects (numeric id of 4+ digits) in a decoded JSON tree, mapped
+    through make_clip(obj, cid) — _clip_from_json unless a caller wraps it.
+
+    Iterative (explicit stack, document order) so large GraphQL payloads
+    don't pay a Python call per node; nodes deeper than 12 are ignored.
+    """
+    make_clip = make_clip or _clip_from_json
+    clips = []
+    if depth > 12 or type(obj) not in (dict, list):
+        return clips
+    # Only containers are pushed; scalars can never hold a clip
+    stack = [(obj, depth)]
+    pop, push = stack.pop, stack.append
+    while stack:
+        node, d = pop()
+        if type(node) is list:
+            children = reversed(node)
+        else:
+            # Check if this looks like a clip object — accept numeric id 4+ digits
+            cid = (node.get('id') or node.get('clipId') or node.get('clip_id') or
+                   node.get('assetId') or node.get('asset_id'))
+            if cid:
+                # Integer ids (the usual case) skip the str() + regex round trip
+                if cid >= 1000 if type(cid) is int else _NUMID_RE.match(str(cid)):
+                    clips.append(make_clip(node, str(cid)))
+                    continue  # Don't descend into children of a clip object
+            children = reversed(node.values())
+        d += 1
+        if d > 12:
+            continue
+        for child in children:
+            t = type(child)
+            if t is dict or t is list:
+                push((child, d))
+    return clips
+
+
+def _clip_from_json(obj, cid):
+    """Map one clip-like JSON object (numeric id already checked) to clip meta."""
+    # This has a clip-like ID — extract everything we can
+    # ── Title ──
+    title = (
+        _first_str(obj, _CLIP_TITLE_KEYS) or
+        (obj.get('clipNameForUrl', '').replace('-', ' ').title() if obj.get('clipNameForUrl') else '') or
+        (obj.get('slug', '').replace('-', ' ').title() if obj.get('slug') else '') or
+        _first_str(obj, ('description',)))
+    # ── Slug → URL ──
+    slug = _first_str(obj, _CLIP_SLUG_KEYS)
+    # ── Creator/artist ──
+    creator = _first_str(obj, _CLIP_CREATOR_KEYS)
+    if not creator:
+        for ck in ('artist', 'creator', 'filmmaker', 'filmMaker', 'author', 'owner'):
+            av = obj.get(ck)
+            if isinstance(av, dict):
+                creator = _first_str(av, _CLIP_PERSON_NAME_KEYS)
+                break
+            elif isinstance(av, str) and av:
+                creator = av; break
+    # ── Thumbnail ──
+    # Most of these keys are absent; skip empty values before any type checks
+    thumb = ''
+    for tk in _CLIP_THUMB_KEYS:
+        tv = obj.get(tk)
+        if not tv:
+            continue
+        if isinstance(tv, str):
+            if tv.startswith('http'):
+                thumb = tv; break
+        elif isinstance(tv, dict) and tv.get('url'):
+            thumb = str(tv['url']); break
+    # ── Duration (Artlist returns ms, convert to seconds) ──
+    dur_raw = obj.get('duration', '') or obj.get('length', '') or obj.get('durationInSeconds', '') or ''
+    if dur_raw:
+        try:
+            dur_val = int(dur_raw)
+            # Artlist returns ms (values >1000), convert to seconds
+            duration = str(round(dur_val / 1000, 1)) if dur_val > 1000 else str(dur_val)
+        except (ValueError, TypeError):
+            duration = str(dur_raw)
+    else:
+        duration = ''
+    # ── Resolution (Artlist uses width/height, not a 'resolution' field) ──
+    resolution = _first_str(obj, _CLIP_RESOLUTION_KEYS)
+    if not resolution:
+        w = obj.get('width')
+        h = obj.get('height')
+        if w and h:
+            resolution = '%sx%s' % (w, h)
+    # ── Source URL ──
+    source_url = _first_str(obj, _CLIP_PAGE_URL_KEYS)
+    if not source_url and slug:
+        source_url = f'https://artlist.io/stock-footage/clip/{slug}/{cid}'
+    # ── M3U8 / Video URL (clipPath is the HLS manifest!) ──
+    m3u8 = ''
+    for vk in _CLIP_VIDEO_KEYS:
+        vv = obj.get(vk)
+        if vv and isinstance(vv, str) and vv.startswith('http'):
+            m3u8 = vv; break
+    # ── Tags (build from boolean flags if no tags array) ──
+    tags_raw = obj.get('tags', obj.get('keywords', obj.get('labels', [])))
+    if isinstance(tags_raw, str):
+        tags = tags_raw
+    elif isinstance(tags_raw, list) and tags_raw:
+        tags = ', '.join(
+            str(t.get('name', '') if isinstance(t, dict) else t)
+            for t in tags_raw[:25])
+    else:
+        # Build tags from Artlist boolean flags
+        flag_tags = [label for key, label in _CLIP_FLAG_TAGS if obj.get(key)]
+        orient = obj.get('orientation', '')
+        if orient: flag_tags.append(str(orient).capitalize())
+        tags = ', '.join(flag_tags)
+    # ── Collection/story ──
+    collection = _first_str(obj, _CLIP_COLLECTION_KEYS)
+    if not collection:
+        for stk in ('collection', 'story', 'folder'):
+            sv = obj.get(stk)
+            if isinstance(sv, dict):
+                collection = _first_str(sv, ('name', 'title'))
+                break
+            elif isinstance(sv, str) and sv:
+                collection = sv; break
+    # Only require the numeric ID — don't require title/thumb
+    # (GraphQL responses may have minimal fields on first page)
+    # ── Formats (Artlist uses availableFormats as a list) ──
+    fmt_raw = obj.get('availableFormats', obj.get('formats', obj.get('available_formats', '')))
+    if isinstance(fmt_raw, list):
+        formats = ', '.join(str(f) for f in fmt_raw)
+    else:
+        formats = str(fmt_raw) if fmt_raw else ''
+    clip = _CLIP_TEMPLATE.copy()
+    clip['clip_id'] = cid
+    clip['title'] = title
+    clip['creator'] = creator
+    clip['thumbnail_url'] = thumb
+    clip['duration'] = duration
+    clip['resolution'] = resolution
+    clip['tags'] = tags
+    clip['collection'] = collection
+    clip['frame_rate'] = _first_str(obj, _CLIP_FPS_KEYS)
+    clip['camera'] = _first_str(obj, _CLIP_CAMERA_KEYS)
+    clip['formats'] = formats
+    clip['source_url'] = source_url
+    clip['m3u8_url'] = m3u8
+    return clip
+
+
+def _graphql_clip_root(data):
+    """(node, depth) of a decoded GraphQL response worth walking for clips.
+
+    Only the 'data' branch can hold clips (never 'errors' or 'extensions'),
+    so an errors-only response gives (None, 0). Other shapes are walked whole.
+    """
+    if type(data) is dict and ('data' in data or 'errors' in data):
+        return (data.get('data') or None), 1
+    return data, 0
+
+
+def _walk_graphql_body_for_clips(body):
+    """Decode one GraphQL response body and walk it for clips. The browser
+    bootstrap hands large bodies to a worker process that runs this."""
+    node, depth = _graphql_clip_root(_json_loads(body))
+    return _walk_json_for_clips(node, depth) if node is not None else []
+
+
+def _walk_graphql_pages_for_clips(body):
+    """Clips per operation of a GraphQL response body: one list per entry of a
+    batched (array) response, a single list otherwise. Same worker-process
+    use as _walk_graphql_body_for_clips, for the pagination phase."""
+    data = _json_loads(body)
+    pages = []
+    for op in (data if type(data) is list else (data,)):
+        node, depth = _graphql_clip_root(op)
+        pages.append(_walk_json_for_clips(node, depth) if node is not None else [])
+    return pages
@@ -54,10 +54,16 @@ def build(SiteProfile):
             try {
                 const nd = document.getElementById('__NEXT_DATA__');
                 if (nd) {
-                    const data = JSON.parse(nd.textContent);
-                    const walk = (obj) => {
-                        if (!obj || typeof obj !== 'object') return;
-                        if (Array.isArray(obj)) { obj.forEach(walk); return; }
+                    // Explicit stack, children pushed in reverse so clips
+                    // come out in document order
+                    const stack = [JSON.parse(nd.textContent)];
+                    while (stack.length) {
+                        const obj = stack.pop();
+                        if (!obj || typeof obj !== 'object') continue;
+                        if (Array.isArray(obj)) {
+                            for (let i = obj.length - 1; i >= 0; i--) stack.push(obj[i]);
+                            continue;
+                        }
                         // Look for clip-like objects with numeric IDs
                         const id = String(obj.id || obj.clipId || obj.clip_id || '');
                         if (id && /^\\d{4,}$/.test(id) && !seen.has(id)) {
@@ -78,9 +84,9 @@ def build(SiteProfile):
                                 formats: obj.formats || '',
                             });
                         }
-                        Object.values(obj).forEach(walk);
-                    };
-                    walk(data);
+                        const vals = Object.values(obj);
+                        for (let i = vals.length - 1; i >= 0; i--) stack.push(vals[i]);
+                    }
                 }
             } catch(e) {}
 
@@ -0,0 +1,296 @@
+import asyncio
+import contextlib
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import artlist_scraper as app  # noqa: E402
+
+
+class _RecordingDB:
+    def __init__(self, existing=()):
+        self.existing = set(existing)
+        self.saved = []
+        self.updated = []
+        self.batches = 0
+
+    @contextlib.contextmanager
+    def batch(self):
+        self.batches += 1
+        yield self
+
+    def save_clip(self, meta):
+        self.saved.append(dict(meta))
+        if meta["clip_id"] in self.existing:
+            return False
+        self.existing.add(meta["clip_id"])
+        return True
+
+    def update_metadata(self, clip_id, meta):
+        self.updated.append(clip_id)
+
+    def stats(self):
+        return {}
+
+
+class _Request:
+    def __init__(self, resource_type="fetch"):
+        self.resource_type = resource_type
+
+
+class _JsonResponse:
+    status = 200
+
+    def __init__(self, payload, url="https://artlist.io/api/graphql", resource_type="fetch"):
+        self.url = url
+        self.request = _Request(resource_type)
+        self._body = json.dumps(payload)
+        self.headers = {"content-type": "application/json", "content-length": str(len(self._body))}
+
+    async def body(self):
+        return self._body.encode()
+
+
+class _CardsPage:
+    def __init__(self, result):
+        self.result = result
+        self.scripts = []
+
+    async def evaluate(self, script, arg=None):
+        self.scripts.append(script)
+        return self.result
+
+
+class _CatalogWorkerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        patcher = patch.object(app, "get_thumbnail_cache_dir", return_value=self.tmp.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _worker(self, db):
+        worker = app.CrawlerWorker({}, db=db, profile=app.SiteProfile.get("Artlist"))
+        self.thumbs = []
+        worker._download_thumb_url = lambda *args: self.thumbs.append(args[2])
+        return worker
+
+
+class CatalogApiWalkTests(_CatalogWorkerTestCase):
+    def test_walk_saves_nested_clips_in_document_order(self):
+        db = _RecordingDB(existing={"2000"})
+        payload = {
+            "data": {
+                "page": {"id": "abc", "title": "not a clip"},
+                "clips": [
+                    {"id": 1000, "title": "First", "tags": [{"name": "sea"}, "sky"],
+                     "previewUrl": "https://cdn.example/1000.m3u8",
+                     "related": [{"clipId": "3000", "name": "Nested"}]},
+                    {"clip_id": "2000", "title": "Existing"},
+                ],
+                "meta": {"count": 2, "id": "12"},
+            }
+        }
+
+        worker = self._worker(db)
+        payload["data"]["clips"][1]["thumbnailUrl"] = "https://cdn.example/2000.jpg"
+
+        async def intercept():
+            await worker._on_catalog_response(
+                _JsonResponse(payload), "https://artlist.io/stock-footage")
+            scheduled = len(worker._pending_thumbs)
+            await worker._drain_thumb_downloads()
+            return scheduled
+
+        self.assertEqual(asyncio.run(intercept()), 1)
+        self.assertEqual(self.thumbs, ["2000"])
+        self.assertFalse(worker._pending_thumbs)
+        self.assertEqual([m["clip_id"] for m in db.saved], ["1000", "3000", "2000"])
+        first = db.saved[0]
+        self.assertEqual(first["tags"], "sea, sky")
+        self.assertEqual(first["m3u8_url"], "https://cdn.example/1000.m3u8")
+        self.assertEqual(first["source_site"], "Artlist")
+        self.assertEqual(db.saved[1]["title"], "Nested")
+        self.assertEqual(db.updated, ["2000"])
+        self.assertEqual(db.batches, 1)
+
+    def test_existing_thumbnails_are_not_downloaded_again(self):
+        db = _RecordingDB()
+        worker = self._worker(db)
+        with open(os.path.join(self.tmp.name, "1000.jpg"), "wb") as fh:
+            fh.write(b"jpeg")
+        payload = {"clips": [
+            {"id": 1000, "thumbnailUrl": "https://cdn.example/1000.jpg"},
+            {"id": 1001, "thumbnailUrl": "https://cdn.example/1001.jpg"},
+        ]}
+
+        async def intercept():
+            await worker._on_catalog_response(
+                _JsonResponse(payload), "https://artlist.io/stock-footage")
+            await worker._drain_thumb_downloads()
+
+        asyncio.run(intercept())
+
+        self.assertEqual(self.thumbs, ["1001"])
+        self.assertIsNone(worker._thumb_pool)
+
+    def test_payloads_without_numeric_clip_ids_are_not_decoded(self):
+        db = _RecordingDB()
+        payload = {"data": {"flags": [{"id": "abc", "enabled": True}], "version": 12345}}
+
+        with patch.object(app.json, "loads", wraps=json.loads) as loads:
+            asyncio.run(self._worker(db)._on_catalog_response(
+                _JsonResponse(payload), "https://artlist.io/stock-footage"))
+
+        loads.assert_not_called()
+        self.assertEqual(db.saved, [])
+
+    def test_oversized_or_telemetry_responses_skip_the_body_download(self):
+        db = _RecordingDB()
+        worker = self._worker(db)
+        payload = {"clips": [{"id": 1000, "title": "Never read"}]}
+        oversized = _JsonResponse(payload)
+        oversized.headers["content-length"] = str(app._CATALOG_BODY_MAX + 1)
+        telemetry = _JsonResponse(payload, url="https://artlist.io/api/analytics/events")
+
+        downloads = []
+
+        async def body():
+            downloads.append(True)
+            return b""
+
+        async def intercept():
+            for response in (oversized, telemetry):
+                response.body = body
+                await worker._on_catalog_response(response, "https://artlist.io/stock-footage")
+
+        asyncio.run(intercept())
+
+        self.assertEqual(downloads, [])
+        self.assertEqual(db.saved, [])
+
+
+class CatalogCardExtractionTests(_CatalogWorkerTestCase):
+    def test_generic_cards_come_from_a_single_evaluate(self):
+        db = _RecordingDB()
+        worker = self._worker(db)
+        worker.profile = app.SiteProfile.get("Generic")
+        page = _CardsPage({"source": "dom", "cards": [
+            {"clip_id": "5555", "title": "Dom card", "source_url": "/clip/5555"},
+        ]})
+
+        count = asyncio.run(worker._extract_catalog_cards(page, "https://example.com/videos"))
+
+        self.assertEqual(count, 1)
+        self.assertEqual(page.scripts, [app.CrawlerWorker.GENERIC_CARDS_SCRIPT])
+        self.assertEqual(db.saved[0]["source_url"], "https://example.com/clip/5555")
+
+    def test_relative_card_urls_resolve_against_the_catalog_page(self):
+        db = _RecordingDB()
+        worker = self._worker(db)
+        worker.profile = app.SiteProfile.get("Generic")
+        page = _CardsPage({"source": "next", "cards": [
+            {"clip_id": "5555", "source_url": "clip/5555"},
+            {"clip_id": "5556", "source_url": "//cdn.example.com/clip/5556"},
+            {"clip_id": "5557", "source_url": "https://other.example/clip/5557"},
+        ]})
+
+        asyncio.run(worker._extract_catalog_cards(page, "https://example.com/videos/nature"))
+
+        self.assertEqual([m["source_url"] for m in db.saved], [
+            "https://example.com/videos/clip/5555",
+            "https://cdn.example.com/clip/5556",
+            "https://other.example/clip/5557",
+        ])
+
+    def test_profile_and_generic_extractors_share_one_evaluate(self):
+        db = _RecordingDB()
+        worker = self._worker(db)
+        page = _CardsPage({"source": "profile", "profile_count": 1, "cards": [
+            {"clip_id": "7777", "title": "Profile card"},
+        ]})
+
+        count = asyncio.run(worker._extract_catalog_cards(page, "https://artlist.io/stock-footage"))
+
+        self.assertEqual(count, 1)
+        combined = app.CrawlerWorker._catalog_cards_script(worker.profile.catalog_card_js)
+        self.assertEqual(page.scripts, [combined])
+        self.assertIn(app.CrawlerWorker.GENERIC_CARDS_SCRIPT.strip(), combined)
+
+    def test_broken_profile_script_falls_back_to_generic_extractors(self):
+        db = _RecordingDB()
+        worker = self._worker(db)
+        page = _CardsPage({"source": "next", "cards": [{"clip_id": "8888"}]})
+        evaluate = page.evaluate
+
+        async def fail_combined(script, arg=None):
+            if script is not app.CrawlerWorker.GENERIC_CARDS_SCRIPT:
+                page.scripts.append(script)
+                raise RuntimeError("SyntaxError: Unexpected token")
+            return await evaluate(script, arg)
+
+        page.evaluate = fail_combined
+
+        count = asyncio.run(worker._extract_catalog_cards(page, "https://artlist.io/stock-footage"))
+
+        self.assertEqual(count, 1)
+        self.assertEqual(page.scripts[-1], app.CrawlerWorker.GENERIC_CARDS_SCRIPT)
+        self.assertEqual(db.saved[0]["clip_id"], "8888")
+
+    def test_scroll_rounds_only_save_new_or_changed_cards(self):
+        db = _RecordingDB()
+        worker = self._worker(db)
+        worker.profile = app.SiteProfile.get("Generic")
+        first = {"clip_id": "5555", "title": "First", "source_url": "https://example.com/clip/5555"}
+        page = _CardsPage({"source": "dom", "cards": [first]})
+        seen_cards = {}
+
+        async def rounds():
+            counts = [await worker._extract_catalog_cards(page, "https://example.com/videos", seen_cards)]
+            counts.append(await worker._extract_catalog_cards(page, "https://example.com/videos", seen_cards))
+            page.result = {"source": "dom", "cards": [
+                first, {"clip_id": "6666", "title": "Second"}]}
+            counts.append(await worker._extract_catalog_cards(page, "https://example.com/videos", seen_cards))
+            return counts
+
+        self.assertEqual(asyncio.run(rounds()), [1, 0, 1])
+        self.assertEqual([m["clip_id"] for m in db.saved], ["5555", "6666"])
+
+
+class ResponseFilterTests(_CatalogWorkerTestCase):
+    def test_only_wanted_responses_spawn_handler_tasks(self):
+        worker = self._worker(_RecordingDB())
+        handled, observed = [], []
+        worker._observe_crawl_budget_response = lambda url, *args: observed.append(url)
+
+        async def handler(resp):
+            handled.append(resp.url)
+
+        async def dispatch():
+            listener = worker._filtered_response_handler(
+                "https://artlist.io/stock-footage", handler,
+                lambda resp: resp.request.resource_type in app._API_RESOURCE_TYPES)
+            listener(_JsonResponse({}, url="https://artlist.io/logo.png", resource_type="image"))
+            listener(_JsonResponse({}, url="https://artlist.io/api/clips", resource_type="xhr"))
+            self.assertEqual(len(worker._response_tasks), 1)
+            await asyncio.gather(*worker._response_tasks)
+
+        asyncio.run(dispatch())
+
+        self.assertEqual(handled, ["https://artlist.io/api/clips"])
+        self.assertEqual(observed, ["https://artlist.io/logo.png"])
+        self.assertFalse(worker._response_tasks)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import artlist_scraper as app  # noqa: E402
+
+
+class ProcessedUrlCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "clips.db")
+        self.db = app.DB(self.db_path)
+
+    def tearDown(self):
+        self.db.close()
+        self.tmp.cleanup()
+
+    def test_processed_urls_load_once_and_track_status_changes(self):
+        self.db.mark_processed("https://example.com/a")
+        self.db.mark_failed("https://example.com/b")
+        self.db.close()
+        self.db = app.DB(self.db_path)
+
+        self.assertTrue(self.db.is_processed("https://example.com/a"))
+        self.assertFalse(self.db.is_processed("https://example.com/b"))
+
+        self.db.mark_processed("https://example.com/b")
+        self.assertTrue(self.db.is_processed("https://example.com/b"))
+        self.db.mark_failed("https://example.com/a")
+        self.assertFalse(self.db.is_processed("https://example.com/a"))
+
+    def test_is_processed_many_returns_only_done_urls(self):
+        self.db.mark_processed("https://example.com/a")
+        self.db.mark_failed("https://example.com/b")
+
+        self.assertEqual(
+            self.db.is_processed_many([
+                "https://example.com/a", "https://example.com/b", "https://example.com/c"]),
+            {"https://example.com/a"})
+        self.assertEqual(self.db.is_processed_many([]), set())
+
+    def test_forget_and_clear_drop_cached_entries(self):
+        self.db.mark_processed("https://example.com/start")
+        self.db.mark_processed("https://example.com/other")
+        self.assertTrue(self.db.is_processed("https://example.com/start"))
+
+        self.db.forget_processed("https://example.com/start")
+        self.assertFalse(self.db.is_processed("https://example.com/start"))
+        self.assertEqual(self.db.proc_count(), 1)
+
+        self.db.clear_all()
+        self.assertFalse(self.db.is_processed("https://example.com/other"))
+
+
+class BatchedWriteTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "clips.db")
+        self.db = app.DB(self.db_path)
+
+    def tearDown(self):
+        self.db.close()
+        self.tmp.cleanup()
+
+    def _other_connection_count(self, table):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        finally:
+            conn.close()
+
+    def test_batch_commits_once_when_outermost_scope_exits(self):
+        with self.db.batch():
+            with self.db.batch():
+                self.assertTrue(self.db.save_clip({"clip_id": "101", "title": "One"}))
+                self.db.enqueue("https://example.com/clip/101", 1, 10, profile="Pexels")
+            self.assertTrue(self.db.save_clip({"clip_id": "102", "title": "Two"}))
+            self.db.update_metadata("101", {"creator": "Jane"})
+            self.assertEqual(self._other_connection_count("clips"), 0)
+
+        self.assertEqual(self._other_connection_count("clips"), 2)
+        self.assertEqual(self._other_connection_count("crawl_queue"), 1)
+        self.assertEqual(self.db.search("Jane")[0]["clip_id"], "101")
+
+    def test_open_batch_does_not_defer_other_threads_commits(self):
+        with self.db.batch():
+            writer = threading.Thread(
+                target=self.db.enqueue, args=("https://example.com/clip/201", 1, 10),
+                kwargs={"profile": "Pexels"})
+            writer.start()
+            writer.join()
+            self.assertEqual(self._other_connection_count("crawl_queue"), 1)
+
+    def test_recorded_thumb_paths_come_in_keyset_chunks(self):
+        self.db.save_clips([{"clip_id": str(300 + i)} for i in range(5)])
+        for cid in ("300", "302", "303", "304"):
+            self.db.update_thumb_path(cid, f"/thumbs/{cid}.jpg")
+
+        first = self.db.recorded_thumb_paths(limit=2)
+        rest = self.db.recorded_thumb_paths(first[-1][0], limit=2)
+
+        self.assertEqual([r[1] for r in first + rest], ["300", "302", "303", "304"])
+        self.assertEqual(self.db.recorded_thumb_paths(rest[-1][0], limit=2), [])
+
+    def test_save_clips_inserts_new_rows_and_indexes_them_for_search(self):
+        self.assertTrue(self.db.save_clip({"clip_id": "101", "title": "Ocean"}))
+
+        new_ids = self.db.save_clips([
+            {"clip_id": "101", "title": "Ocean again"},
+            {"clip_id": "102", "title": "Forest", "creator": "Jane"},
+            {"clip_id": "102", "title": "Forest duplicate"},
+            {"clip_id": "", "title": "No id"},
+        ])
+
+        self.assertEqual(new_ids, {"102"})
+        self.assertEqual(self.db.save_clips([]), set())
+        self.assertEqual(self._other_connection_count("clips"), 2)
+        rows = {r["clip_id"]: r for r in self.db.get_clips_by_ids(["101", "102"])}
+        self.assertEqual(rows["101"]["title"], "Ocean")
+        self.assertEqual(rows["102"]["title"], "Forest")
+        self.assertEqual([r["clip_id"] for r in self.db.search("Jane")], ["102"])
+
+    def test_enqueue_many_ignores_duplicates(self):
+        self.db.enqueue("https://example.com/a", 0, 5, profile="Pexels")
+        self.db.enqueue_many([
+            ("https://example.com/a", 1, 10, "Pexels"),
+            ("https://example.com/b", 1, 10, "Pexels"),
+        ])
+        self.db.enqueue_many([])
+
+        self.assertEqual(self.db.queue_size("Pexels"), 2)
+        self.assertEqual(self._other_connection_count("crawl_queue"), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
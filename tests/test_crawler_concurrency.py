@@ -0,0 +1,636 @@
+import asyncio
+import contextlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import artlist_scraper as app  # noqa: E402
+
+
+class _FakeQueueDB:
+    def __init__(self, queues):
+        self.queues = {name: list(urls) for name, urls in queues.items()}
+        self.processed = []
+
+    def queue_size(self, profile=None):
+        if profile is None:
+            return sum(len(v) for v in self.queues.values())
+        return len(self.queues.get(profile, []))
+
+    def dequeue(self, profile=None):
+        urls = self.queues.get(profile) or []
+        if not urls:
+            return None
+        return {"url": urls.pop(0), "depth": 0}
+
+    def is_processed(self, url):
+        return False
+
+    def mark_processed(self, url, depth=0):
+        self.processed.append(url)
+
+    def stats(self):
+        return {}
+
+
+class _FakePage:
+    async def close(self):
+        pass
+
+
+class _FakeContext:
+    def __init__(self):
+        self.pages_opened = 0
+
+    async def new_page(self):
+        self.pages_opened += 1
+        return _FakePage()
+
+
+class ProfileBatchConcurrencyTests(unittest.TestCase):
+    def test_profile_batches_run_concurrently_with_task_local_profiles(self):
+        pexels = app.SiteProfile.get("Pexels")
+        mixkit = app.SiteProfile.get("Mixkit")
+        db = _FakeQueueDB({
+            "Pexels": ["https://www.pexels.com/video/sample-1234/"],
+            "Mixkit": ["https://mixkit.co/free-stock-video/sample-5678/"],
+        })
+        worker = app.CrawlerWorker(
+            {"page_delay": 0, "resume": False},
+            db=db,
+            profiles=[pexels, mixkit],
+        )
+        seen = []
+
+        async def fake_crawl(*args):
+            url = args[1]
+            await asyncio.sleep(0)
+            seen.append((worker.profile.name, url, worker._video_re.pattern))
+
+        async def no_challenge(_page):
+            return False
+
+        worker._crawl_clip = fake_crawl
+        worker._crawl_catalog = fake_crawl
+        worker._detect_challenge = no_challenge
+        context = _FakeContext()
+
+        async def run_batches():
+            slots = asyncio.Semaphore(4)
+            return await asyncio.gather(*[
+                worker._run_profile_batch(context, prof, None, "full", slots)
+                for prof in (pexels, mixkit)
+            ])
+
+        ran = asyncio.run(run_batches())
+
+        self.assertEqual(ran, [True, True])
+        self.assertEqual(context.pages_opened, 2)
+        by_profile = {name: (url, pattern) for name, url, pattern in seen}
+        self.assertIn("pexels.com", by_profile["Pexels"][0])
+        self.assertIn("mixkit.co", by_profile["Mixkit"][0])
+        self.assertEqual(by_profile["Mixkit"][1], mixkit.get_combined_video_re().pattern)
+        self.assertEqual(worker._page_count, 2)
+        self.assertIs(worker.profile, pexels)
+
+    def test_empty_profile_queue_reports_no_work(self):
+        pexels = app.SiteProfile.get("Pexels")
+        worker = app.CrawlerWorker({}, db=_FakeQueueDB({}), profile=pexels)
+        context = _FakeContext()
+
+        ran = asyncio.run(worker._run_profile_batch(
+            context, pexels, None, "full", asyncio.Semaphore(1)))
+
+        self.assertFalse(ran)
+        self.assertEqual(context.pages_opened, 0)
+
+    def test_challenge_probe_only_runs_for_suspicious_navigation_status(self):
+        pexels = app.SiteProfile.get("Pexels")
+        db = _FakeQueueDB({"Pexels": [
+            "https://www.pexels.com/video/ok-1111/",
+            "https://www.pexels.com/video/blocked-2222/",
+        ]})
+        worker = app.CrawlerWorker(
+            {"page_delay": 0, "resume": False}, db=db, profile=pexels)
+        probed = []
+
+        async def fake_crawl(*args):
+            url = args[1]
+            worker._nav_status.set(403 if "blocked" in url else 200)
+
+        async def detect(_page):
+            probed.append(worker._nav_status.get())
+            return False
+
+        worker._crawl_clip = fake_crawl
+        worker._crawl_catalog = fake_crawl
+        worker._detect_challenge = detect
+
+        asyncio.run(worker._run_profile_batch(
+            _FakeContext(), pexels, None, "full", asyncio.Semaphore(1)))
+
+        self.assertEqual(probed, [403])
+
+
+class _PoolPage:
+    def __init__(self):
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+
+class _PoolContext:
+    def __init__(self):
+        self.pages = []
+
+    async def new_page(self):
+        page = _PoolPage()
+        self.pages.append(page)
+        return page
+
+
+class ClipPagePoolTests(unittest.TestCase):
+    def test_clip_tabs_are_reused_then_recycled_after_max_uses(self):
+        worker = app.CrawlerWorker({"max_concurrent_pages": 2}, db=None,
+                                   profile=app.SiteProfile.get("Pexels"))
+        context = _PoolContext()
+
+        async def run():
+            page, uses = await worker._acquire_clip_page(context)
+            for _ in range(worker._CLIP_PAGE_MAX_USES - 1):
+                await worker._release_clip_page(page, uses + 1)
+                again, uses = await worker._acquire_clip_page(context)
+                self.assertIs(again, page)
+            await worker._release_clip_page(page, uses + 1)
+            fresh, fresh_uses = await worker._acquire_clip_page(context)
+            await worker._release_clip_page(fresh, fresh_uses + 1)
+            await worker._close_clip_pages()
+            return page, fresh
+
+        first, fresh = asyncio.run(run())
+
+        self.assertEqual(len(context.pages), 2)
+        self.assertTrue(first.closed)
+        self.assertIsNot(fresh, first)
+        self.assertTrue(fresh.closed)
+        self.assertEqual(worker._clip_pages, [])
+
+    def test_closed_pooled_tab_is_replaced(self):
+        worker = app.CrawlerWorker({}, db=None, profile=app.SiteProfile.get("Pexels"))
+        context = _PoolContext()
+
+        async def run():
+            page, uses = await worker._acquire_clip_page(context)
+            await worker._release_clip_page(page, uses + 1)
+            page.closed = True
+            return page, (await worker._acquire_clip_page(context))[0]
+
+        dead, replacement = asyncio.run(run())
+
+        self.assertIsNot(dead, replacement)
+        self.assertEqual(len(context.pages), 2)
+
+
+class _CountingStatsDB:
+    def __init__(self):
+        self.calls = 0
+
+    def stats(self):
+        self.calls += 1
+        return {"clips": self.calls}
+
+
+class StatsThrottleTests(unittest.TestCase):
+    def test_unforced_stats_are_throttled_but_forced_always_emit(self):
+        db = _CountingStatsDB()
+        worker = app.CrawlerWorker({}, db=db, profile=app.SiteProfile.get("Pexels"))
+        emitted = []
+        worker.stats_signal.connect(emitted.append)
+
+        with patch.object(app.time, "monotonic", side_effect=[100.0, 100.1, 100.2, 100.7]):
+            worker._emit_stats()
+            worker._emit_stats()
+            worker._emit_stats(force=True)
+            worker._emit_stats()
+
+        self.assertEqual(db.calls, 3)
+        self.assertEqual(len(emitted), 3)
+
+
+class _ScrollPage:
+    def __init__(self, states):
+        self.states = list(states)
+        self.steps = 0
+        self.scripts = []
+
+    async def evaluate(self, script, arg=None):
+        self.scripts.append(script)
+        if script is app.CrawlerWorker.SCROLL_STEP_SCRIPT:
+            self.steps += 1
+            return self.states.pop(0) if self.states else [5000, 12]
+
+
+class ScrollEarlyExitTests(unittest.TestCase):
+    def _scroll(self, states):
+        worker = app.CrawlerWorker({"scroll_steps": 15}, db=None,
+                                   profile=app.SiteProfile.get("Pexels"))
+        page = _ScrollPage(states)
+
+        async def no_sleep(_delay):
+            pass
+
+        with patch.object(app.asyncio, "sleep", no_sleep):
+            asyncio.run(worker._scroll_to_bottom(page))
+        return page
+
+    def test_scrolling_stops_once_height_and_video_urls_stop_changing(self):
+        page = self._scroll([[3000, 0], [3000, 4], [4000, 9], [5000, 12]])
+
+        self.assertEqual(page.steps, 6)
+        self.assertNotIn(app.CrawlerWorker.SCROLL_STEP_SCRIPT, page.scripts[-1:])
+
+    def test_growing_page_uses_every_step(self):
+        page = self._scroll([[1000 * n, n] for n in range(1, 16)])
+
+        self.assertEqual(page.steps, 15)
+
+
+class _IngestDB:
+    def __init__(self):
+        self.saved = []
+        self.batches = 0
+
+    @contextlib.contextmanager
+    def batch(self):
+        self.batches += 1
+        yield self
+
+    def save_clip(self, meta):
+        self.saved.append(meta["clip_id"])
+        return True
+
+    def stats(self):
+        return {}
+
+
+class DirectIngestThumbTests(unittest.TestCase):
+    def test_ingest_downloads_thumbnails_concurrently(self):
+        db = _IngestDB()
+        worker = app.DirectScrapeWorker({}, db)
+        self.addCleanup(worker._http.close)
+        # Every download waits for a second one to start, so a sequential
+        # ingest would break the barrier instead of finishing.
+        barrier = threading.Barrier(2, timeout=5)
+        fetched = []
+
+        def download(url, clip_id, thumb_dir):
+            barrier.wait()
+            fetched.append(clip_id)
+
+        worker._download_thumb = download
+        clips = [{"clip_id": str(n), "thumbnail_url": f"https://cdn.example/{n}.jpg"}
+                 for n in range(4)]
+        clips.append({"clip_id": "9", "thumbnail_url": ""})
+
+        counts = asyncio.run(worker._ingest_clips(clips, "/tmp", "test"))
+
+        self.assertEqual(counts, (5, 0))
+        self.assertEqual(db.saved, ["0", "1", "2", "3", "9"])
+        self.assertEqual(db.batches, 1)
+        self.assertEqual(sorted(fetched), ["0", "1", "2", "3"])
+
+    def test_existing_thumbnails_come_from_one_directory_listing(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        Path(tmp.name, "1.jpg").write_bytes(b"\xff\xd8" + b"\0" * 600)
+        Path(tmp.name, "2.jpg").write_bytes(b"")  # empty partial write
+        for n in range(4, 40):  # never asked for, so never stat()ed
+            Path(tmp.name, f"{n}.jpg").write_bytes(b"\xff\xd8" + b"\0" * 600)
+        worker = app.DirectScrapeWorker({}, _IngestDB())
+        worker.db.update_thumb_path = lambda clip_id, path: None
+        fetched = []
+
+        class _Http:
+            def request(self, method, url, headers=None, data=None, timeout=15, max_size=None):
+                fetched.append(url)
+                return 200, {}, b"\xff\xd8" + b"\0" * 600
+
+        worker._http = _Http()
+        with patch("os.path.isfile", side_effect=AssertionError("no per-clip stat")), \
+                patch("os.path.getsize", wraps=os.path.getsize) as getsize:
+            for n in (1, 2, 3, 3):
+                worker._download_thumb(f"https://cdn.example/{n}.jpg", str(n), tmp.name)
+
+        self.assertEqual(fetched, ["https://cdn.example/2.jpg", "https://cdn.example/3.jpg"])
+        self.assertEqual(sorted(os.path.basename(c.args[0]) for c in getsize.call_args_list),
+                         ["1.jpg", "2.jpg", "3.jpg"])
+        self.assertLessEqual({"1.jpg", "2.jpg", "3.jpg"}, worker._thumb_files(tmp.name))
+
+    def test_concurrent_first_callers_share_one_directory_listing(self):
+        worker = app.DirectScrapeWorker({}, _IngestDB())
+        listings = []
+        real_scandir = os.scandir
+
+        def slow_scandir(path):
+            listings.append(path)
+            threading.Event().wait(0.05)
+            return real_scandir(path)
+
+        with tempfile.TemporaryDirectory() as tmp, patch("os.scandir", slow_scandir):
+            threads = [threading.Thread(target=worker._thumb_files, args=(tmp,)) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        self.assertEqual(len(listings), 1)
+
+
+class _ProbeDB(_IngestDB):
+    def execute(self, *_args):
+        class _Cursor:
+            def fetchone(self):
+                return {"max_id": 0}
+        return _Cursor()
+
+
+class DirectProbeTests(unittest.TestCase):
+    def test_probe_windows_run_concurrently_and_keep_gap_order(self):
+        db = _ProbeDB()
+        worker = app.DirectScrapeWorker({"max_pages": 83}, db)
+        self.addCleanup(worker._http.close)
+        worker.log = lambda *args: None
+        start = 6590530 + 500
+        hits = {6451306, start - 3, start - 12}
+        lock = threading.Lock()
+        in_flight = [0, 0]  # current, peak
+        probed = []
+        budgets = set()
+
+        def get_json(url, timeout=15, **retry_kwargs):
+            if not url.endswith("/6451306.json"):  # skip the connectivity check
+                budgets.add(tuple(sorted(retry_kwargs.items())))
+            clip_id = int(url.rsplit("/", 1)[1].split(".")[0])
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+            threading.Event().wait(0.005)
+            with lock:
+                in_flight[0] -= 1
+                probed.append(clip_id)
+            return {"id": clip_id, "title": f"Clip {clip_id}"} if clip_id in hits else None
+
+        worker._http_get_json = get_json
+        with patch.object(app.time, "sleep"):
+            clips = worker._probe_clip_ids("build")
+
+        self.assertEqual([c["clip_id"] for c in clips],
+                         ["6451306", str(start - 3), str(start - 12)])
+        # 13 IDs down to the last hit, then 50 misses reach the gap inside
+        # the seventh window; the remaining 20 probes run past the jump
+        self.assertIn(start - 62, probed)
+        self.assertIn(start - 5000 - 63, probed)
+        self.assertEqual(len(probed), 1 + 70 + 20)
+        self.assertGreater(in_flight[1], 1)
+        self.assertEqual(db.saved, [])
+        self.assertEqual(budgets, {(("max_retry_delay", worker._PROBE_RETRY_MAX_DELAY),
+                                    ("retries", worker._PROBE_RETRIES))})
+
+
+class _DiscoveryPage:
+    def __init__(self, api_response=True):
+        self.api_response = api_response
+        self.calls = []
+        self.loaded = asyncio.Event()
+
+    async def wait_for_response(self, predicate, timeout):
+        self.calls.append(("wait", timeout))
+        await self.loaded.wait()
+        if not self.api_response:
+            raise TimeoutError("Timeout 8000ms exceeded")
+        return predicate(_JsonLikeResponse())
+
+    async def goto(self, url, wait_until, timeout):
+        self.calls.append(("goto", wait_until))
+        self.loaded.set()
+
+
+class _JsonLikeResponse:
+    class request:
+        resource_type = "fetch"
+
+
+_PLAYER_TRIGGER_HARNESS = """
+let hovered = 0;
+const el = {parentElement: null, dispatchEvent: () => { hovered++; }};
+globalThis.MouseEvent = class { constructor(type) { this.type = type; } };
+globalThis.document = {
+    querySelectorAll: sel => sel === 'video' ? [] : Array.from({length: 500}, () => el),
+    querySelector: () => null,
+};
+// Every idle callback fires on its 100 ms timeout with no idle time left
+globalThis.window = {requestIdleCallback: (cb, opts) =>
+    setTimeout(() => cb({timeRemaining: () => 0}), opts.timeout)};
+(%s)(300);
+setTimeout(() => { console.log(hovered / 4); process.exit(0); }, 700);
+"""
+
+
+class PlayerTriggerTests(unittest.TestCase):
+    @unittest.skipUnless(shutil.which("node"), "node is not installed")
+    def test_starved_idle_callbacks_still_hover_every_player_within_budget(self):
+        script = _PLAYER_TRIGGER_HARNESS % app.CrawlerWorker.PLAYER_TRIGGER_SCRIPT.strip()
+        out = subprocess.run(["node", "-e", script], capture_output=True, text=True, timeout=30)
+
+        self.assertEqual(out.stdout.strip(), "500", out.stderr)
+
+
+_VIDEO_INTERCEPT_HARNESS = """
+let observer;
+globalThis.window = globalThis;
+globalThis.XMLHttpRequest = function() {};
+XMLHttpRequest.prototype.open = function() {};
+globalThis.fetch = function() {};
+globalThis.requestAnimationFrame = () => {};  // background tab: frames never run
+globalThis.MutationObserver = class { constructor(cb) { observer = cb; } observe() {} };
+globalThis.document = {documentElement: {}};
+%s
+const video = {nodeName: 'VIDEO', src: 'https://cdn.example/clip.m3u8',
+               getAttribute: () => '', querySelectorAll: () => []};
+observer([{type: 'childList', addedNodes: [video]}]);
+setTimeout(() => { console.log(JSON.stringify([...window.__interceptedVideoUrls__])); process.exit(0); }, 400);
+"""
+
+
+class InterceptScriptTests(unittest.TestCase):
+    @unittest.skipUnless(shutil.which("node"), "node is not installed")
+    def test_queued_mutations_flush_without_animation_frames(self):
+        script = _VIDEO_INTERCEPT_HARNESS % app.CrawlerWorker.VIDEO_INTERCEPT_SCRIPT
+        out = subprocess.run(["node", "-e", script], capture_output=True, text=True, timeout=30)
+
+        self.assertEqual(out.stdout.strip(), '["https://cdn.example/clip.m3u8"]', out.stderr)
+
+
+class DiscoveryNavigationTests(unittest.TestCase):
+    def test_navigation_waits_for_first_api_response_not_network_idle(self):
+        for api_response in (True, False):
+            page = _DiscoveryPage(api_response)
+            asyncio.run(app.DirectScrapeWorker._goto_until_api_response(
+                page, "https://artlist.io/stock-footage", 30000))
+            self.assertEqual(page.calls, [("wait", 8000), ("goto", "domcontentloaded")])
+
+
+class WorkerEventLoopTests(unittest.TestCase):
+    def test_crawler_runs_share_the_browser_host_loop_until_shutdown(self):
+        host = app._BrowserHost()
+        loops = []
+
+        async def fake_crawl():
+            loops.append(asyncio.get_running_loop())
+
+        for _ in range(2):
+            worker = app.CrawlerWorker({}, db=None, profile=app.SiteProfile.get("Pexels"))
+            worker._crawl = fake_crawl
+            with patch.object(app, "_BROWSER_HOST", host):
+                worker.run()
+
+        self.assertEqual(len(loops), 2)
+        self.assertIs(loops[0], loops[1])
+        self.assertFalse(loops[0].is_closed())
+
+        host.shutdown()
+        self.assertTrue(loops[0].is_closed())
+
+    def test_direct_scrape_runs_on_a_private_loop_and_cancels_leftovers(self):
+        worker = app.DirectScrapeWorker({}, None)
+        worker.log = lambda *a: None
+        seen = {}
+
+        async def fake_scrape():
+            seen["loop"] = asyncio.get_running_loop()
+            seen["task"] = asyncio.ensure_future(asyncio.sleep(3600))
+
+        worker._direct_scrape = fake_scrape
+        worker.run()
+
+        self.assertTrue(seen["loop"].is_closed())
+        self.assertTrue(seen["task"].cancelled())
+
+    def test_browser_host_reuses_context_until_launch_key_changes(self):
+        host = app._BrowserHost()
+        launched = []
+
+        class FakeContext:
+            def __init__(self):
+                self.closed = False
+
+            def on(self, _event, _handler):
+                pass
+
+            async def close(self):
+                self.closed = True
+
+        async def launch(_pw):
+            ctx = FakeContext()
+            launched.append(ctx)
+            return ctx
+
+        host._pw = object()  # skip starting a real Playwright driver
+
+        async def acquire_three():
+            first = await host.acquire_context(("headless", "a"), launch)
+            second = await host.acquire_context(("headless", "a"), launch)
+            third = await host.acquire_context(("headless", "b"), launch)
+            return first, second, third
+
+        first, second, third = asyncio.run(acquire_three())
+
+        self.assertFalse(first[2])
+        self.assertTrue(second[2])
+        self.assertIs(first[1], second[1])
+        self.assertFalse(third[2])
+        self.assertTrue(launched[0].closed)
+        self.assertEqual(len(launched), 2)
+
+    def _crawl_on_fake_host(self, cfg, body):
+        host = app._BrowserHost()
+        keys, released = [], []
+
+        async def acquire_context(key, _launch):
+            keys.append(key)
+            return object(), object(), False
+
+        async def release_context():
+            released.append(True)
+
+        host.acquire_context = acquire_context
+        host.release_context = release_context
+        worker = app.CrawlerWorker(cfg, db=None, profile=app.SiteProfile.get("Pexels"))
+        worker.log = lambda *a, **k: None
+        worker._emit_stats = lambda force=False: None
+        worker._RESPONSE_DRAIN_TIMEOUT = 0
+        worker._run_configured_api_connectors = lambda: set()
+        worker._crawl_with_context = lambda context, pw: body(worker)
+        profile = {"profile_dir": tempfile.mkdtemp(), "slot": 0, "slots": 1, "rotating": False}
+        with patch.object(app, "_BROWSER_HOST", host), \
+                patch.object(app, "_browser_profile_context", return_value=profile):
+            try:
+                host.run(worker._crawl())
+            finally:
+                host.shutdown()
+        return keys, released
+
+    def test_failed_crawl_closes_its_tabs_and_tasks(self):
+        closed, hung = [], []
+
+        class FakePage:
+            def is_closed(self):
+                return False
+
+            async def close(self):
+                closed.append(self)
+
+        async def body(worker):
+            worker._clip_pages.append([FakePage(), 0])
+            task = asyncio.ensure_future(asyncio.sleep(3600))
+            hung.append(task)
+            worker._response_tasks.add(task)
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            self._crawl_on_fake_host({"headless": True}, body)
+        self.assertEqual(len(closed), 1)
+        self.assertTrue(hung[0].cancelled())
+
+    def test_headed_crawl_closes_its_window_and_launch_key_covers_options(self):
+        async def body(_worker):
+            pass
+
+        headed_keys, released = self._crawl_on_fake_host({"headless": False}, body)
+        self.assertEqual(released, [True])
+        headless_keys, released = self._crawl_on_fake_host({"headless": True}, body)
+        self.assertEqual(released, [])
+        options = json.loads(headless_keys[0][1])
+        self.assertIn("user_agent", options)
+        self.assertNotEqual(headed_keys[0][1], headless_keys[0][1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,261 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import artlist_scraper as app  # noqa: E402
+import clip_walk  # noqa: E402
+
+
+class _DirectWorkerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.worker = app.DirectScrapeWorker({}, None)
+        self.addCleanup(self.worker._http.close)
+        self.worker.log = lambda *args: None
+
+
+class WalkPrefilterTests(_DirectWorkerTestCase):
+    def test_hint_matches_every_body_the_direct_walk_finds_clips_in(self):
+        payloads = [
+            {"data": {"clips": [{"id": 123456, "title": "Numeric"}]}},
+            {"items": [{"clipId": "654321"}]},
+            {"hits": [{"assetId": 98765, "name": "Asset"}]},
+            {"asset_id" : "4321"},
+            {"config": {"id": "abc", "version": 12345}},
+            {"flags": [{"id": 12, "enabled": True}]},
+        ]
+        for payload in payloads:
+            for body in (json.dumps(payload), json.dumps(payload, indent=2)):
+                with self.subTest(body=body):
+                    hinted = app._WALK_CLIP_ID_HINT_RE.search(body.encode()) is not None
+                    self.assertEqual(bool(self.worker._walk_for_clips(payload)), hinted)
+
+
+class DirectWalkTests(_DirectWorkerTestCase):
+    def test_walk_returns_clips_in_document_order_without_descending_into_clips(self):
+        payload = {"data": {
+            "featured": {"clipId": "1111", "title": "First",
+                         "related": [{"id": 9999, "title": "Inside a clip"}]},
+            "edges": [{"node": {"id": 2222, "name": "Second"}},
+                      {"node": {"assetId": "3333", "name": "Third"}}],
+            "meta": {"id": "12", "count": 3},
+        }}
+
+        clips = self.worker._walk_for_clips(payload)
+
+        self.assertEqual([(c["clip_id"], c["title"]) for c in clips],
+                         [("1111", "First"), ("2222", "Second"), ("3333", "Third")])
+
+    def test_only_ids_of_four_or_more_digits_mark_a_clip(self):
+        nodes = [{"id": v} for v in (999, 1000, -1234, True, 1234.0, "0123", "12", 10 ** 20)]
+
+        clips = self.worker._walk_for_clips(nodes)
+
+        self.assertEqual([c["clip_id"] for c in clips], ["1000", "0123", str(10 ** 20)])
+
+    def test_nodes_deeper_than_twelve_levels_are_ignored(self):
+        def nest(levels):
+            node = {"id": 4444}
+            for _ in range(levels):
+                node = [node]
+            return node
+
+        self.assertEqual(len(self.worker._walk_for_clips(nest(12))), 1)
+        self.assertEqual(self.worker._walk_for_clips(nest(13)), [])
+        self.assertEqual(self.worker._walk_for_clips("123456"), [])
+
+    def test_clip_fields_take_the_first_non_empty_source_key(self):
+        clip = self.worker._walk_for_clips({"id": 5555, "clipName": "", "title": "Dunes",
+                                            "frameRate": 29.97, "fps": 0,
+                                            "artist": {"fullName": "Ada"}})[0]
+
+        self.assertEqual((clip["title"], clip["frame_rate"], clip["creator"]),
+                         ("Dunes", "29.97", "Ada"))
+        self.assertEqual(list(clip), list(clip_walk._CLIP_TEMPLATE))
+        self.assertEqual(set(clip_walk._CLIP_TEMPLATE.values()), {""})
+        self.assertEqual(clip_walk._first_str({"a": None, "b": 7}, ("a", "b")), "7")
+        self.assertEqual(clip_walk._first_str({}, ("a",)), "")
+
+    def test_only_the_first_clip_is_logged_for_diagnostics(self):
+        logged = []
+        self.worker.log = lambda msg, level: logged.append(msg)
+
+        for _ in range(3):
+            self.worker._walk_for_clips([{"id": 7777, "title": "Logged"}, {"id": 7778}])
+
+        self.assertTrue(self.worker._logged_sample_clip)
+        self.assertFalse(app.DirectScrapeWorker._logged_sample_clip)
+        self.assertEqual(sum("Clip object keys" in msg for msg in logged), 1)
+
+    def test_clip_without_a_page_url_falls_back_to_its_artlist_page(self):
+        clip = self.worker._walk_for_clips([{"id": 6666, "clipNameForUrl": "desert-dunes"}])[0]
+
+        self.assertEqual(clip["source_url"], "https://artlist.io/stock-footage/clip/desert-dunes/6666")
+
+
+class OffloadedWalkTests(_DirectWorkerTestCase):
+    def test_body_walk_runs_in_a_spawned_worker_process(self):
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        body = json.dumps({"data": {"edges": [
+            {"node": {"id": 1000 + i, "clipName": f"Clip {i}", "fps": 25}} for i in range(200)
+        ]}}).encode()
+
+        with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool:
+            clips = pool.submit(app._walk_graphql_body_for_clips, body).result(timeout=120)
+
+        self.assertEqual(clips, self.worker._walk_for_clips(json.loads(body)))
+        self.assertEqual(clips[-1]["clip_id"], "1199")
+
+    def test_walker_pickles_by_reference_to_a_module_without_gui_imports(self):
+        self.assertEqual(app._walk_graphql_body_for_clips.__module__, "clip_walk")
+        out = subprocess.run(
+            [sys.executable, "-c", "import sys, clip_walk; print(sorted("
+             "m for m in ('PyQt6', 'playwright', 'artlist_scraper') if m in sys.modules))"],
+            cwd=ROOT, capture_output=True, text=True, timeout=60)
+
+        self.assertEqual(out.stdout.strip(), "[]", out.stderr)
+
+    def test_graphql_walk_skips_errors_and_extensions(self):
+        walk = app._walk_graphql_body_for_clips
+
+        self.assertEqual(walk(b'{"errors": [{"message": "rate limited", "id": 4040}], "data": null}'), [])
+        clips = walk(json.dumps({
+            "data": {"clips": [{"id": 1234, "title": "Kept"}]},
+            "extensions": {"cost": {"id": 9999}},
+        }).encode())
+        self.assertEqual([c["clip_id"] for c in clips], ["1234"])
+        # Non-GraphQL payloads are still walked whole
+        self.assertEqual(len(walk(b'[{"id": 5678}]')), 1)
+
+    def test_batched_graphql_body_walks_one_clip_list_per_operation(self):
+        pages = app._walk_graphql_pages_for_clips(json.dumps([
+            {"data": {"clips": [{"id": 1234}, {"id": 1235}]}},
+            {"errors": [{"message": "bad page", "id": 4040}], "data": None},
+            {"data": {"clips": [{"id": 5678}]}},
+        ]).encode())
+
+        self.assertEqual([[c["clip_id"] for c in page] for page in pages], [["1234", "1235"], [], ["5678"]])
+        self.assertEqual(len(app._walk_graphql_pages_for_clips(b'{"data": {"clips": [{"id": 1234}]}}')), 1)
+
+
+class JsonLoadsTests(unittest.TestCase):
+    def test_bytes_and_text_bodies_decode_with_or_without_orjson(self):
+        body = '{"clips": [{"id": 1000, "title": "Caf\u00e9"}]}'
+        for accel in (clip_walk._orjson, None):
+            with patch.object(clip_walk, "_orjson", accel):
+                self.assertEqual(clip_walk._json_loads(body.encode()), json.loads(body))
+                self.assertEqual(clip_walk._json_loads(body), json.loads(body))
+
+    def test_stdlib_only_json_still_decodes(self):
+        data = clip_walk._json_loads(b'{"big": 123456789012345678901234567890, "score": NaN}')
+
+        self.assertEqual(data["big"], 123456789012345678901234567890)
+        self.assertNotEqual(data["score"], data["score"])
+        with self.assertRaises(ValueError):
+            clip_walk._json_loads(b"<html>not json</html>")
+
+    def test_request_payloads_encode_to_compact_utf8_with_or_without_orjson(self):
+        payload = {"query": "query Clips { clips { id } }",
+                   "variables": {"page": 2, "term": "caf\u00e9"}, "operationName": None}
+        for accel in (app._orjson, None):
+            with patch.object(app, "_orjson", accel):
+                body = app._json_dumps(payload)
+                self.assertIsInstance(body, bytes)
+                self.assertNotIn(b", ", body)
+                self.assertEqual(json.loads(body), payload)
+        self.assertEqual(json.loads(app._json_dumps({1: "non-str key"})), {"1": "non-str key"})
+
+
+class ReportLoggingTests(_DirectWorkerTestCase):
+    def test_same_level_report_lines_share_one_log_signal(self):
+        emitted = []
+        self.worker.log = lambda msg, level: emitted.append((msg, level))
+
+        self.worker._log_lines([("a", "INFO"), ("b", "INFO"), ("q", "DEBUG"), ("c", "INFO"), ("d", "INFO")])
+        self.worker._log_lines([])
+
+        self.assertEqual(emitted, [("a\nb", "INFO"), ("q", "DEBUG"), ("c\nd", "INFO")])
+
+
+class SitemapScanTests(unittest.TestCase):
+    def test_clip_locs_are_read_from_raw_sitemap_bytes(self):
+        body = ("<urlset><url><loc>https://artlist.io/stock-footage/clip/caf\u00e9-ocean-waves/123456</loc></url>"
+                "<url><loc>https://artlist.io/stock-footage/clip/no-id/abc</loc></url>"
+                "<url><loc>https://artlist.io/music/song/7654321</loc></url>"
+                "<sitemap><loc>https://artlist.io/sitemaps/footage-1.xml</loc></sitemap></urlset>").encode()
+
+        self.assertEqual(app._sitemap_clips(body), [{
+            "clip_id": "123456",
+            "source_url": "https://artlist.io/stock-footage/clip/caf\u00e9-ocean-waves/123456",
+            "title": "Caf\u00e9 Ocean Waves",
+            "source_site": "Artlist",
+        }])
+        self.assertEqual(app._SITEMAP_INDEX_LOC_RE.findall(body),
+                         [b"https://artlist.io/sitemaps/footage-1.xml"])
+
+
+class _ScriptedHttp:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def request(self, method, url, headers=None, data=None, timeout=15, max_size=None):
+        self.calls += 1
+        return self.responses.pop(0)
+
+    def close(self):
+        pass
+
+
+class HttpGetRetryTests(_DirectWorkerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.waits = []
+        self.worker._stop.wait = lambda seconds: self.waits.append(seconds) or False
+
+    def _worker(self, *responses):
+        self.worker._http = _ScriptedHttp(*responses)
+        self.waits.clear()
+        return self.worker
+
+    def test_transient_statuses_are_retried_honouring_retry_after(self):
+        worker = self._worker((503, {}, b""), (429, {"Retry-After": "7"}, b""), (200, {}, b'{"ok": 1}'))
+
+        self.assertEqual(worker._http_get_json("https://artlist.io/api/x"), {"ok": 1})
+        self.assertEqual(worker._http.calls, 3)
+        self.assertEqual(len(self.waits), 2)
+        self.assertLessEqual(self.waits[0], 0.75)
+        self.assertEqual(self.waits[1], 7.0)
+
+    def test_missing_pages_are_not_retried_and_retries_are_bounded(self):
+        worker = self._worker((404, {}, b"gone"))
+        self.assertEqual(worker._http_get("https://artlist.io/x"), (404, b""))
+        self.assertEqual((worker._http.calls, self.waits), (1, []))
+
+        worker = self._worker(*[(502, {}, b"")] * 10)
+        self.assertEqual(worker._http_get("https://artlist.io/x"), (502, b""))
+        self.assertEqual(worker._http.calls, app.DirectScrapeWorker._HTTP_RETRIES + 1)
+
+    def test_probe_budget_limits_retries_and_waits(self):
+        worker = self._worker(*[(429, {"Retry-After": "60"}, b"")] * 10)
+
+        self.assertIsNone(worker._http_get_json(
+            "https://artlist.io/x", retries=worker._PROBE_RETRIES,
+            max_retry_delay=worker._PROBE_RETRY_MAX_DELAY))
+        self.assertEqual(worker._http.calls, worker._PROBE_RETRIES + 1)
+        self.assertEqual(self.waits, [worker._PROBE_RETRY_MAX_DELAY] * worker._PROBE_RETRIES)
+
+
+if __name__ == "__main__":
+    unittest.main()
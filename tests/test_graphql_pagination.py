@@ -0,0 +1,237 @@
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import DEFAULT, patch
+
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import artlist_scraper as app  # noqa: E402
+
+
+class _GraphqlServer:
+    """Keep-alive client stand-in answering two clip pages per query."""
+
+    def __init__(self, batching=True, rate_limited=0, pages=2, ignored=()):
+        self.batching = batching
+        self.rate_limited = rate_limited
+        self.pages = pages
+        self.ignored = ignored  # variables the "API" does not act on
+        self.payloads = []
+        self.post_times = []
+        self.clock = None
+        self.thumb_gets = []
+        self.on_get = None
+        self._ids = {}
+        self._lock = threading.Lock()
+
+    def _page(self, op):
+        v = op["variables"]
+        if v["page"] > self.pages:
+            return {"data": {"clips": []}}
+        key = json.dumps({k: x for k, x in v.items() if k not in self.ignored}, sort_keys=True)
+        with self._lock:
+            cid = self._ids.setdefault(key, 100000 + len(self._ids))
+        return {"data": {"clips": [{"id": cid, "title": f"Clip {cid}"}]}}
+
+    def request(self, method, url, headers=None, data=None, timeout=15, max_size=None):
+        if method == "GET":
+            self.thumb_gets.append(url)
+            if self.on_get:
+                self.on_get(url)
+            return 200, {}, b"\xff\xd8" + b"\0" * 600
+        payload = json.loads(data)
+        self.payloads.append(payload)
+        self.post_times.append(self.clock[0] if self.clock else None)
+        if self.rate_limited:
+            self.rate_limited -= 1
+            return 429, {}, b""
+        if isinstance(payload, list):
+            if not self.batching:
+                return 400, {}, b'{"errors": [{"message": "batching disabled"}]}'
+            return 200, {}, json.dumps([self._page(op) for op in payload]).encode()
+        return 200, {}, json.dumps(self._page(payload)).encode()
+
+    def close(self):
+        pass
+
+
+class GraphqlBatchPaginationTests(unittest.TestCase):
+    def _paginate(self, server, sleep=DEFAULT, seed=None, variables=None):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        db = app.DB(os.path.join(tmp.name, "clips.db"))
+        self.addCleanup(db.close)
+        if seed:
+            seed(db, tmp.name)
+        worker = app.DirectScrapeWorker({"concurrent_workers": 1}, db)
+        worker._http = server
+        worker.SEARCH_TERMS = ["ocean"]
+        worker.log = lambda msg, level="INFO": None
+        tpl = {"url": "https://search-api.artlist.io/v1/graphql",
+               "query": "query Clips { clips { id } }", "variables": variables or {"page": 1}}
+        with patch("time.sleep", sleep):
+            worker._graphql_paginate([tpl], tmp.name)
+        return db.clip_count()
+
+    def test_pages_share_one_post_when_batches_are_supported(self):
+        server = _GraphqlServer()
+
+        total = self._paginate(server)
+
+        self.assertTrue(server.payloads)
+        self.assertTrue(all(isinstance(p, list) and len(p) == 5 for p in server.payloads))
+        self.assertEqual(total, 2 * len(server.payloads))
+
+    def test_rejected_batch_falls_back_to_one_page_per_post(self):
+        server = _GraphqlServer(batching=False)
+        expected = self._paginate(_GraphqlServer())
+
+        total = self._paginate(server)
+
+        self.assertEqual(sum(isinstance(p, list) for p in server.payloads), 1)
+        self.assertEqual(total, expected)
+
+    def test_jobs_with_identical_effective_variables_paginate_once(self):
+        server = _GraphqlServer()
+
+        self._paginate(server, variables={"page": 1, "sortType": 2})
+
+        first_pages = [json.dumps(op["variables"], sort_keys=True)
+                       for batch in server.payloads for op in batch if op["variables"]["page"] == 1]
+        self.assertEqual(len(first_pages), len(set(first_pages)))
+        self.assertIn('{"page": 1, "sortType": 2}', first_pages)
+
+    def test_job_whose_first_page_repeats_an_earlier_job_stops_after_it(self):
+        # The API ignores sortType, so every sort variant returns the same pages
+        server = _GraphqlServer(pages=8, ignored=("sortType",))
+
+        self._paginate(server)
+
+        def query(op):
+            return json.dumps({k: v for k, v in op["variables"].items() if k not in ("page", "sortType")},
+                              sort_keys=True)
+
+        first = [query(batch[0]) for batch in server.payloads if batch[0]["variables"]["page"] == 1]
+        later = [query(batch[0]) for batch in server.payloads if batch[0]["variables"]["page"] == 6]
+        self.assertGreater(len(first), len(set(first)))
+        self.assertEqual(sorted(later), sorted(set(first)))
+
+    def test_large_bodies_are_walked_in_a_worker_process(self):
+        expected = self._paginate(_GraphqlServer())
+
+        with patch.object(app, "_WALK_OFFLOAD_MIN", 0), \
+                patch.object(app, "_walk_json_for_clips", side_effect=AssertionError("walked in-thread")):
+            total = self._paginate(_GraphqlServer())
+
+        self.assertEqual(total, expected)
+
+    def test_rate_limits_back_off_exponentially_and_lose_no_pages(self):
+        expected = self._paginate(_GraphqlServer())
+        server = _GraphqlServer(rate_limited=2)
+        clock = [1000.0]
+        server.clock = clock
+
+        def sleep(seconds):
+            clock[0] += seconds
+
+        # Take the top of every jitter range so the backoff is deterministic
+        with patch.object(app.random, "uniform", lambda lo, hi: hi), \
+                patch("time.time", lambda: clock[0]), patch("time.monotonic", lambda: clock[0]):
+            total = self._paginate(server, sleep=sleep)
+
+        t = server.post_times
+        self.assertEqual([round(t[1] - t[0], 6), round(t[2] - t[1], 6)], [2, 4])
+        # The rate-limited batch is retried page by page instead of ending the job
+        self.assertEqual(total, expected)
+
+    def test_failed_batch_is_retried_instead_of_read_as_empty_pages(self):
+        expected = self._paginate(_GraphqlServer())
+        server = _GraphqlServer()
+        request = server.request
+        failures = [1]
+
+        def flaky(method, url, *args, **kwargs):
+            if method == "POST" and failures[0]:
+                failures[0] -= 1
+                raise ConnectionResetError("connection reset")
+            return request(method, url, *args, **kwargs)
+
+        server.request = flaky
+
+        self.assertEqual(self._paginate(server), expected)
+
+    def test_thumbnail_pass_trusts_the_db_after_one_directory_listing(self):
+        server = _GraphqlServer()
+        seen = {}
+
+        def seed(db, thumb_dir):
+            seen.update(db=db, dir=thumb_dir)
+            for cid in ("1001", "1002", "1003"):
+                db.save_clip({"clip_id": cid, "thumbnail_url": f"https://cdn.artlist.io/{cid}.jpg"})
+            # 1001: left on disk by an interrupted run; 1002: recorded but deleted
+            Path(thumb_dir, "1001.jpg").write_bytes(b"\xff\xd8" + b"\0" * 600)
+            db.update_thumb_path("1002", os.path.join(thumb_dir, "1002.jpg"))
+
+        with patch("os.path.isfile", side_effect=AssertionError("no per-clip stat")):
+            self._paginate(server, seed=seed)
+
+        self.assertEqual(sorted(u for u in server.thumb_gets if "/100" in u),
+                         ["https://cdn.artlist.io/1002.jpg", "https://cdn.artlist.io/1003.jpg"])
+        paths = {r["clip_id"]: r["thumb_path"] for r in seen["db"].get_clips_by_ids(["1001", "1002", "1003"])}
+        self.assertEqual(paths, {cid: os.path.join(seen["dir"], f"{cid}.jpg")
+                                 for cid in ("1001", "1002", "1003")})
+
+    def test_no_transaction_stays_open_while_thumbnails_download(self):
+        server = _GraphqlServer()
+        seen = {}
+
+        def seed(db, thumb_dir):
+            seen["db"] = db
+            db.save_clips([{"clip_id": str(cid), "thumbnail_url": f"https://cdn.artlist.io/{cid}.jpg"}
+                           for cid in range(1001, 1006)])
+            Path(thumb_dir, "1001.jpg").write_bytes(b"\xff\xd8" + b"\0" * 600)
+
+        open_during_get = []
+        real_sleep = time.sleep  # _paginate patches time.sleep
+
+        def on_get(url):
+            real_sleep(0.05)  # let the scheduling thread block in wait()
+            open_during_get.append(seen["db"].conn.in_transaction)
+
+        server.on_get = on_get
+        with patch.object(app.DirectScrapeWorker, "_THUMB_CONCURRENCY", 1):
+            self._paginate(server, seed=seed)
+
+        self.assertEqual(open_during_get, [False] * 4)
+        paths = [r["thumb_path"] for r in seen["db"].get_clips_by_ids([str(c) for c in range(1001, 1006)])]
+        self.assertTrue(all(paths))
+
+    def test_thumbnail_jobs_stream_across_chunks_exactly_once(self):
+        server = _GraphqlServer()
+        seen = {}
+
+        def seed(db, thumb_dir):
+            seen["db"] = db
+            db.save_clips([{"clip_id": str(5000 + i), "thumbnail_url": f"https://cdn.artlist.io/t/{i}.jpg"}
+                           for i in range(1200)])
+
+        self._paginate(server, seed=seed)
+
+        fetched = [u for u in server.thumb_gets if "/t/" in u]
+        self.assertEqual(len(fetched), 1200)
+        self.assertEqual(len(set(fetched)), 1200)
+        self.assertEqual(seen["db"].conn.execute(
+            "SELECT COUNT(*) FROM clips WHERE thumbnail_url != '' AND thumb_path = ''").fetchone()[0], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
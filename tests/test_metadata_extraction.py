@@ -0,0 +1,270 @@
+import asyncio
+import contextlib
+import os
+import sys
+import unittest
+from pathlib import Path
+
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import artlist_scraper as app  # noqa: E402
+
+
+class _SnapshotPage:
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+        self.evaluate_calls = []
+
+    async def evaluate(self, script, arg=None):
+        self.evaluate_calls.append(arg)
+        return self.snapshot
+
+    async def query_selector(self, _selector):
+        raise AssertionError("metadata extraction should not query the DOM per field")
+
+    async def title(self):
+        raise AssertionError("page title comes from the snapshot")
+
+
+class MetadataSnapshotTests(unittest.TestCase):
+    def _worker(self, profile_name):
+        return app.CrawlerWorker({}, db=None, profile=app.SiteProfile.get(profile_name))
+
+    def test_extract_metadata_reads_og_jsonld_and_body_in_one_evaluate(self):
+        worker = self._worker("Artlist")
+        page = _SnapshotPage({
+            "og": {"og:image": "https://cdn.example/thumb.jpg", "og:title": "Ocean Waves"},
+            "jsonld": {"@type": "VideoObject", "duration": "PT12S", "keywords": ["sea", "waves"]},
+            "h1": "Ocean Waves",
+            "title": "Ocean Waves | Artlist",
+            "body_text": "Resolution\n3840 x 2160\nFrame Rate\n25\nClip by\nJane Doe",
+        })
+
+        meta = asyncio.run(worker._extract_metadata(
+            page, "https://artlist.io/stock-footage/clip/ocean-waves/123456"))
+
+        self.assertEqual(len(page.evaluate_calls), 1)
+        self.assertEqual(page.evaluate_calls[0], {"og": True, "jsonld": True, "body": True})
+        self.assertEqual(meta["title"], "Ocean Waves")
+        self.assertEqual(meta["thumbnail_url"], "https://cdn.example/thumb.jpg")
+        self.assertEqual(meta["duration"], "PT12S")
+        self.assertEqual(meta["tags"], "sea, waves")
+        self.assertEqual(meta["resolution"], "3840x2160")
+        self.assertEqual(meta["frame_rate"], "25")
+        self.assertEqual(meta["creator"], "Jane Doe")
+
+    def test_title_falls_back_to_snapshot_h1_then_document_title(self):
+        worker = self._worker("Pexels")
+        page = _SnapshotPage({"og": {}, "jsonld": None, "h1": "Free stock videos", "title": "Sunset | Pexels"})
+
+        meta = asyncio.run(worker._extract_metadata(page, "https://www.pexels.com/search/videos/sunset/"))
+
+        self.assertEqual(meta["title"], "Sunset")
+        self.assertFalse(page.evaluate_calls[0]["body"])
+
+
+class _BatchDB:
+    def __init__(self):
+        self.batches = 0
+
+    @contextlib.contextmanager
+    def batch(self):
+        self.batches += 1
+        yield self
+
+
+class _ScanPage:
+    def __init__(self, scan):
+        self.scan = scan
+        self.evaluate_args = []
+
+    async def evaluate(self, script, arg=None):
+        self.evaluate_args.append(arg)
+        return self.scan
+
+    async def content(self):
+        raise AssertionError("page source is scanned in the page, not copied over CDP")
+
+
+class PageSourceScanTests(unittest.TestCase):
+    def test_scan_and_interceptor_urls_come_from_one_evaluate(self):
+        worker = app.CrawlerWorker({}, db=_BatchDB(), profile=app.SiteProfile.get("Pexels"))
+        recorded = []
+
+        async def record(url, source_url, clip_meta):
+            recorded.append(url)
+
+        worker._record_video_url = record
+        page = _ScanPage({
+            "html": ["https://videos.pexels.com/video-files/1234/1234-sd_640_360_25fps.mp4",
+                     "https://videos.pexels.com/video-files/9999/9999-hd_1920_1080_25fps.mp4"],
+            "dom": [],
+            "canva": ["https%3A%2F%2Fvideos.pexels.com%2Fvideo-files%2F1234%2F1234-uhd_3840_2160_25fps.mp4"],
+            "intercepted": ["https://videos.pexels.com/video-files/1234/1234-hd_1920_1080_25fps.mp4",
+                            "https://videos.pexels.com/video-files/9999/9999-sd_640_360_25fps.mp4"],
+        })
+        source_url = "https://www.pexels.com/video/sample-1234/"
+
+        async def scan_page():
+            scan = await worker._page_scan_snapshot(page)
+            await worker._scan_page_source(scan, source_url, {"clip_id": "1234"})
+            await worker._collect_js_m3u8s(scan, source_url, {"clip_id": "1234"})
+
+        asyncio.run(scan_page())
+
+        self.assertEqual(page.evaluate_args, [{"exts": "|".join(worker.profile.video_types)}])
+        self.assertEqual(recorded, [
+            "https://videos.pexels.com/video-files/1234/1234-uhd_3840_2160_25fps.mp4",
+            "https://videos.pexels.com/video-files/1234/1234-hd_1920_1080_25fps.mp4"])
+
+    def test_catalog_scan_records_best_quality_per_video_id(self):
+        worker = app.CrawlerWorker({}, db=_BatchDB(), profile=app.SiteProfile.get("Pexels"))
+        recorded = []
+
+        async def record(url, source_url, clip_meta):
+            recorded.append(url)
+
+        worker._record_video_url = record
+        scan = {"html": [
+            "https://videos.pexels.com/video-files/1111/1111-sd_640_360_25fps.mp4",
+            "https://videos.pexels.com/video-files/1111/1111-hd_1920_1080_25fps.mp4",
+            "https://videos.pexels.com/video-files/2222/2222-uhd.mp4",
+            "https://videos.pexels.com/video-files/2222/2222-hd_1280_720_30fps.mp4",
+        ]}
+
+        asyncio.run(worker._scan_page_source(scan, "https://www.pexels.com/videos/", {}))
+
+        self.assertEqual(sorted(recorded), [
+            "https://videos.pexels.com/video-files/1111/1111-hd_1920_1080_25fps.mp4",
+            "https://videos.pexels.com/video-files/2222/2222-uhd.mp4",
+        ])
+        self.assertEqual(worker.db.batches, 1)
+
+
+class _ManifestResponse:
+    status = 200
+    headers = {"content-type": "application/vnd.apple.mpegurl"}
+
+    def __init__(self, url):
+        self.url = url
+
+    async def text(self):
+        return "#EXTM3U\n#EXT-X-STREAM-INF:RESOLUTION=1920x1080\nhd.m3u8\n"
+
+
+class InterceptedManifestScanTests(unittest.TestCase):
+    def test_scan_is_skipped_once_hls_manifest_was_intercepted(self):
+        worker = app.CrawlerWorker({}, db=_BatchDB(), profile=app.SiteProfile.get("Artlist"))
+        worker._observe_crawl_budget_response = lambda *args: None
+        recorded = []
+
+        async def record(url, source_url, clip_meta):
+            recorded.append(url)
+
+        worker._record_video_url = record
+        source_url = "https://artlist.io/stock-footage/clip/waves/123456"
+        scan = {"html": ["https://cdn.artlist.io/related/master.m3u8"]}
+
+        async def crawl():
+            meta = {"clip_id": "123456"}
+            await worker._on_response(
+                _ManifestResponse("https://cdn.artlist.io/abc/master.m3u8"), source_url, meta)
+            await worker._scan_page_source(scan, source_url, meta)
+            # Only the page that intercepted the manifest is skipped
+            await worker._scan_page_source(scan, source_url, {"clip_id": "123456"})
+            return meta
+
+        meta = asyncio.run(crawl())
+
+        self.assertEqual(recorded, ["https://cdn.artlist.io/abc/master.m3u8",
+                                    "https://cdn.artlist.io/related/master.m3u8"])
+        self.assertEqual(meta["resolution"], "1920x1080")
+        self.assertEqual(worker._hls_intercepted, set())
+
+    def test_mark_from_a_failed_navigation_does_not_outlive_it(self):
+        db = _BatchDB()
+        db.mark_failed = lambda url, depth: None
+        worker = app.CrawlerWorker({}, db=db, profile=app.SiteProfile.get("Artlist"))
+        worker.log = lambda *args: None
+        worker._observe_crawl_budget_response = lambda *args: None
+        released = []
+
+        class _Page:
+            def on(self, *_args):
+                pass
+
+            def remove_listener(self, *_args):
+                pass
+
+        async def acquire(_context):
+            return _Page(), 0
+
+        async def release(page, uses):
+            released.append(page)
+
+        async def no_trace(*_args, **_kwargs):
+            return None
+
+        async def failed_goto(_page, url):
+            # The manifest arrives, then the navigation fails before any scan
+            await worker._on_response(
+                _ManifestResponse("https://cdn.artlist.io/abc/master.m3u8"), url, {"clip_id": "123456"})
+            return False
+
+        worker._acquire_clip_page = acquire
+        worker._release_clip_page = release
+        worker._start_trace_bundle = no_trace
+        worker._finish_trace_bundle = no_trace
+        worker._safe_goto = failed_goto
+        worker._record_video_url = lambda *args: asyncio.sleep(0)
+
+        asyncio.run(worker._crawl_clip(None, "https://artlist.io/stock-footage/clip/waves/123456", 0))
+
+        self.assertEqual(len(released), 1)
+        self.assertEqual(worker._hls_intercepted, set())
+
+
+class _SavingDB(_BatchDB):
+    def __init__(self):
+        super().__init__()
+        self.saved = []
+
+    def save_clip(self, meta):
+        self.saved.append(dict(meta))
+        return True
+
+
+class RecordVideoUrlTests(unittest.TestCase):
+    def test_video_files_url_fills_clip_id_resolution_and_fps(self):
+        db = _SavingDB()
+        worker = app.CrawlerWorker({}, db=db, profile=app.SiteProfile.get("Pexels"))
+
+        for url in ("https://videos.pexels.com/video-files/1234/1234-uhd_3840_2160_25fps.mp4",
+                    "https://videos.pexels.com/video-files/5678/5678-sd.mp4?fps=1920_1080_30fps"):
+            asyncio.run(worker._record_video_url(url, "https://www.pexels.com/video/x/", {}))
+
+        self.assertEqual([(m["clip_id"], m["resolution"], m["frame_rate"]) for m in db.saved],
+                         [("1234", "3840x2160", "25"), ("5678", "1920x1080", "30")])
+
+    def test_parse_video_url_is_cached_and_ranks_quality(self):
+        app._parse_video_url.cache_clear()
+        cases = {
+            "https://videos.pexels.com/video-files/1234/1234-uhd_3840_2160_25fps.mp4":
+                ("1234", ("3840", "2160", "25"), 3840),
+            "https://videos.pexels.com/video-files/1234/1234-hd_25fps.mp4": ("1234", None, 1500),
+            "https://cdn.example/clip-uhd/master.m3u8": ("", None, 3000),
+            "https://cdn.example/720_1280_30fps.mp4": ("", ("720", "1280", "30"), 1280),
+        }
+        for url, expected in cases.items():
+            self.assertEqual(app._parse_video_url(url), expected)
+            self.assertEqual(app._parse_video_url(url), expected)
+
+        self.assertEqual(app._parse_video_url.cache_info().hits, len(cases))
+
+
+if __name__ == "__main__":
+    unittest.main()
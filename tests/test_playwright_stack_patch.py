@@ -0,0 +1,77 @@
+import importlib.util
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import artlist_scraper as app  # noqa: E402
+
+
+# Stands in for a Playwright API module: "user code -> Page.goto -> stack capture"
+_FAKE_PAGE_SOURCE = (
+    "class Page:\n"
+    "    def goto(self):\n"
+    "        return self.send()\n"
+    "\n"
+    "    def send(self):\n"
+    "        return capture()\n"
+)
+
+
+class PlaywrightStackPatchTests(unittest.TestCase):
+    def setUp(self):
+        try:
+            from playwright._impl import _connection as pw_conn
+        except ImportError:
+            self.skipTest("playwright is not installed")
+        self.pw_conn = pw_conn
+        saved = (pw_conn._capture_stack_trace, pw_conn.traceback, app._PW_STACK_PATCHED)
+        self.original_capture = saved[0]
+
+        def restore():
+            pw_conn._capture_stack_trace, pw_conn.traceback, app._PW_STACK_PATCHED = saved
+        self.addCleanup(restore)
+
+        # The fake module lives in its own "Playwright package" directory
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = Path(tmp.name, "_fake_page.py")
+        path.write_text(_FAKE_PAGE_SOURCE)
+        for patcher in (patch.object(pw_conn, "_PLAYWRIGHT_MODULE_PATH", tmp.name),
+                        patch.dict(sys.modules)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        spec = importlib.util.spec_from_file_location("_fake_playwright_page", path)
+        self.fake_page = sys.modules[spec.name] = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(self.fake_page)
+        self.fake_page.capture = lambda: self.pw_conn._capture_stack_trace()
+
+    def test_patch_keeps_api_name_but_drops_frames(self):
+        expected = self.fake_page.Page().goto()["apiName"]
+
+        with patch.dict(os.environ, {"PW_INSPECT_STACK": "0"}):
+            self.assertTrue(app._install_playwright_stack_patch())
+            self.assertTrue(app._install_playwright_stack_patch())
+        patched = self.fake_page.Page().goto()
+
+        self.assertEqual(expected, "Page.goto")
+        self.assertEqual(patched, {"frames": [], "apiName": expected, "title": None})
+        self.assertEqual(len(self.pw_conn.traceback.extract_stack(limit=10)), 0)
+
+    def test_env_opt_out_leaves_playwright_untouched(self):
+        app._PW_STACK_PATCHED = False
+        with patch.dict(os.environ, {"PW_INSPECT_STACK": "1"}):
+            self.assertFalse(app._install_playwright_stack_patch())
+        self.assertIs(self.pw_conn._capture_stack_trace, self.original_capture)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,6 @@
+import re
 import unittest
+from unittest import mock
 
 import artlist_scraper as app
 import profiles
@@ -48,6 +50,85 @@ class ProfileModuleContractTests(unittest.TestCase):
                     (name, item["url"]),
                 )
 
+    def test_metadata_selectors_compile_once_and_match_text_node_lines(self):
+        profile = app.SiteProfile.get("Artlist")
+        compiled = profile.get_metadata_regexes()
+        self.assertIs(profile.get_metadata_regexes(), compiled)
+
+        # BODY_TEXT_SCRIPT emits one trimmed text node per line.
+        body_text = "\n".join([
+            "Clip ID", "123456", "Resolution", "3840 x 2160",
+            "Frame Rate", "25", "Clip by", "Jane Doe", "Part of", "Coastlines",
+        ])
+        found = {field: pat.search(body_text) for field, pat in compiled}
+        self.assertEqual(found["clip_id"].group(1), "123456")
+        self.assertEqual(found["frame_rate"].group(1), "25")
+        self.assertEqual(found["creator"].group(1).strip(), "Jane Doe")
+        self.assertEqual(found["collection"].group(1).strip(), "Coastlines")
+
+    def test_invalid_metadata_selector_is_skipped(self):
+        profile = app.SiteProfile("Custom", metadata_selectors={"title": "(", "camera": r"Camera (\w+)"})
+
+        self.assertEqual([field for field, _pat in profile.get_metadata_regexes()], ["camera"])
+
+    def test_domain_and_exclude_checks_are_memoized_per_profile(self):
+        profile = app.SiteProfile("Custom", domains=["example.com"], exclude_patterns=["/private"])
+        other = app.SiteProfile("Other", domains=["other.test"])
+
+        for _ in range(3):
+            self.assertTrue(profile.is_allowed_domain("www.example.com"))
+            self.assertTrue(profile.is_excluded("https://www.example.com/private/1"))
+        self.assertFalse(other.is_allowed_domain("www.example.com"))
+
+        self.assertEqual(profile._allowed_domain_cached.cache_info().hits, 2)
+        self.assertEqual(profile._excluded_cached.cache_info().hits, 2)
+        self.assertNotIn("_allowed_domain_cached", profile.to_dict())
+
+    def test_link_classifiers_are_memoized_per_profile(self):
+        profile = app.SiteProfile(
+            "Custom", domains=["example.com"], catalog_patterns=["/videos"],
+            item_patterns=["/video/"])
+        clip = "https://www.example.com/video/sunset-1234/?utm_source=x#top"
+
+        for _ in range(3):
+            self.assertEqual(profile.normalize_url(clip), "https://www.example.com/video/sunset-1234/")
+            self.assertTrue(profile.is_item("https://www.example.com/video/1234"))
+            self.assertTrue(profile.is_catalog("https://www.example.com/videos/nature"))
+        self.assertIsNone(profile.normalize_url("https://elsewhere.test/video/1234"))
+
+        self.assertEqual(profile._normalized_cached.cache_info().hits, 2)
+        self.assertEqual(profile._item_cached.cache_info().hits, 2)
+        self.assertEqual(profile._catalog_cached.cache_info().hits, 2)
+        self.assertNotIn("_normalized_cached", profile.to_dict())
+
+    def test_find_video_urls_matches_case_insensitive_findall(self):
+        profile = app.SiteProfile.get("Generic")
+        page = (
+            '<video src="HTTPS://cdn.example.com/a/Clip.MP4?Sig=AbC"></video>'
+            '<img src="https://cdn.example.com/poster.jpg">'
+            "<a href='https://cdn.example.com/b/master.m3u8'>x</a>"
+            "https://cdn.example.com/c.mp4/d.webm plain"
+        )
+        non_ascii = "\u0130stanbul " + page  # lower() grows this string
+
+        for text in (page, non_ascii, ""):
+            self.assertEqual(profile.find_video_urls(text),
+                             profile.get_combined_video_re().findall(text))
+        self.assertEqual(profile.find_video_urls(page)[0],
+                         "HTTPS://cdn.example.com/a/Clip.MP4?Sig=AbC")
+
+    def test_find_video_urls_prefers_re2_when_installed(self):
+        profile = app.SiteProfile.get("Generic")
+        page = '<video src="HTTPS://cdn.example.com/a/Clip.MP4"></video>'
+        app._re2_video_re.cache_clear()
+        self.addCleanup(app._re2_video_re.cache_clear)
+
+        # The stdlib engine shares RE2's API for these calls
+        with mock.patch.object(app, "_re2", re):
+            self.assertEqual(profile.find_video_urls(page),
+                             ["HTTPS://cdn.example.com/a/Clip.MP4"])
+            self.assertEqual(app._re2_video_re.cache_info().currsize, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
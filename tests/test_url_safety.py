@@ -1,9 +1,13 @@
 import os
 import socket
 import sys
+import tempfile
 import unittest
 import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from threading import Thread
+from urllib.parse import urlparse
 from unittest.mock import patch
 
 
@@ -73,5 +77,122 @@ class UrlSafetyPolicyTests(unittest.TestCase):
         self.assertIn("blocked", reason.lower())
 
 
+class SplitUrlTests(unittest.TestCase):
+    def test_split_matches_urlparse_for_endpoint_keys(self):
+        for url in (
+            "https://artlist.io/api/graphql?operationName=Clips#top",
+            "https://cdn.example:8443/v1/clips",
+            "https://example.com?page=2",
+            "http://user@example.com/a?b?c",
+            "data:application/json,{}",
+        ):
+            with self.subTest(url=url):
+                parsed = urlparse(url)
+                self.assertEqual(app._split_url(url), (parsed.netloc, parsed.path, parsed.query))
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = 0
+
+    def setup(self):
+        super().setup()
+        type(self).connections += 1
+
+    def do_GET(self):
+        if self.path == "/hop":
+            self.send_response(302)
+            self.send_header("Location", "http://blocked.invalid/admin")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = f"ok {self.path}".encode()
+        if self.path.startswith("/thumb/"):
+            body = body.ljust(600, b".")
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+class KeepAliveHttpTests(unittest.TestCase):
+    def setUp(self):
+        _KeepAliveHandler.connections = 0
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+        Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.validated = []
+
+        def validate(url):
+            self.validated.append(url)
+            if "blocked.invalid" in url:
+                raise app.UnsafeUrlError("Blocked unsafe URL: test")
+            return True
+
+        patcher = patch.object(app, "_validate_safe_url", side_effect=validate)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = app._KeepAliveHTTP()
+        self.client._use_urllib = False
+        self.addCleanup(self.client.close)
+
+    def test_requests_to_one_host_share_a_validated_connection(self):
+        bodies = [self.client.request("GET", f"{self.base}/clip/{i}")[2] for i in range(3)]
+
+        self.assertEqual(bodies, [b"ok /clip/0", b"ok /clip/1", b"ok /clip/2"])
+        self.assertEqual(_KeepAliveHandler.connections, 1)
+        self.assertEqual(self.validated, [f"{self.base}/clip/0"])
+
+    def test_connections_of_exited_threads_are_evicted(self):
+        opened = []
+
+        def fetch():
+            self.client.request("GET", f"{self.base}/clip/1")
+            opened.append(next(iter(self.client._local.conns.values())))
+
+        first = Thread(target=fetch)
+        first.start()
+        first.join()
+        second = Thread(target=fetch)
+        second.start()
+        second.join()
+
+        self.assertIsNone(opened[0].sock)  # closed when the second thread registered
+        self.assertIsNotNone(opened[1].sock)
+        self.assertEqual(len(self.client._conns), 1)
+
+    def test_redirect_targets_are_validated(self):
+        with self.assertRaises(app.UnsafeUrlError):
+            self.client.request("GET", f"{self.base}/hop")
+
+        self.assertEqual(self.validated[-1], "http://blocked.invalid/admin")
+
+    def test_crawler_thumbnails_reuse_one_connection(self):
+        class _ThumbDB:
+            def __init__(self):
+                self.paths = {}
+
+            def update_thumb_path(self, clip_id, path):
+                self.paths[clip_id] = path
+
+        db = _ThumbDB()
+        worker = app.CrawlerWorker({}, db=db, profile=app.SiteProfile.get("Pexels"))
+        worker._thumb_http._use_urllib = False
+        self.addCleanup(worker._thumb_http.close)
+        with tempfile.TemporaryDirectory() as tmp:
+            for clip_id in ("1001", "1002", "1003"):
+                worker._download_thumb_url(
+                    f"{self.base}/thumb/{clip_id}.jpg", os.path.join(tmp, f"{clip_id}.jpg"), clip_id)
+
+            self.assertEqual(sorted(db.paths), ["1001", "1002", "1003"])
+            self.assertEqual(os.path.getsize(db.paths["1002"]), 600)
+        self.assertEqual(_KeepAliveHandler.connections, 1)
+
+
 if __name__ == "__main__":
     unittest.main()